@@ -0,0 +1,78 @@
+"""Create enum types
+
+Revision ID: 000
+Revises:
+Create Date: 2026-10-17
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "000"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Every enum type used by revisions 001-008, which reference them with
+# create_type=False
+ENUM_TYPES = {
+    "projectstatus": ["DRAFT", "ANALYZED", "EXPORTED"],
+    "filestatus": [
+        "pending",
+        "validating",
+        "valid",
+        "invalid",
+        "processing",
+        "processed",
+        "error",
+    ],
+    "filetype": ["kmz", "kml"],
+    "analysisstatus": ["pending", "processing", "completed", "failed", "cached"],
+    "zonetype": ["wetland", "easement", "stream_buffer", "setback", "custom"],
+    "zonesource": ["imported", "drawn"],
+    "placementstatus": ["pending", "processing", "completed", "failed"],
+    "optimizationcriteria": [
+        "minimize_cut_fill",
+        "maximize_flat_areas",
+        "minimize_inter_asset_distance",
+        "balanced",
+    ],
+    "roadnetworkstatus": ["pending", "processing", "completed", "failed"],
+    "roadoptimizationcriteria": [
+        "minimal_length",
+        "minimal_earthwork",
+        "balanced",
+        "minimal_grade",
+    ],
+    "volumeestimationstatus": [
+        "pending",
+        "processing",
+        "completed",
+        "failed",
+        "cached",
+    ],
+    "foundationtype": ["pad", "pier", "strip", "raft"],
+}
+
+
+def upgrade() -> None:
+    # One round trip for all types instead of a pg_type lookup plus CREATE
+    # TYPE per enum spread over the table migrations. Each CREATE gets its
+    # own sub-block so an existing type is skipped without aborting the rest.
+    statements = "\n".join(
+        "    BEGIN\n"
+        f"        CREATE TYPE {name} AS ENUM ("
+        + ", ".join(f"'{label}'" for label in labels)
+        + ");\n"
+        "    EXCEPTION WHEN duplicate_object THEN NULL;\n"
+        "    END;"
+        for name, labels in ENUM_TYPES.items()
+    )
+    op.execute(f"DO $$\nBEGIN\n{statements}\nEND\n$$;")
+
+
+def downgrade() -> None:
+    op.execute(f"DROP TYPE IF EXISTS {', '.join(reversed(ENUM_TYPES))}")
@@ -1,7 +1,7 @@
 """Initial schema with PostGIS
 
 Revision ID: 001
-Revises:
+Revises: 000
 Create Date: 2025-12-03
 
 """
@@ -13,7 +13,7 @@ import geoalchemy2
 
 # revision identifiers, used by Alembic.
 revision = "001"
-down_revision = None
+down_revision = "000"
 branch_labels = None
 depends_on = None
 
@@ -54,20 +54,26 @@ def upgrade() -> None:
         sa.Column("description", sa.Text(), nullable=True),
         sa.Column(
             "status",
-            sa.Enum("DRAFT", "ANALYZED", "EXPORTED", name="projectstatus"),
+            postgresql.ENUM(
+                "DRAFT",
+                "ANALYZED",
+                "EXPORTED",
+                name="projectstatus",
+                create_type=False,
+            ),
             nullable=True,
         ),
         sa.Column(
             "boundary_geom",
             geoalchemy2.types.Geometry(
-                geometry_type="POLYGON", srid=4326, spatial_index=True
+                geometry_type="POLYGON", srid=4326, spatial_index=False
             ),
             nullable=True,
         ),
         sa.Column(
             "entry_point_geom",
             geoalchemy2.types.Geometry(
-                geometry_type="POINT", srid=4326, spatial_index=True
+                geometry_type="POINT", srid=4326, spatial_index=False
             ),
             nullable=True,
         ),
@@ -99,4 +105,3 @@ def downgrade() -> None:
     op.drop_index(op.f("ix_users_google_id"), table_name="users")
     op.drop_index(op.f("ix_users_email"), table_name="users")
     op.drop_table("users")
-    op.execute("DROP TYPE projectstatus;")
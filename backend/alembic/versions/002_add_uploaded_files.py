@@ -19,12 +19,6 @@ depends_on = None
 
 
 def upgrade() -> None:
-    # Create enums for file status and type
-    op.execute(
-        "CREATE TYPE filestatus AS ENUM ('pending', 'validating', 'valid', 'invalid', 'processing', 'processed', 'error');"
-    )
-    op.execute("CREATE TYPE filetype AS ENUM ('kmz', 'kml');")
-
     # Create uploaded_files table
     op.create_table(
         "uploaded_files",
@@ -64,7 +58,7 @@ def upgrade() -> None:
         sa.Column(
             "boundary_geom",
             geoalchemy2.types.Geometry(
-                geometry_type="GEOMETRY", srid=4326, spatial_index=True
+                geometry_type="GEOMETRY", srid=4326, spatial_index=False
             ),
             nullable=True,
         ),
@@ -118,5 +112,3 @@ def downgrade() -> None:
     op.drop_index("ix_uploaded_files_project_id", table_name="uploaded_files")
     op.drop_index("ix_uploaded_files_user_id", table_name="uploaded_files")
     op.drop_table("uploaded_files")
-    op.execute("DROP TYPE filestatus;")
-    op.execute("DROP TYPE filetype;")
@@ -21,7 +21,7 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # Create analysis_status enum type
+    # analysis_status enum (type created in revision 000)
     analysis_status = postgresql.ENUM(
         "pending",
         "processing",
@@ -31,7 +31,6 @@ def upgrade() -> None:
         name="analysisstatus",
         create_type=False,
     )
-    analysis_status.create(op.get_bind(), checkfirst=True)
 
     # Create terrain_analyses table
     op.create_table(
@@ -42,14 +41,7 @@ def upgrade() -> None:
         # Status and progress
         sa.Column(
             "status",
-            sa.Enum(
-                "pending",
-                "processing",
-                "completed",
-                "failed",
-                "cached",
-                name="analysisstatus",
-            ),
+            analysis_status,
             nullable=False,
         ),
         sa.Column("progress_percent", sa.Integer(), nullable=False, server_default="0"),
@@ -127,6 +119,3 @@ def downgrade() -> None:
 
     # Drop table
     op.drop_table("terrain_analyses")
-
-    # Drop enum type
-    op.execute("DROP TYPE IF EXISTS analysisstatus")
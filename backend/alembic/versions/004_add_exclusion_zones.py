@@ -21,7 +21,7 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # Create zone_type enum
+    # zone_type enum (type created in revision 000)
     zone_type = postgresql.ENUM(
         "wetland",
         "easement",
@@ -31,16 +31,14 @@ def upgrade() -> None:
         name="zonetype",
         create_type=False,
     )
-    zone_type.create(op.get_bind(), checkfirst=True)
 
-    # Create zone_source enum
+    # zone_source enum (type created in revision 000)
     zone_source = postgresql.ENUM(
         "imported",
         "drawn",
         name="zonesource",
         create_type=False,
     )
-    zone_source.create(op.get_bind(), checkfirst=True)
 
     # Create exclusion_zones table
     op.create_table(
@@ -53,19 +51,10 @@ def upgrade() -> None:
         sa.Column("description", sa.Text(), nullable=True),
         sa.Column(
             "zone_type",
-            sa.Enum(
-                "wetland",
-                "easement",
-                "stream_buffer",
-                "setback",
-                "custom",
-                name="zonetype",
-            ),
+            zone_type,
             nullable=False,
         ),
-        sa.Column(
-            "source", sa.Enum("imported", "drawn", name="zonesource"), nullable=False
-        ),
+        sa.Column("source", zone_source, nullable=False),
         # Geometry
         sa.Column("geometry", Geometry("GEOMETRY", srid=4326), nullable=False),
         sa.Column("geometry_type", sa.String(50), nullable=False),
@@ -127,7 +116,3 @@ def downgrade() -> None:
 
     # Drop table
     op.drop_table("exclusion_zones")
-
-    # Drop enum types
-    op.execute("DROP TYPE IF EXISTS zonesource")
-    op.execute("DROP TYPE IF EXISTS zonetype")
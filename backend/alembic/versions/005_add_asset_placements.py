@@ -21,7 +21,7 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # Create placement_status enum type
+    # placement_status enum (type created in revision 000)
     placement_status = postgresql.ENUM(
         "pending",
         "processing",
@@ -30,9 +30,8 @@ def upgrade() -> None:
         name="placementstatus",
         create_type=False,
     )
-    placement_status.create(op.get_bind(), checkfirst=True)
 
-    # Create optimization_criteria enum type
+    # optimization_criteria enum (type created in revision 000)
     optimization_criteria = postgresql.ENUM(
         "minimize_cut_fill",
         "maximize_flat_areas",
@@ -41,7 +40,6 @@ def upgrade() -> None:
         name="optimizationcriteria",
         create_type=False,
     )
-    optimization_criteria.create(op.get_bind(), checkfirst=True)
 
     # Create asset_placements table
     op.create_table(
@@ -56,9 +54,7 @@ def upgrade() -> None:
         # Status and progress
         sa.Column(
             "status",
-            sa.Enum(
-                "pending", "processing", "completed", "failed", name="placementstatus"
-            ),
+            placement_status,
             nullable=False,
         ),
         sa.Column("progress_percent", sa.Integer(), nullable=False, server_default="0"),
@@ -78,13 +74,7 @@ def upgrade() -> None:
         # Optimization settings
         sa.Column(
             "optimization_criteria",
-            sa.Enum(
-                "minimize_cut_fill",
-                "maximize_flat_areas",
-                "minimize_inter_asset_distance",
-                "balanced",
-                name="optimizationcriteria",
-            ),
+            optimization_criteria,
             nullable=False,
         ),
         sa.Column("advanced_settings", postgresql.JSONB(), nullable=True),
@@ -149,7 +139,3 @@ def downgrade() -> None:
 
     # Drop table
     op.drop_table("asset_placements")
-
-    # Drop enum types
-    op.execute("DROP TYPE IF EXISTS optimizationcriteria")
-    op.execute("DROP TYPE IF EXISTS placementstatus")
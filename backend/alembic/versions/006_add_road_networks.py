@@ -21,7 +21,7 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # Create road_network_status enum type
+    # road_network_status enum (type created in revision 000)
     road_network_status = postgresql.ENUM(
         "pending",
         "processing",
@@ -30,9 +30,8 @@ def upgrade() -> None:
         name="roadnetworkstatus",
         create_type=False,
     )
-    road_network_status.create(op.get_bind(), checkfirst=True)
 
-    # Create road_optimization_criteria enum type
+    # road_optimization_criteria enum (type created in revision 000)
     road_optimization_criteria = postgresql.ENUM(
         "minimal_length",
         "minimal_earthwork",
@@ -41,7 +40,6 @@ def upgrade() -> None:
         name="roadoptimizationcriteria",
         create_type=False,
     )
-    road_optimization_criteria.create(op.get_bind(), checkfirst=True)
 
     # Create road_networks table
     op.create_table(
@@ -57,9 +55,7 @@ def upgrade() -> None:
         # Status and progress
         sa.Column(
             "status",
-            sa.Enum(
-                "pending", "processing", "completed", "failed", name="roadnetworkstatus"
-            ),
+            road_network_status,
             nullable=False,
         ),
         sa.Column("progress_percent", sa.Integer(), nullable=False, server_default="0"),
@@ -76,13 +72,7 @@ def upgrade() -> None:
         # Optimization settings
         sa.Column(
             "optimization_criteria",
-            sa.Enum(
-                "minimal_length",
-                "minimal_earthwork",
-                "balanced",
-                "minimal_grade",
-                name="roadoptimizationcriteria",
-            ),
+            road_optimization_criteria,
             nullable=False,
         ),
         sa.Column("exclusion_buffer", sa.Float(), nullable=False, server_default="5.0"),
@@ -163,7 +153,3 @@ def downgrade() -> None:
 
     # Drop table
     op.drop_table("road_networks")
-
-    # Drop enum types
-    op.execute("DROP TYPE IF EXISTS roadoptimizationcriteria")
-    op.execute("DROP TYPE IF EXISTS roadnetworkstatus")
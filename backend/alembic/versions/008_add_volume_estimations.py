@@ -21,7 +21,7 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # Create volume_estimation_status enum type
+    # volume_estimation_status enum (type created in revision 000)
     volume_status = postgresql.ENUM(
         "pending",
         "processing",
@@ -31,9 +31,8 @@ def upgrade() -> None:
         name="volumeestimationstatus",
         create_type=False,
     )
-    volume_status.create(op.get_bind(), checkfirst=True)
 
-    # Create foundation_type enum type
+    # foundation_type enum (type created in revision 000)
     foundation_type = postgresql.ENUM(
         "pad",
         "pier",
@@ -42,7 +41,6 @@ def upgrade() -> None:
         name="foundationtype",
         create_type=False,
     )
-    foundation_type.create(op.get_bind(), checkfirst=True)
 
     # Create volume_estimations table
     op.create_table(
@@ -56,14 +54,7 @@ def upgrade() -> None:
         # Status and progress
         sa.Column(
             "status",
-            sa.Enum(
-                "pending",
-                "processing",
-                "completed",
-                "failed",
-                "cached",
-                name="volumeestimationstatus",
-            ),
+            volume_status,
             nullable=False,
         ),
         sa.Column("progress_percent", sa.Integer(), nullable=False, server_default="0"),
@@ -73,7 +64,7 @@ def upgrade() -> None:
         sa.Column("grid_resolution", sa.Float(), nullable=False, server_default="2.0"),
         sa.Column(
             "default_foundation_type",
-            sa.Enum("pad", "pier", "strip", "raft", name="foundationtype"),
+            foundation_type,
             nullable=False,
             server_default="pad",
         ),
@@ -178,7 +169,3 @@ def downgrade() -> None:
 
     # Drop table
     op.drop_table("volume_estimations")
-
-    # Drop enum types
-    op.execute("DROP TYPE IF EXISTS volumeestimationstatus")
-    op.execute("DROP TYPE IF EXISTS foundationtype")
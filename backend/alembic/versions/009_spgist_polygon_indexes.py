@@ -0,0 +1,57 @@
+"""Use SP-GiST for the project boundary spatial index
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-17
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.db.migration_ops import create_index, drop_index
+
+# revision identifiers, used by Alembic.
+revision: str = "009"
+down_revision: Union[str, None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX = "idx_projects_boundary_geom"
+BUILD_INDEX = "idx_projects_boundary_geom_new"
+
+# The rebuild runs on a populated table; keep the sort in memory for the
+# build only.
+INDEX_BUILD_SETTINGS = {
+    "maintenance_work_mem": "2GB",
+    "max_parallel_maintenance_workers": "4",
+}
+
+
+def _rebuild_boundary_index(method: str) -> None:
+    # Build the replacement online under a temporary name so the old index
+    # keeps serving queries until the new one is ready, then swap the names.
+    # A failed concurrent build leaves an invalid index behind; clear it first.
+    drop_index(BUILD_INDEX)
+    create_index(
+        BUILD_INDEX,
+        "projects",
+        f"USING {method} (boundary_geom)",
+        settings=INDEX_BUILD_SETTINGS,
+    )
+    drop_index(INDEX)
+    op.execute(f"ALTER INDEX {BUILD_INDEX} RENAME TO {INDEX}")
+
+
+def upgrade() -> None:
+    # Property boundaries overlap heavily, which is where SP-GiST's space
+    # partitioning beats GiST's bounding-box R-tree: faster point-in-polygon
+    # lookups and a much smaller index. entry_point_geom (POINT) stays on
+    # GiST. The exclusion zone geometry indexes are left alone here; 021
+    # replaces them with one partial SP-GiST index.
+    _rebuild_boundary_index("SPGIST")
+
+
+def downgrade() -> None:
+    _rebuild_boundary_index("GIST")
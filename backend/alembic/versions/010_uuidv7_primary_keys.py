@@ -0,0 +1,70 @@
+"""Default primary keys to time-ordered UUIDv7
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-17
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "010"
+down_revision: Union[str, None] = "009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = [
+    "users",
+    "projects",
+    "uploaded_files",
+    "terrain_analyses",
+    "exclusion_zones",
+    "asset_placements",
+    "road_networks",
+    "volume_estimations",
+]
+
+
+def upgrade() -> None:
+    # Inline UUIDv7 (RFC 9562): overlay the 48-bit ms timestamp onto a random
+    # v4 UUID and flip the version nibble from 4 to 7. Avoids depending on
+    # the pg_uuidv7 extension being installed on the server.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION uuidv7() RETURNS uuid AS $$
+            SELECT encode(
+                set_bit(
+                    set_bit(
+                        overlay(
+                            uuid_send(gen_random_uuid())
+                            PLACING substring(
+                                int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint)
+                                FROM 3
+                            )
+                            FROM 1 FOR 6
+                        ),
+                        52, 1
+                    ),
+                    53, 1
+                ),
+                'hex'
+            )::uuid;
+        $$ LANGUAGE sql VOLATILE;
+        """
+    )
+
+    # Time-ordered keys append at the right edge of each primary key B-tree.
+    # FK columns (user_id, project_id, source_file_id, terrain_analysis_id)
+    # reference these keys, so their join indexes get the same locality.
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT uuidv7()")
+
+
+def downgrade() -> None:
+    for table in reversed(TABLES):
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT")
+
+    op.execute("DROP FUNCTION IF EXISTS uuidv7()")
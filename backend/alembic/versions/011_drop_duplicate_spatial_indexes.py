@@ -0,0 +1,43 @@
+"""Drop duplicate GeoAlchemy2 auto-created spatial indexes
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-17
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "011"
+down_revision: Union[str, None] = "010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Geometry columns default to spatial_index=True, so op.create_table emitted
+# an idx_<table>_<column> GiST index next to the explicit ix_* index each
+# migration creates. Every write maintained both.
+DUPLICATE_INDEXES = [
+    "idx_terrain_analyses_analysis_bounds",
+    "idx_exclusion_zones_geometry",
+    "idx_exclusion_zones_buffered_geometry",
+    "idx_asset_placements_placement_area",
+    "idx_asset_placements_placed_assets",
+    "idx_road_networks_entry_point",
+    "idx_road_networks_road_centerlines",
+    "idx_road_networks_road_polygons",
+    "idx_volume_estimations_analysis_bounds",
+]
+
+
+def upgrade() -> None:
+    # IF EXISTS keeps this idempotent on databases that never had them
+    for index_name in DUPLICATE_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {index_name}")
+
+
+def downgrade() -> None:
+    # The duplicates carried no information; they are not recreated.
+    pass
@@ -0,0 +1,52 @@
+"""Add created_at indexes for time-ordered listings
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-17
+
+"""
+
+from typing import Sequence, Union
+
+from app.db.migration_ops import create_index, drop_index
+
+# revision identifiers, used by Alembic.
+revision: str = "012"
+down_revision: Union[str, None] = "011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # created_at is insert-ordered, so BRIN block ranges stay tight and the
+    # index is a tiny fraction of a B-tree's size
+    create_index(
+        "ix_terrain_analyses_created_at_brin",
+        "terrain_analyses",
+        "USING BRIN (created_at) WITH (pages_per_range = 32)",
+    )
+    create_index(
+        "ix_asset_placements_created_at_brin",
+        "asset_placements",
+        "USING BRIN (created_at) WITH (pages_per_range = 32)",
+    )
+
+    # Per-user listings filter by user and sort newest first; a composite
+    # B-tree is more selective than BRIN there
+    create_index(
+        "ix_uploaded_files_user_id_created_at",
+        "uploaded_files",
+        "(user_id, created_at DESC)",
+    )
+    create_index(
+        "ix_exclusion_zones_user_id_created_at",
+        "exclusion_zones",
+        "(user_id, created_at DESC)",
+    )
+
+
+def downgrade() -> None:
+    drop_index("ix_exclusion_zones_user_id_created_at")
+    drop_index("ix_uploaded_files_user_id_created_at")
+    drop_index("ix_asset_placements_created_at_brin")
+    drop_index("ix_terrain_analyses_created_at_brin")
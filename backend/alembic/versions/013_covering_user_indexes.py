@@ -0,0 +1,68 @@
+"""Replace per-user indexes with covering composites
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-17
+
+"""
+
+from typing import Sequence, Union
+
+from app.db.migration_ops import create_index, drop_index
+
+# revision identifiers, used by Alembic.
+revision: str = "013"
+down_revision: Union[str, None] = "012"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Dashboard queries are WHERE user_id = ? [AND status = ?]
+    # ORDER BY created_at DESC LIMIT n. Carrying the filter column and id in
+    # the leaf pages lets PostgreSQL answer them with an index-only scan.
+    # The leading user_id column still serves the users.id foreign keys.
+    create_index(
+        "ix_uploaded_files_user_created",
+        "uploaded_files",
+        "(user_id, created_at DESC) INCLUDE (status, id)",
+    )
+    drop_index("ix_uploaded_files_user_id_created_at")
+    drop_index("ix_uploaded_files_user_id")
+
+    # exclusion_zones has no status column; is_active is its list filter
+    create_index(
+        "ix_exclusion_zones_user_created",
+        "exclusion_zones",
+        "(user_id, created_at DESC) INCLUDE (is_active, id)",
+    )
+    drop_index("ix_exclusion_zones_user_id_created_at")
+    drop_index("ix_exclusion_zones_user_id")
+
+    create_index(
+        "ix_asset_placements_user_created",
+        "asset_placements",
+        "(user_id, created_at DESC) INCLUDE (status, id)",
+    )
+    drop_index("ix_asset_placements_user_id")
+
+
+def downgrade() -> None:
+    create_index("ix_asset_placements_user_id", "asset_placements", "(user_id)")
+    drop_index("ix_asset_placements_user_created")
+
+    create_index("ix_exclusion_zones_user_id", "exclusion_zones", "(user_id)")
+    create_index(
+        "ix_exclusion_zones_user_id_created_at",
+        "exclusion_zones",
+        "(user_id, created_at DESC)",
+    )
+    drop_index("ix_exclusion_zones_user_created")
+
+    create_index("ix_uploaded_files_user_id", "uploaded_files", "(user_id)")
+    create_index(
+        "ix_uploaded_files_user_id_created_at",
+        "uploaded_files",
+        "(user_id, created_at DESC)",
+    )
+    drop_index("ix_uploaded_files_user_created")
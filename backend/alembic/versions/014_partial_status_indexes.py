@@ -0,0 +1,55 @@
+"""Limit status indexes to the active processing queue
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-17
+
+"""
+
+from typing import Sequence, Union
+
+from app.db.migration_ops import create_index, drop_index
+
+# revision identifiers, used by Alembic.
+revision: str = "014"
+down_revision: Union[str, None] = "013"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Schedulers only ever look for work that is still in flight. Finished
+    # rows (processed/completed/failed/...) dominate these tables, so
+    # indexing just the active subset keeps the index small enough to stay
+    # cached.
+    drop_index("ix_uploaded_files_status")
+    create_index(
+        "ix_uploaded_files_status_active",
+        "uploaded_files",
+        "(status, created_at) WHERE status IN ('pending', 'validating', 'processing')",
+    )
+
+    drop_index("ix_terrain_analyses_status")
+    create_index(
+        "ix_terrain_analyses_status_active",
+        "terrain_analyses",
+        "(status, created_at) WHERE status IN ('pending', 'processing')",
+    )
+
+    drop_index("ix_asset_placements_status")
+    create_index(
+        "ix_asset_placements_status_active",
+        "asset_placements",
+        "(status, created_at) WHERE status IN ('pending', 'processing')",
+    )
+
+
+def downgrade() -> None:
+    drop_index("ix_asset_placements_status_active")
+    create_index("ix_asset_placements_status", "asset_placements", "(status)")
+
+    drop_index("ix_terrain_analyses_status_active")
+    create_index("ix_terrain_analyses_status", "terrain_analyses", "(status)")
+
+    drop_index("ix_uploaded_files_status_active")
+    create_index("ix_uploaded_files_status", "uploaded_files", "(status)")
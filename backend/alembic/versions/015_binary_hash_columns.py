@@ -0,0 +1,53 @@
+"""Store SHA-256 hashes as raw bytes
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-17
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "015"
+down_revision: Union[str, None] = "014"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, check constraint name)
+HASH_COLUMNS = [
+    ("uploaded_files", "content_hash", "ck_uploaded_files_content_hash_length"),
+    ("terrain_analyses", "input_hash", "ck_terrain_analyses_input_hash_length"),
+]
+
+
+def upgrade() -> None:
+    # A 32-byte digest is half the size of its hex form, so the dedup and
+    # cache lookup indexes shrink accordingly and compare with memcmp.
+    # Changing the column type rebuilds the existing indexes in place.
+    for table, column, constraint in HASH_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.LargeBinary(length=32),
+            existing_type=sa.String(length=64),
+            existing_nullable=True,
+            postgresql_using=f"decode({column}, 'hex')",
+        )
+        op.create_check_constraint(constraint, table, f"octet_length({column}) = 32")
+
+
+def downgrade() -> None:
+    for table, column, constraint in reversed(HASH_COLUMNS):
+        op.drop_constraint(constraint, table, type_="check")
+        op.alter_column(
+            table,
+            column,
+            type_=sa.String(length=64),
+            existing_type=sa.LargeBinary(length=32),
+            existing_nullable=True,
+            postgresql_using=f"encode({column}, 'hex')",
+        )
@@ -0,0 +1,47 @@
+"""Drop stored geometry_type columns
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-10-17
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "017"
+down_revision: Union[str, None] = "016"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The type is part of every geometry value; the models now read it from
+    # the WKB header instead of storing a copy on each row.
+    op.drop_column("uploaded_files", "geometry_type")
+    op.drop_column("exclusion_zones", "geometry_type")
+
+
+def downgrade() -> None:
+    # ST_GeometryType returns 'ST_MultiPolygon' etc.; strip the prefix to get
+    # the shapely/GeoJSON names that were stored before
+    op.add_column(
+        "exclusion_zones",
+        sa.Column("geometry_type", sa.String(50), nullable=True),
+    )
+    op.execute(
+        "UPDATE exclusion_zones SET geometry_type = substr(ST_GeometryType(geometry), 4)"
+    )
+    op.alter_column("exclusion_zones", "geometry_type", nullable=False)
+
+    op.add_column(
+        "uploaded_files",
+        sa.Column("geometry_type", sa.String(length=50), nullable=True),
+    )
+    op.execute(
+        "UPDATE uploaded_files SET geometry_type = substr(ST_GeometryType(boundary_geom), 4) "
+        "WHERE boundary_geom IS NOT NULL"
+    )
@@ -0,0 +1,61 @@
+"""Store slope and aspect percentages as real arrays
+
+Revision ID: 018
+Revises: 017
+Create Date: 2026-10-17
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "018"
+down_revision: Union[str, None] = "017"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Array positions, matching SLOPE_CLASSES / ASPECT_DIRECTIONS in
+# app/services/terrain_analysis.py
+STATS_COLUMNS = {
+    "slope_classification": ["flat", "gentle", "moderate", "steep", "very_steep"],
+    "aspect_distribution": ["N", "NE", "E", "SE", "S", "SW", "W", "NW"],
+}
+
+
+def upgrade() -> None:
+    # Both columns always hold the same handful of keys, so storing the key
+    # names on every row is pure overhead; a real[] is a fraction of the
+    # size and needs no JSON decoding.
+    for column, keys in STATS_COLUMNS.items():
+        elements = ", ".join(f"COALESCE(({column}->>'{key}')::real, 0)" for key in keys)
+        op.alter_column(
+            "terrain_analyses",
+            column,
+            type_=postgresql.ARRAY(sa.REAL()),
+            existing_type=postgresql.JSONB(),
+            existing_nullable=True,
+            postgresql_using=(
+                f"CASE WHEN {column} IS NULL OR {column} = '{{}}'::jsonb "
+                f"THEN NULL ELSE ARRAY[{elements}] END"
+            ),
+        )
+
+
+def downgrade() -> None:
+    for column, keys in STATS_COLUMNS.items():
+        pairs = ", ".join(f"'{key}', {column}[{i}]" for i, key in enumerate(keys, 1))
+        op.alter_column(
+            "terrain_analyses",
+            column,
+            type_=postgresql.JSONB(),
+            existing_type=postgresql.ARRAY(sa.REAL()),
+            existing_nullable=True,
+            postgresql_using=(
+                f"CASE WHEN {column} IS NULL THEN NULL "
+                f"ELSE jsonb_build_object({pairs}) END"
+            ),
+        )
@@ -0,0 +1,48 @@
+"""Drop project_id indexes covered by (project_id, status)
+
+Revision ID: 019
+Revises: 018
+Create Date: 2026-10-17
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.db.migration_ops import create_index, drop_index
+
+# revision identifiers, used by Alembic.
+revision: str = "019"
+down_revision: Union[str, None] = "018"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, redundant index, covering composite from revision 007)
+PROJECT_INDEXES = [
+    (
+        "terrain_analyses",
+        "ix_terrain_analyses_project_id",
+        "ix_terrain_analyses_project_status",
+    ),
+    (
+        "asset_placements",
+        "ix_asset_placements_project_id",
+        "ix_asset_placements_project_status",
+    ),
+]
+
+
+def upgrade() -> None:
+    # The composite's leading column serves every project_id-only lookup and
+    # the foreign key, and project+status polling needs a single probe.
+    # Move the CLUSTER mark from revision 016 over before dropping.
+    for table, index_name, composite in PROJECT_INDEXES:
+        op.execute(f"ALTER TABLE {table} CLUSTER ON {composite}")
+        drop_index(index_name)
+
+
+def downgrade() -> None:
+    for table, index_name, _ in reversed(PROJECT_INDEXES):
+        create_index(index_name, table, "(project_id)")
+        op.execute(f"ALTER TABLE {table} CLUSTER ON {index_name}")
@@ -0,0 +1,66 @@
+"""Use TIMESTAMPTZ for all timestamp columns
+
+Revision ID: 020
+Revises: 019
+Create Date: 2026-10-17
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "020"
+down_revision: Union[str, None] = "019"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tables from 003 onwards were created with naive timestamps, unlike users,
+# projects and uploaded_files
+NAIVE_TIMESTAMPS = {
+    "terrain_analyses": [
+        "created_at",
+        "updated_at",
+        "started_at",
+        "completed_at",
+        "cache_valid_until",
+    ],
+    "exclusion_zones": ["created_at", "updated_at"],
+    "asset_placements": ["created_at", "updated_at", "started_at", "completed_at"],
+    "road_networks": ["created_at", "updated_at", "started_at", "completed_at"],
+    "volume_estimations": [
+        "created_at",
+        "updated_at",
+        "started_at",
+        "completed_at",
+        "cache_valid_until",
+    ],
+}
+
+
+def upgrade() -> None:
+    # Mixed timestamp/timestamptz comparisons and joins need a cast (and
+    # the session time zone) on every evaluation. Stored values were
+    # written with utcnow(), so read them as UTC. One ALTER per table keeps
+    # it to a single rewrite.
+    for table, columns in NAIVE_TIMESTAMPS.items():
+        clauses = ", ".join(
+            f"ALTER COLUMN {column} TYPE TIMESTAMP WITH TIME ZONE "
+            f"USING {column} AT TIME ZONE 'UTC'"
+            for column in columns
+        )
+        op.execute(f"ALTER TABLE {table} {clauses}")
+
+
+def downgrade() -> None:
+    for table, columns in NAIVE_TIMESTAMPS.items():
+        for column in columns:
+            op.alter_column(
+                table,
+                column,
+                type_=sa.DateTime(),
+                existing_type=sa.DateTime(timezone=True),
+                postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+            )
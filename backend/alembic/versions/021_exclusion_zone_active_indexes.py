@@ -0,0 +1,52 @@
+"""Index only active exclusion zones
+
+Revision ID: 021
+Revises: 020
+Create Date: 2026-10-17
+
+"""
+
+from typing import Sequence, Union
+
+from app.db.migration_ops import create_index, drop_index
+
+# revision identifiers, used by Alembic.
+revision: str = "021"
+down_revision: Union[str, None] = "020"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # A standalone boolean index is never selective enough to be used, and
+    # ix_exclusion_zones_project_active (007) already covers project_id
+    # lookups through its leading column.
+    drop_index("ix_exclusion_zones_is_active")
+    drop_index("ix_exclusion_zones_project_id")
+
+    # Intersection checks filter on the effective geometry
+    # (COALESCE(buffered_geometry, geometry)) of active zones, which neither
+    # per-column index can serve. Index exactly that, so inactive zones stay
+    # out of the tree, and drop the per-column GiST indexes from 004.
+    create_index(
+        "ix_exclusion_zones_active_effective_geom",
+        "exclusion_zones",
+        "USING SPGIST (COALESCE(buffered_geometry, geometry)) WHERE is_active IS TRUE",
+    )
+    drop_index("ix_exclusion_zones_geometry")
+    drop_index("ix_exclusion_zones_buffered_geometry")
+
+
+def downgrade() -> None:
+    create_index(
+        "ix_exclusion_zones_buffered_geometry",
+        "exclusion_zones",
+        "USING GIST (buffered_geometry)",
+    )
+    create_index(
+        "ix_exclusion_zones_geometry", "exclusion_zones", "USING GIST (geometry)"
+    )
+    drop_index("ix_exclusion_zones_active_effective_geom")
+
+    create_index("ix_exclusion_zones_project_id", "exclusion_zones", "(project_id)")
+    create_index("ix_exclusion_zones_is_active", "exclusion_zones", "(is_active)")
@@ -0,0 +1,97 @@
+"""Generate exclusion zone buffer and area in the database
+
+Revision ID: 022
+Revises: 021
+Create Date: 2026-10-17
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from geoalchemy2 import Geometry
+
+from app.db.migration_ops import create_index, drop_index
+
+# revision identifiers, used by Alembic.
+revision: str = "022"
+down_revision: Union[str, None] = "021"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+APPLIED_BUFFER = "buffer_applied AND buffer_distance IS NOT NULL"
+BUFFERED_GEOMETRY = (
+    f"CASE WHEN {APPLIED_BUFFER} "
+    "THEN ST_Buffer(geometry::geography, buffer_distance)::geometry END"
+)
+AREA_SQM = (
+    f"NULLIF(ST_Area(CASE WHEN {APPLIED_BUFFER} "
+    "THEN ST_Buffer(geometry::geography, buffer_distance) "
+    "ELSE geometry::geography END), 0)"
+)
+
+EFFECTIVE_GEOM_INDEX = (
+    "USING SPGIST (COALESCE(buffered_geometry, geometry)) WHERE is_active IS TRUE"
+)
+
+
+def upgrade() -> None:
+    # The buffer and area used to be computed with extra queries and a second
+    # UPDATE after every write. As stored generated columns PostGIS keeps
+    # them in step with geometry/buffer_distance within the same statement.
+    # The geography buffer is measured on the spheroid, replacing the
+    # hardcoded UTM zone 18N projection.
+    #
+    # Existing columns cannot be converted to generated ones, so they are
+    # re-added; the effective-geometry index depends on buffered_geometry.
+    drop_index("ix_exclusion_zones_active_effective_geom")
+    op.drop_column("exclusion_zones", "buffered_geometry")
+    op.drop_column("exclusion_zones", "area_sqm")
+    op.add_column(
+        "exclusion_zones",
+        sa.Column(
+            "buffered_geometry",
+            Geometry("GEOMETRY", srid=4326, spatial_index=False),
+            sa.Computed(BUFFERED_GEOMETRY, persisted=True),
+            nullable=True,
+        ),
+    )
+    op.add_column(
+        "exclusion_zones",
+        sa.Column(
+            "area_sqm",
+            sa.Float(),
+            sa.Computed(AREA_SQM, persisted=True),
+            nullable=True,
+        ),
+    )
+    create_index(
+        "ix_exclusion_zones_active_effective_geom",
+        "exclusion_zones",
+        EFFECTIVE_GEOM_INDEX,
+    )
+
+
+def downgrade() -> None:
+    drop_index("ix_exclusion_zones_active_effective_geom")
+    op.drop_column("exclusion_zones", "area_sqm")
+    op.drop_column("exclusion_zones", "buffered_geometry")
+    op.add_column(
+        "exclusion_zones",
+        sa.Column(
+            "buffered_geometry",
+            Geometry("GEOMETRY", srid=4326, spatial_index=False),
+            nullable=True,
+        ),
+    )
+    op.add_column("exclusion_zones", sa.Column("area_sqm", sa.Float(), nullable=True))
+    op.execute(
+        f"UPDATE exclusion_zones SET buffered_geometry = {BUFFERED_GEOMETRY}, "
+        f"area_sqm = {AREA_SQM}"
+    )
+    create_index(
+        "ix_exclusion_zones_active_effective_geom",
+        "exclusion_zones",
+        EFFECTIVE_GEOM_INDEX,
+    )
@@ -0,0 +1,73 @@
+"""Store terrain raster paths relative to UPLOAD_DIR
+
+Revision ID: 023
+Revises: 022
+Create Date: 2026-10-17
+
+"""
+
+import os
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+from app.core.config import settings
+
+# revision identifiers, used by Alembic.
+revision: str = "023"
+down_revision: Union[str, None] = "022"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+RASTER_PATH_COLUMNS = (
+    "slope_raster_path",
+    "aspect_raster_path",
+    "hillshade_raster_path",
+)
+
+# Raster paths were written as os.path.join(UPLOAD_DIR, "terrain_analysis", ...)
+UPLOAD_PREFIX = os.path.join(settings.UPLOAD_DIR, "")
+
+
+def _literal(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def upgrade() -> None:
+    # uploaded_files.file_path is already relative to UPLOAD_DIR; strip the
+    # shared prefix from the raster paths so every row stores only its key
+    prefix = _literal(UPLOAD_PREFIX)
+    assignments = ", ".join(
+        f"{col} = CASE WHEN starts_with({col}, {prefix}) "
+        f"THEN substr({col}, length({prefix}) + 1) ELSE {col} END"
+        for col in RASTER_PATH_COLUMNS
+    )
+    op.execute(f"UPDATE terrain_analyses SET {assignments}")
+
+    # varchar -> text is binary coercible, so this does not rewrite the table
+    op.alter_column(
+        "uploaded_files", "file_path", type_=sa.Text(), existing_nullable=False
+    )
+    for col in RASTER_PATH_COLUMNS:
+        op.alter_column(
+            "terrain_analyses", col, type_=sa.Text(), existing_nullable=True
+        )
+
+
+def downgrade() -> None:
+    for col in RASTER_PATH_COLUMNS:
+        op.alter_column(
+            "terrain_analyses", col, type_=sa.String(500), existing_nullable=True
+        )
+    op.alter_column(
+        "uploaded_files", "file_path", type_=sa.String(500), existing_nullable=False
+    )
+
+    prefix = _literal(UPLOAD_PREFIX)
+    assignments = ", ".join(
+        f"{col} = CASE WHEN {col} IS NULL OR starts_with({col}, '/') "
+        f"THEN {col} ELSE {prefix} || {col} END"
+        for col in RASTER_PATH_COLUMNS
+    )
+    op.execute(f"UPDATE terrain_analyses SET {assignments}")
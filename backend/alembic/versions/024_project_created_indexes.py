@@ -0,0 +1,46 @@
+"""Index road networks and volume estimations by (project_id, created_at DESC)
+
+Revision ID: 024
+Revises: 023
+Create Date: 2026-10-17
+
+"""
+
+from typing import Sequence, Union
+
+from app.db.migration_ops import create_index, drop_index
+
+# revision identifiers, used by Alembic.
+revision: str = "024"
+down_revision: Union[str, None] = "023"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, project_id index from 006/008, list index)
+PROJECT_CREATED_INDEXES = [
+    (
+        "road_networks",
+        "ix_road_networks_project_id",
+        "ix_road_networks_project_created",
+    ),
+    (
+        "volume_estimations",
+        "ix_volume_estimations_project_id",
+        "ix_volume_estimations_project_created",
+    ),
+]
+
+
+def upgrade() -> None:
+    # The list endpoints filter by project and ORDER BY created_at DESC with
+    # LIMIT, so the composite returns rows already sorted and stops early.
+    # Its leading column still serves project_id lookups and the foreign key.
+    for table, index_name, composite in PROJECT_CREATED_INDEXES:
+        create_index(composite, table, "(project_id, created_at DESC)")
+        drop_index(index_name)
+
+
+def downgrade() -> None:
+    for table, index_name, composite in reversed(PROJECT_CREATED_INDEXES):
+        create_index(index_name, table, "(project_id)")
+        drop_index(composite)
@@ -0,0 +1,48 @@
+"""Replace road network and volume estimation status indexes with partial ones
+
+Revision ID: 025
+Revises: 024
+Create Date: 2026-10-17
+
+"""
+
+from typing import Sequence, Union
+
+from app.db.migration_ops import create_index, drop_index
+
+# revision identifiers, used by Alembic.
+revision: str = "025"
+down_revision: Union[str, None] = "024"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, full status index from 006/008, partial index, indexed statuses)
+STATUS_INDEXES = [
+    (
+        "road_networks",
+        "ix_road_networks_status",
+        "ix_road_networks_status_active",
+        "('pending', 'processing', 'failed')",
+    ),
+    (
+        "volume_estimations",
+        "ix_volume_estimations_status",
+        "ix_volume_estimations_status_active",
+        "('pending', 'processing', 'failed', 'cached')",
+    ),
+]
+
+
+def upgrade() -> None:
+    # Nearly every row ends up completed, so a full index on status mostly
+    # holds entries nobody looks up. Status lookups are scoped to a project
+    # and only ask for the unfinished states, so index just those rows.
+    for table, index_name, partial, statuses in STATUS_INDEXES:
+        create_index(partial, table, f"(project_id, status) WHERE status IN {statuses}")
+        drop_index(index_name)
+
+
+def downgrade() -> None:
+    for table, index_name, partial, _ in reversed(STATUS_INDEXES):
+        create_index(index_name, table, "(status)")
+        drop_index(partial)
@@ -0,0 +1,33 @@
+"""Add a GIN index on road_networks.advanced_settings
+
+Revision ID: 026
+Revises: 025
+Create Date: 2026-10-17
+
+"""
+
+from typing import Sequence, Union
+
+from app.db.migration_ops import create_index, drop_index
+
+# revision identifiers, used by Alembic.
+revision: str = "026"
+down_revision: Union[str, None] = "025"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # jsonb_path_ops only supports @> but is much smaller than the default
+    # jsonb_ops, so settings filters must be written as containment.
+    # The volume estimation report/detail blobs are only ever read by id and
+    # are deliberately left unindexed.
+    create_index(
+        "ix_road_networks_advanced_settings_gin",
+        "road_networks",
+        "USING GIN (advanced_settings jsonb_path_ops)",
+    )
+
+
+def downgrade() -> None:
+    drop_index("ix_road_networks_advanced_settings_gin")
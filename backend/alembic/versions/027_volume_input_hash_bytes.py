@@ -0,0 +1,61 @@
+"""Store volume estimation input hashes as raw bytes with a hash index
+
+Revision ID: 027
+Revises: 026
+Create Date: 2026-10-17
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+from app.db.migration_ops import create_index, drop_index
+
+# revision identifiers, used by Alembic.
+revision: str = "027"
+down_revision: Union[str, None] = "026"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CONSTRAINT = "ck_volume_estimations_input_hash_length"
+
+
+def upgrade() -> None:
+    # Same conversion as revision 015. The cache lookup only ever compares
+    # input_hash for equality, so a HASH index replaces the B-tree; drop the
+    # B-tree first so the type change does not rebuild it.
+    drop_index("ix_volume_estimations_input_hash")
+    op.alter_column(
+        "volume_estimations",
+        "input_hash",
+        type_=sa.LargeBinary(length=32),
+        existing_type=sa.String(length=64),
+        existing_nullable=True,
+        postgresql_using="decode(input_hash, 'hex')",
+    )
+    op.create_check_constraint(
+        CONSTRAINT, "volume_estimations", "octet_length(input_hash) = 32"
+    )
+    create_index(
+        "ix_volume_estimations_input_hash",
+        "volume_estimations",
+        "USING HASH (input_hash)",
+    )
+
+
+def downgrade() -> None:
+    drop_index("ix_volume_estimations_input_hash")
+    op.drop_constraint(CONSTRAINT, "volume_estimations", type_="check")
+    op.alter_column(
+        "volume_estimations",
+        "input_hash",
+        type_=sa.String(length=64),
+        existing_type=sa.LargeBinary(length=32),
+        existing_nullable=True,
+        postgresql_using="encode(input_hash, 'hex')",
+    )
+    create_index(
+        "ix_volume_estimations_input_hash", "volume_estimations", "(input_hash)"
+    )
@@ -0,0 +1,29 @@
+"""Drop ix_projects_user_id, covered by (user_id, created_at)
+
+Revision ID: 028
+Revises: 027
+Create Date: 2026-10-17
+
+"""
+
+from typing import Sequence, Union
+
+from app.db.migration_ops import create_index, drop_index
+
+# revision identifiers, used by Alembic.
+revision: str = "028"
+down_revision: Union[str, None] = "027"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # A B-tree serves any query on a leftmost prefix of its columns, so
+    # ix_projects_user_id_created_at (007) answers WHERE user_id = ? and
+    # backs the foreign key. Do not re-add single-column indexes on the
+    # leading column of an existing composite.
+    drop_index("ix_projects_user_id")
+
+
+def downgrade() -> None:
+    create_index("ix_projects_user_id", "projects", "(user_id)")
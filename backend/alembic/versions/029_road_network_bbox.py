@@ -0,0 +1,56 @@
+"""Index road networks by one combined bounding box
+
+Revision ID: 029
+Revises: 028
+Create Date: 2026-10-17
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from geoalchemy2 import Geometry
+
+from app.db.migration_ops import create_index, drop_index
+
+# revision identifiers, used by Alembic.
+revision: str = "029"
+down_revision: Union[str, None] = "028"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The array form of ST_Collect skips NULLs, so a network without an entry
+# point or polygons still gets a box
+BBOX = "ST_Envelope(ST_Collect(ARRAY[entry_point, road_centerlines, road_polygons]))"
+
+# Per-geometry indexes from 006 that the combined box replaces
+REPLACED_INDEXES = [
+    ("ix_road_networks_entry_point_geom", "entry_point"),
+    ("ix_road_networks_polygons_geom", "road_polygons"),
+]
+
+
+def upgrade() -> None:
+    # "Does this network touch the area?" needs one probe into one index
+    # instead of a union over three. Only the centerlines keep their own
+    # index for line-level filters.
+    op.add_column(
+        "road_networks",
+        sa.Column(
+            "bbox",
+            Geometry("GEOMETRY", srid=4326, spatial_index=False),
+            sa.Computed(BBOX, persisted=True),
+            nullable=True,
+        ),
+    )
+    create_index("ix_road_networks_bbox_geom", "road_networks", "USING GIST (bbox)")
+    for index_name, _ in REPLACED_INDEXES:
+        drop_index(index_name)
+
+
+def downgrade() -> None:
+    for index_name, column in reversed(REPLACED_INDEXES):
+        create_index(index_name, "road_networks", f"USING GIST ({column})")
+    drop_index("ix_road_networks_bbox_geom")
+    op.drop_column("road_networks", "bbox")
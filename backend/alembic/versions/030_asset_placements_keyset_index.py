@@ -0,0 +1,33 @@
+"""Index asset placements by (project_id, created_at DESC, id DESC)
+
+Revision ID: 030
+Revises: 029
+Create Date: 2026-10-17
+
+"""
+
+from typing import Sequence, Union
+
+from app.db.migration_ops import create_index, drop_index
+
+# revision identifiers, used by Alembic.
+revision: str = "030"
+down_revision: Union[str, None] = "029"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Matches the list endpoint's ORDER BY created_at DESC, id DESC, so both
+    # OFFSET pages and the keyset predicate (created_at, id) < (:ts, :id)
+    # become a bounded range scan. (project_id, status) from revision 007
+    # stays: it carries the CLUSTER mark and serves status polling.
+    create_index(
+        "ix_asset_placements_project_created",
+        "asset_placements",
+        "(project_id, created_at DESC, id DESC)",
+    )
+
+
+def downgrade() -> None:
+    drop_index("ix_asset_placements_project_created")
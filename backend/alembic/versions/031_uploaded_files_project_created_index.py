@@ -0,0 +1,34 @@
+"""Index uploaded files by (project_id, created_at DESC)
+
+Revision ID: 031
+Revises: 030
+Create Date: 2026-10-17
+
+"""
+
+from typing import Sequence, Union
+
+from app.db.migration_ops import create_index, drop_index
+
+# revision identifiers, used by Alembic.
+revision: str = "031"
+down_revision: Union[str, None] = "030"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The file list filtered by project orders by created_at DESC with LIMIT,
+    # so the composite returns the page already sorted. Its leading column
+    # still serves project_id lookups and the foreign key.
+    create_index(
+        "ix_uploaded_files_project_created",
+        "uploaded_files",
+        "(project_id, created_at DESC)",
+    )
+    drop_index("ix_uploaded_files_project_id")
+
+
+def downgrade() -> None:
+    create_index("ix_uploaded_files_project_id", "uploaded_files", "(project_id)")
+    drop_index("ix_uploaded_files_project_created")
@@ -9,12 +9,21 @@ from app.core.security import decode_access_token
 from app.crud.user import user as user_crud
 from app.db.base import get_db
 from app.models.user import User
-from app.schemas.auth import TokenPayload
 
 # OAuth2 scheme for token authentication
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
 
+def _credentials_exception() -> HTTPException:
+    # Built per failure rather than shared: raising one instance repeatedly
+    # keeps extending its __traceback__ across requests and threads
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
 def get_current_user(
     db: Annotated[Session, Depends(get_db)],
     token: Annotated[str, Depends(oauth2_scheme)],
@@ -25,41 +34,33 @@ def get_current_user(
     Raises:
         HTTPException: If token is invalid or user not found
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-
     # Decode JWT token
     payload = decode_access_token(token)
     if payload is None:
-        raise credentials_exception
+        raise _credentials_exception()
 
     # Get user_id from token
     user_id = payload.get("sub")
-    if user_id is None:
-        raise credentials_exception
-
-    try:
-        token_data = TokenPayload(sub=user_id)
-    except Exception:
-        raise credentials_exception
+    if not isinstance(user_id, str):
+        raise _credentials_exception()
 
-    # Get user from database
     try:
-        user_uuid = UUID(token_data.sub)
-    except (ValueError, TypeError, AttributeError):
-        raise credentials_exception
+        user_uuid = UUID(user_id)
+    except ValueError:
+        raise _credentials_exception() from None
 
-    user = user_crud.get(db, user_id=user_uuid)
+    # Get user from database (recent lookups are served from the user cache)
+    user = user_crud.get_cached(db, user_id=user_uuid)
     if user is None:
-        raise credentials_exception
+        raise _credentials_exception()
 
     return user
 
 
-def get_current_active_user(
+# The checks below only read attributes of the already loaded user. As
+# coroutines FastAPI runs them on the event loop instead of handing each
+# one to the threadpool; get_current_user stays sync as it may query.
+async def get_current_active_user(
     current_user: Annotated[User, Depends(get_current_user)],
 ) -> User:
     """
@@ -75,7 +76,7 @@ def get_current_active_user(
     return current_user
 
 
-def get_current_superuser(
+async def get_current_superuser(
     current_user: Annotated[User, Depends(get_current_user)],
 ) -> User:
     """
@@ -1,17 +1,20 @@
 """API endpoints for asset auto-placement."""
 
-from typing import Annotated
+import logging
+from typing import Annotated, Any, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
 from app.api.dependencies import get_current_active_user
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.storage import resolve_storage_path
 from app.crud.asset_placement import asset_placement as placement_crud
 from app.crud.exclusion_zone import exclusion_zone as zone_crud
 from app.crud.project import project as project_crud
 from app.crud.terrain_analysis import terrain_analysis as terrain_crud
-from app.db.base import get_db
+from app.db.base import SessionLocal, get_db
 from app.models.asset_placement import PlacementStatus
 from app.models.user import User
 from app.schemas.asset_placement import (
@@ -25,6 +28,8 @@ from app.services.asset_placement import place_assets
 
 router = APIRouter()
 
+logger = logging.getLogger("sitelayout.asset_placement")
+
 
 def verify_project_access(
     db: Session,
@@ -32,34 +37,110 @@ def verify_project_access(
     user: User,
 ) -> None:
     """Verify user has access to the project."""
-    project = project_crud.get(db, project_id=project_id)
-    if not project:
+    owner_id = project_crud.get_owner_id(db, project_id=project_id)
+    if owner_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found",
         )
-    if project.user_id != user.id:
+    if owner_id != user.id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to access this project",
         )
 
 
+def run_asset_placement(
+    placement_id: UUID,
+    placement_in: AssetPlacementCreate,
+    placement_area: dict[str, Any],
+    slope_raster_path: Optional[str],
+) -> None:
+    """Run the placement algorithm for a queued placement and store the result.
+
+    Runs after the response has been sent, so it opens its own session.
+    """
+    db = SessionLocal()
+    try:
+        placement = placement_crud.get(db, placement_id=placement_id)
+        if not placement:
+            return
+
+        placement_crud.update_status(
+            db, placement, PlacementStatus.PROCESSING, 0, "Starting placement algorithm"
+        )
+
+        def progress_callback(percent: int, step: str):
+            placement_crud.update_status(
+                db, placement, PlacementStatus.PROCESSING, percent, step
+            )
+
+        # Streamed from the database while constraints are applied; the
+        # progress commits happen before and after that step
+        exclusion_zones = zone_crud.iter_geometries_by_project(
+            db, placement.project_id, active_only=True
+        )
+
+        try:
+            result = place_assets(
+                placement_area=placement_area,
+                num_assets=placement_in.asset_count,
+                grid_resolution=placement_in.grid_resolution,
+                min_spacing=placement_in.min_spacing,
+                max_slope=placement_in.max_slope,
+                optimization_criteria=placement_in.optimization_criteria,
+                slope_raster_path=slope_raster_path,
+                exclusion_zones=exclusion_zones,
+                advanced_settings=placement_in.advanced_settings,
+                progress_callback=progress_callback,
+            )
+        except Exception as e:
+            logger.exception("Asset placement %s failed", placement_id)
+            placement_crud.update_status(
+                db, placement, PlacementStatus.FAILED, error_message=str(e)
+            )
+            return
+
+        # Convert result to dictionary format expected by CRUD
+        result_dict = {
+            "success": result.success,
+            "placed_positions": result.placed_positions,
+            "placement_details": result.placement_details,
+            "assets_placed": result.assets_placed,
+            "placement_success_rate": result.placement_success_rate,
+            "grid_cells_total": result.grid_cells_total,
+            "grid_cells_valid": result.grid_cells_valid,
+            "grid_cells_excluded": result.grid_cells_excluded,
+            "avg_slope": result.avg_slope,
+            "avg_inter_asset_distance": result.avg_inter_asset_distance,
+            "total_cut_fill_volume": result.total_cut_fill_volume,
+            "processing_time": result.processing_time,
+            "memory_peak_mb": result.memory_peak_mb,
+            "algorithm_iterations": result.algorithm_iterations,
+            "error_message": result.error_message,
+        }
+
+        placement_crud.update_with_results(db, placement, result_dict)
+    finally:
+        db.close()
+
+
 @router.post(
     "/projects/{project_id}/asset-placements",
     response_model=AssetPlacementResponse,
-    status_code=status.HTTP_201_CREATED,
+    status_code=status.HTTP_202_ACCEPTED,
 )
 def create_asset_placement(
     project_id: UUID,
     placement_in: AssetPlacementCreate,
+    background_tasks: BackgroundTasks,
     db: Annotated[Session, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_active_user)],
 ):
     """
     Create a new asset placement request.
 
-    This endpoint initiates the auto-placement algorithm to optimally place
+    This endpoint queues the auto-placement algorithm to optimally place
     BESS assets within the specified area, respecting terrain constraints
     and exclusion zones.
 
@@ -69,11 +150,15 @@ def create_asset_placement(
     3. Optimize placement according to the specified criteria
     4. Return the placed asset locations
 
-    Processing may take up to 60 seconds for complex sites with 500 locations.
+    Processing may take up to 60 seconds for complex sites with 500 locations,
+    so the placement is returned in PENDING state and runs after the response.
+    Poll GET /projects/{project_id}/asset-placements/{placement_id} for
+    progress and results.
     """
     verify_project_access(db, project_id, current_user)
 
     # Validate terrain analysis if provided
+    terrain = None
     if placement_in.terrain_analysis_id:
         terrain = terrain_crud.get(db, analysis_id=placement_in.terrain_analysis_id)
         if not terrain:
@@ -95,22 +180,11 @@ def create_asset_placement(
         placement_in=placement_in,
     )
 
-    # Update status to processing
-    placement_crud.update_status(
-        db, placement, PlacementStatus.PROCESSING, 0, "Starting placement algorithm"
-    )
-
     # Get placement area (use project boundary if not provided)
     placement_area = placement_in.placement_area
     if not placement_area:
-        project = project_crud.get(db, project_id=project_id)
-        if project and project.boundary_geom:
-            from geoalchemy2.shape import to_shape
-            from shapely.geometry import mapping
-
-            boundary_shape = to_shape(project.boundary_geom)
-            placement_area = mapping(boundary_shape)
-        else:
+        placement_area = project_crud.get_boundary_geojson(db, project_id)
+        if not placement_area:
             placement_crud.update_status(
                 db,
                 placement,
@@ -125,26 +199,8 @@ def create_asset_placement(
 
     # Get slope raster path if terrain analysis is available
     slope_raster_path = None
-    if placement_in.terrain_analysis_id:
-        terrain = terrain_crud.get(db, analysis_id=placement_in.terrain_analysis_id)
-        if terrain:
-            slope_raster_path = terrain.slope_raster_path
-
-    # Get exclusion zones for the project
-    exclusion_zones_db = zone_crud.get_by_project(db, project_id, active_only=True)
-    exclusion_zones = []
-    for zone in exclusion_zones_db:
-        zone_dict = zone_crud.to_response_dict(zone)
-        # Use buffered geometry if available, otherwise use regular geometry
-        geom = zone_dict.get("buffered_geometry") or zone_dict.get("geometry")
-        if geom:
-            exclusion_zones.append(geom)
-
-    # Progress callback
-    def progress_callback(percent: int, step: str):
-        placement_crud.update_status(
-            db, placement, PlacementStatus.PROCESSING, percent, step
-        )
+    if terrain:
+        slope_raster_path = resolve_storage_path(terrain.slope_raster_path)
 
     # Ensure placement_area is not None
     if not placement_area:
@@ -153,43 +209,17 @@ def create_asset_placement(
             detail="Placement area is required",
         )
 
-    # Run placement algorithm
-    # Note: For production, this should be moved to a background task queue
-    result = place_assets(
-        placement_area=placement_area,
-        num_assets=placement_in.asset_count,
-        grid_resolution=placement_in.grid_resolution,
-        min_spacing=placement_in.min_spacing,
-        max_slope=placement_in.max_slope,
-        optimization_criteria=placement_in.optimization_criteria,
-        slope_raster_path=slope_raster_path,
-        exclusion_zones=exclusion_zones,
-        advanced_settings=placement_in.advanced_settings,
-        progress_callback=progress_callback,
+    # Inputs are validated here, while the request session is open; the run
+    # itself, including reading the exclusion zones, happens after the
+    # response is sent
+    background_tasks.add_task(
+        run_asset_placement,
+        placement.id,
+        placement_in,
+        placement_area,
+        slope_raster_path,
     )
 
-    # Convert result to dictionary format expected by CRUD
-    result_dict = {
-        "success": result.success,
-        "placed_positions": result.placed_positions,
-        "placement_details": result.placement_details,
-        "assets_placed": result.assets_placed,
-        "placement_success_rate": result.placement_success_rate,
-        "grid_cells_total": result.grid_cells_total,
-        "grid_cells_valid": result.grid_cells_valid,
-        "grid_cells_excluded": result.grid_cells_excluded,
-        "avg_slope": result.avg_slope,
-        "avg_inter_asset_distance": result.avg_inter_asset_distance,
-        "total_cut_fill_volume": result.total_cut_fill_volume,
-        "processing_time": result.processing_time,
-        "memory_peak_mb": result.memory_peak_mb,
-        "algorithm_iterations": result.algorithm_iterations,
-        "error_message": result.error_message,
-    }
-
-    # Update with results
-    placement = placement_crud.update_with_results(db, placement, result_dict)
-
     return placement_crud.to_response_dict(placement)
 
 
@@ -203,21 +233,61 @@ def list_asset_placements(
     current_user: Annotated[User, Depends(get_current_active_user)],
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from the previous page (preferred over page)"
+    ),
 ):
     """
-    List all asset placements for a project.
+    List all asset placements for a project, newest first.
+
+    Pass the returned next_cursor to fetch the following page; its cost does
+    not grow with depth. The page parameter is kept for existing clients and
+    is ignored when a cursor is given.
+
+    placement_details is omitted from list items; get the placement itself
+    for the per-asset details.
     """
     verify_project_access(db, project_id, current_user)
 
-    skip = (page - 1) * page_size
-    placements = placement_crud.get_by_project(
-        db, project_id=project_id, skip=skip, limit=page_size
-    )
     total = placement_crud.get_count_by_project(db, project_id=project_id)
+    if total == 0:
+        return {"placements": [], "total": 0, "next_cursor": None}
+
+    if cursor:
+        try:
+            after_created_at, after_id = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor",
+            )
+        placements = placement_crud.get_by_project_after(
+            db,
+            project_id=project_id,
+            after_created_at=after_created_at,
+            after_id=after_id,
+            limit=page_size,
+            include_details=False,
+        )
+    else:
+        skip = (page - 1) * page_size
+        placements = placement_crud.get_by_project(
+            db,
+            project_id=project_id,
+            skip=skip,
+            limit=page_size,
+            include_details=False,
+        )
+
+    next_cursor = None
+    if len(placements) == page_size:
+        last = placements[-1]
+        next_cursor = encode_cursor(last.created_at, last.id)
 
     return {
         "placements": [placement_crud.to_response_dict(p) for p in placements],
         "total": total,
+        "next_cursor": next_cursor,
     }
 
 
@@ -236,17 +306,14 @@ def get_asset_placement(
     """
     verify_project_access(db, project_id, current_user)
 
-    placement = placement_crud.get(db, placement_id=placement_id)
+    placement = placement_crud.get_for_project(
+        db, project_id=project_id, placement_id=placement_id
+    )
     if not placement:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Asset placement not found",
         )
-    if placement.project_id != project_id:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Asset placement not found in this project",
-        )
 
     return placement_crud.to_response_dict(placement)
 
@@ -267,31 +334,16 @@ def update_asset_placement(
     """
     verify_project_access(db, project_id, current_user)
 
-    placement = placement_crud.get(db, placement_id=placement_id)
+    placement = placement_crud.get_for_project(
+        db, project_id=project_id, placement_id=placement_id
+    )
     if not placement:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Asset placement not found",
         )
-    if placement.project_id != project_id:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Asset placement not found in this project",
-        )
 
-    # Update fields
-    if update_in.name is not None:
-        placement.name = update_in.name
-    if update_in.description is not None:
-        placement.description = update_in.description
-    if update_in.placement_details is not None:
-        placement = placement_crud.update_placement_details(
-            db, placement, update_in.placement_details
-        )
-
-    db.add(placement)
-    db.commit()
-    db.refresh(placement)
+    placement = placement_crud.update(db, placement, update_in)
 
     return placement_crud.to_response_dict(placement)
 
@@ -315,17 +367,14 @@ def adjust_assets(
     """
     verify_project_access(db, project_id, current_user)
 
-    placement = placement_crud.get(db, placement_id=placement_id)
+    placement = placement_crud.get_for_project(
+        db, project_id=project_id, placement_id=placement_id
+    )
     if not placement:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Asset placement not found",
         )
-    if placement.project_id != project_id:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Asset placement not found in this project",
-        )
 
     # Get current placement details
     if not placement.placement_details or "assets" not in placement.placement_details:
@@ -335,11 +384,13 @@ def adjust_assets(
         )
 
     assets = placement.placement_details["assets"]
+    # Index once; the dicts are shared, so updates land in assets
+    assets_by_id = {a["id"]: a for a in assets}
 
     # Apply adjustments
     for adjustment in adjustments.adjustments:
         # Find the asset by ID
-        asset = next((a for a in assets if a["id"] == adjustment.asset_id), None)
+        asset = assets_by_id.get(adjustment.asset_id)
         if not asset:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -375,17 +426,14 @@ def delete_asset_placement(
     """
     verify_project_access(db, project_id, current_user)
 
-    placement = placement_crud.get(db, placement_id=placement_id)
+    placement = placement_crud.get_for_project(
+        db, project_id=project_id, placement_id=placement_id
+    )
     if not placement:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Asset placement not found",
         )
-    if placement.project_id != project_id:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Asset placement not found in this project",
-        )
 
     placement_crud.delete(db, placement_id=placement_id)
     return None
@@ -1,15 +1,20 @@
+import re
 from datetime import timedelta
-from typing import Annotated
+from functools import lru_cache
+from typing import Annotated, Any, Optional
+from urllib.parse import quote, urlencode
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordRequestForm
 from google.auth.transport import requests as google_requests
 from google.oauth2 import id_token
 from sqlalchemy.orm import Session
 
 from app.api.dependencies import get_current_active_user
+from app.core.cache import LRUCache
 from app.core.config import settings
-from app.core.security import create_access_token
+from app.core.security import create_access_token, run_in_password_pool, verify_password
 from app.crud.user import user as user_crud
 from app.db.base import get_db
 from app.models.user import User
@@ -23,6 +28,64 @@ from app.schemas.auth import (
 
 router = APIRouter()
 
+# Used when Google's certs response carries no Cache-Control max-age
+GOOGLE_CERTS_DEFAULT_TTL = 3600
+_MAX_AGE = re.compile(r"max-age=(\d+)")
+
+
+class _CachedCertsRequest(google_requests.Request):
+    """google-auth transport that caches GET responses for their max-age.
+
+    verify_oauth2_token fetches Google's signing certificates on every call.
+    Google publishes new keys well before signing with them and marks the
+    response cacheable, so one fetch per max-age is enough. A single
+    instance also keeps the HTTP connection alive between logins.
+    """
+
+    def __init__(self, session: Any = None):
+        super().__init__(session=session)
+        self._responses = LRUCache(max_size=8, default_ttl=GOOGLE_CERTS_DEFAULT_TTL)
+
+    def __call__(
+        self,
+        url: str,
+        method: str = "GET",
+        body: Any = None,
+        headers: Any = None,
+        timeout: Any = 120,
+        **kwargs: Any,
+    ) -> Any:
+        if method != "GET":
+            return super().__call__(url, method, body, headers, timeout, **kwargs)
+
+        response = self._responses.get(url)
+        if response is None:
+            response = super().__call__(url, method, body, headers, timeout, **kwargs)
+            if response.status == status.HTTP_200_OK:
+                max_age = _MAX_AGE.search(response.headers.get("cache-control", ""))
+                ttl = int(max_age.group(1)) if max_age else None
+                if ttl != 0:
+                    self._responses.set(url, response, ttl)
+        return response
+
+
+_google_request = _CachedCertsRequest()
+
+
+@lru_cache(maxsize=4)
+def _google_authorization_url(client_id: str, redirect_uri: str) -> str:
+    """Build the Google OAuth authorization URL once per configuration."""
+    params = {
+        "client_id": client_id,
+        "response_type": "code",
+        "scope": "openid email profile",
+        "access_type": "offline",
+        "redirect_uri": redirect_uri,
+    }
+    return "https://accounts.google.com/o/oauth2/v2/auth?" + urlencode(
+        params, quote_via=quote
+    )
+
 
 @router.post(
     "/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED
@@ -47,8 +110,24 @@ def register(
     return user
 
 
+async def _authenticate(db: Session, email: str, password: str) -> Optional[User]:
+    """Authenticate a user by email and password.
+
+    The user is looked up on the request threadpool with the request's
+    Session; only the bcrypt check goes to the password pool, so a slow
+    database cannot hold the threads meant for hashing.
+    """
+    user = await run_in_threadpool(user_crud.get_by_email, db, email=email)
+    if not user or not user.hashed_password:
+        # Unknown user, or an OAuth user trying to log in with a password
+        return None
+    if not await run_in_password_pool(verify_password, password, user.hashed_password):
+        return None
+    return user
+
+
 @router.post("/login", response_model=Token)
-def login(
+async def login(
     db: Annotated[Session, Depends(get_db)],
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
 ):
@@ -57,10 +136,8 @@ def login(
 
     OAuth2 compatible token login, get an access token for future requests.
     """
-    # Authenticate user
-    user = user_crud.authenticate(
-        db, email=form_data.username, password=form_data.password
-    )
+    # Authenticate user (bcrypt runs on the password pool)
+    user = await _authenticate(db, form_data.username, form_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -85,15 +162,15 @@ def login(
 
 
 @router.post("/login/json", response_model=Token)
-def login_json(
+async def login_json(
     user_in: UserLogin,
     db: Annotated[Session, Depends(get_db)],
 ):
     """
     Login with JSON body (alternative to form-based login).
     """
-    # Authenticate user
-    user = user_crud.authenticate(db, email=user_in.email, password=user_in.password)
+    # Authenticate user (bcrypt runs on the password pool)
+    user = await _authenticate(db, user_in.email, user_in.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -175,7 +252,7 @@ def google_oauth(
         # Verify the token
         idinfo = id_token.verify_oauth2_token(
             oauth_request.code,
-            google_requests.Request(),
+            _google_request,
             settings.GOOGLE_CLIENT_ID,
         )
 
@@ -187,17 +264,13 @@ def google_oauth(
         # Check if user exists by Google ID
         user = user_crud.get_by_google_id(db, google_id=google_id)
 
+        link_google_account = False
         if not user:
             # Check if user exists by email (linking accounts)
             user = user_crud.get_by_email(db, email=email)
             if user:
-                # Link Google account to existing user
-                if not user.google_id:
-                    user.google_id = google_id
-                    user.oauth_provider = "google"
-                    db.add(user)
-                    db.commit()
-                    db.refresh(user)
+                # Link Google account to existing user (saved below)
+                link_google_account = not user.google_id
             else:
                 # Create new user
                 user = user_crud.create_oauth_user(
@@ -211,10 +284,19 @@ def google_oauth(
                 detail="Inactive user",
             )
 
+        user_id = user.id
+        if link_google_account:
+            user.google_id = google_id
+            user.oauth_provider = "google"
+            db.add(user)
+            # The commit expires user; nothing below reads it, so no reload
+            db.commit()
+            user_crud.invalidate_cached(user_id)
+
         # Create access token
         access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
         access_token = create_access_token(
-            data={"sub": str(user.id)}, expires_delta=access_token_expires
+            data={"sub": str(user_id)}, expires_delta=access_token_expires
         )
 
         return {"access_token": access_token, "token_type": "bearer"}
@@ -245,14 +327,8 @@ def google_authorize():
             detail="Google OAuth is not configured",
         )
 
-    # Build authorization URL
-    auth_url = (
-        "https://accounts.google.com/o/oauth2/v2/auth?"
-        f"client_id={settings.GOOGLE_CLIENT_ID}&"
-        "response_type=code&"
-        "scope=openid%20email%20profile&"
-        "access_type=offline&"
-        "redirect_uri=http://localhost:3000/auth/google/callback"
+    auth_url = _google_authorization_url(
+        settings.GOOGLE_CLIENT_ID, settings.GOOGLE_REDIRECT_URI
     )
 
     return {"authorization_url": auth_url}
@@ -1,14 +1,18 @@
-from pathlib import Path
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import shapely
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from geoalchemy2.shape import to_shape
 from sqlalchemy.orm import Session
 
 from app.api.dependencies import get_current_user, get_db
+from app.core.http_cache import etag_matches, make_etag, not_modified, set_cache_headers
+from app.core.storage import resolve_storage_path
 from app.crud.exclusion_zone import exclusion_zone as crud_exclusion_zone
 from app.crud.project import project as crud_project
 from app.crud.uploaded_file import uploaded_file as crud_uploaded_file
+from app.models.uploaded_file import FileStatus, UploadedFile
 from app.models.user import User
 from app.schemas.exclusion_zone import (
     BufferApplyRequest,
@@ -17,23 +21,25 @@ from app.schemas.exclusion_zone import (
     ExclusionZoneImportResponse,
     ExclusionZoneListResponse,
     ExclusionZoneResponse,
+    ExclusionZoneSummaryListResponse,
     ExclusionZoneUpdate,
     SpatialQueryRequest,
     SpatialQueryResponse,
 )
+from app.services.file_validation import GeometryResult, validate_file
 
 router = APIRouter()
 
 
 def verify_project_access(db: Session, project_id: UUID, user_id: UUID) -> None:
     """Verify user has access to the project."""
-    project = crud_project.get(db, project_id)
-    if not project:
+    owner_id = crud_project.get_owner_id(db, project_id=project_id)
+    if owner_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found",
         )
-    if project.user_id != user_id:
+    if owner_id != user_id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to access this project",
@@ -43,26 +49,66 @@ def verify_project_access(db: Session, project_id: UUID, user_id: UUID) -> None:
 @router.get("/{project_id}/zones", response_model=ExclusionZoneListResponse)
 def list_exclusion_zones(
     project_id: UUID,
+    request: Request,
+    response: Response,
     active_only: bool = True,
     zone_type: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """List all exclusion zones for a project."""
+    """List all exclusion zones for a project.
+
+    Answers 304 Not Modified when If-None-Match carries the current ETag.
+    """
     verify_project_access(db, project_id, current_user.id)
 
+    version = crud_exclusion_zone.get_version_by_project(db, project_id)
+    etag = make_etag(project_id, active_only, zone_type, *version)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    set_cache_headers(response, etag)
+
     zones = crud_exclusion_zone.get_by_project(
         db, project_id, active_only=active_only, zone_type=zone_type
     )
 
-    return ExclusionZoneListResponse(
-        zones=[
-            ExclusionZoneResponse(**crud_exclusion_zone.to_response_dict(zone))
-            for zone in zones
-        ],
-        total=len(zones),
+    return {
+        "zones": [crud_exclusion_zone.to_response_dict(zone) for zone in zones],
+        "total": len(zones),
+    }
+
+
+@router.get(
+    "/{project_id}/zones/summary", response_model=ExclusionZoneSummaryListResponse
+)
+def list_exclusion_zone_summaries(
+    project_id: UUID,
+    request: Request,
+    response: Response,
+    active_only: bool = True,
+    zone_type: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """List a project's exclusion zones without their geometries.
+
+    Each zone carries its bounding box instead, for list views; fetch a zone
+    to get its geometry. Answers 304 Not Modified like list_exclusion_zones.
+    """
+    verify_project_access(db, project_id, current_user.id)
+
+    version = crud_exclusion_zone.get_version_by_project(db, project_id)
+    etag = make_etag(project_id, "summary", active_only, zone_type, *version)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    set_cache_headers(response, etag)
+
+    zones = crud_exclusion_zone.get_summaries_by_project(
+        db, project_id, active_only=active_only, zone_type=zone_type
     )
 
+    return {"zones": zones, "total": len(zones)}
+
 
 @router.post(
     "/{project_id}/zones",
@@ -93,7 +139,33 @@ def create_exclusion_zone(
         fill_opacity=zone_data.fill_opacity,
     )
 
-    return ExclusionZoneResponse(**crud_exclusion_zone.to_response_dict(zone))
+    return crud_exclusion_zone.to_response_dict(zone)
+
+
+def _parse_uploaded_file(uploaded_file: UploadedFile) -> GeometryResult:
+    """Read an uploaded KML/KMZ file from disk and extract its geometry."""
+    try:
+        # Parse KML/KMZ content
+        validation_result = validate_file(resolve_storage_path(uploaded_file.file_path))
+
+        if not validation_result.is_valid or not validation_result.geometry_result:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid file: {validation_result.error_message}",
+            )
+
+        return validation_result.geometry_result
+
+    except FileNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="File not found on disk",
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error processing file: {str(e)}",
+        )
 
 
 @router.post(
@@ -124,88 +196,66 @@ def import_exclusion_zones(
             detail="Not authorized to access this file",
         )
 
-    # Read and parse the file
-    try:
-        with open(uploaded_file.file_path, "rb") as f:
-            file_content = f.read()
-
-        # Parse KML/KMZ content
-        from app.services.file_validation import validate_file
-
-        validation_result = validate_file(
-            Path(uploaded_file.file_path),
-            file_content,
-        )
-
-        if not validation_result.is_valid or not validation_result.geometry_result:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid file: {validation_result.error_message}",
-            )
-
-        geometry_result = validation_result.geometry_result
-
-    except FileNotFoundError:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="File not found on disk",
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error processing file: {str(e)}",
-        )
+    # Upload and revalidation already parsed the file and stored its geometry
+    # on the row, so only older or unparsed uploads are read from disk again
+    if (
+        uploaded_file.status == FileStatus.VALID
+        and uploaded_file.boundary_geom is not None
+    ):
+        geometry = to_shape(uploaded_file.boundary_geom)
+        description = uploaded_file.extracted_description
+    else:
+        geometry_result = _parse_uploaded_file(uploaded_file)
+        geometry = geometry_result.geometry
+        description = geometry_result.description
 
     # Create exclusion zone from geometry
     name_prefix = (
         import_data.name_prefix or uploaded_file.extracted_name or "Imported Zone"
     )
-    geometry = geometry_result.geometry
 
     # Handle multi-geometry by creating separate zones
-    zones_created = []
-    geometries_to_process = []
-
     if geometry.geom_type.startswith("Multi"):
         # Split multi-geometry into individual geometries
-        for i, geom in enumerate(geometry.geoms):
-            geometries_to_process.append((f"{name_prefix} {i + 1}", geom))
+        geometries_to_process = [
+            (f"{name_prefix} {i}", geom)
+            for i, geom in enumerate(shapely.get_parts(geometry), start=1)
+        ]
     else:
-        geometries_to_process.append((name_prefix, geometry))
-
-    for zone_name, geom in geometries_to_process:
-        zone = crud_exclusion_zone.create(
-            db=db,
-            project_id=project_id,
-            user_id=current_user.id,
-            name=zone_name,
-            zone_type=import_data.zone_type,
-            geometry=geom.__geo_interface__,
-            source="imported",
-            description=geometry_result.description,
-            buffer_distance=import_data.buffer_distance,
-            source_file_id=import_data.source_file_id,
-        )
-        zones_created.append(zone)
+        geometries_to_process = [(name_prefix, geometry)]
 
-    return ExclusionZoneImportResponse(
-        zones_created=len(zones_created),
-        zones=[
-            ExclusionZoneResponse(**crud_exclusion_zone.to_response_dict(zone))
-            for zone in zones_created
-        ],
-        message=f"Successfully imported {len(zones_created)} zone(s) from file",
+    zones_created = crud_exclusion_zone.create_many(
+        db=db,
+        project_id=project_id,
+        user_id=current_user.id,
+        zone_type=import_data.zone_type,
+        geometries=geometries_to_process,
+        source="imported",
+        description=description,
+        buffer_distance=import_data.buffer_distance,
+        source_file_id=import_data.source_file_id,
     )
 
+    return {
+        "zones_created": len(zones_created),
+        "zones": [crud_exclusion_zone.to_response_dict(zone) for zone in zones_created],
+        "message": f"Successfully imported {len(zones_created)} zone(s) from file",
+    }
+
 
 @router.get("/{project_id}/zones/{zone_id}", response_model=ExclusionZoneResponse)
 def get_exclusion_zone(
     project_id: UUID,
     zone_id: UUID,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """Get a specific exclusion zone."""
+    """Get a specific exclusion zone.
+
+    Answers 304 Not Modified when If-None-Match carries the current ETag.
+    """
     verify_project_access(db, project_id, current_user.id)
 
     zone = crud_exclusion_zone.get(db, zone_id)
@@ -215,7 +265,12 @@ def get_exclusion_zone(
             detail="Exclusion zone not found",
         )
 
-    return ExclusionZoneResponse(**crud_exclusion_zone.to_response_dict(zone))
+    etag = make_etag(zone.id, zone.updated_at or zone.created_at)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    set_cache_headers(response, etag)
+
+    return crud_exclusion_zone.to_response_dict(zone)
 
 
 @router.patch("/{project_id}/zones/{zone_id}", response_model=ExclusionZoneResponse)
@@ -249,7 +304,7 @@ def update_exclusion_zone(
         fill_opacity=zone_data.fill_opacity,
     )
 
-    return ExclusionZoneResponse(**crud_exclusion_zone.to_response_dict(zone))
+    return crud_exclusion_zone.to_response_dict(zone)
 
 
 @router.post(
@@ -274,7 +329,7 @@ def apply_buffer_to_zone(
 
     zone = crud_exclusion_zone.apply_buffer(db, zone, buffer_data.buffer_distance)
 
-    return ExclusionZoneResponse(**crud_exclusion_zone.to_response_dict(zone))
+    return crud_exclusion_zone.to_response_dict(zone)
 
 
 @router.delete(
@@ -298,7 +353,7 @@ def remove_buffer_from_zone(
 
     zone = crud_exclusion_zone.remove_buffer(db, zone)
 
-    return ExclusionZoneResponse(**crud_exclusion_zone.to_response_dict(zone))
+    return crud_exclusion_zone.to_response_dict(zone)
 
 
 @router.delete("/{project_id}/zones/{zone_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -327,21 +382,34 @@ def delete_exclusion_zone(
 def check_zone_intersection(
     project_id: UUID,
     query_data: SpatialQueryRequest,
+    only_check: bool = False,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """Check if a geometry intersects with any exclusion zones."""
+    """Check if a geometry intersects with any exclusion zones.
+
+    With only_check=true just `intersects` is answered; the intersecting zones
+    are not listed and total_intersecting is 0.
+    """
     verify_project_access(db, project_id, current_user.id)
 
+    if only_check:
+        return {
+            "intersects": crud_exclusion_zone.any_intersecting(
+                db, project_id, query_data.geometry
+            ),
+            "intersecting_zones": [],
+            "total_intersecting": 0,
+        }
+
     intersecting_zones = crud_exclusion_zone.find_intersecting(
         db, project_id, query_data.geometry
     )
 
-    return SpatialQueryResponse(
-        intersects=len(intersecting_zones) > 0,
-        intersecting_zones=[
-            ExclusionZoneResponse(**crud_exclusion_zone.to_response_dict(zone))
-            for zone in intersecting_zones
+    return {
+        "intersects": len(intersecting_zones) > 0,
+        "intersecting_zones": [
+            crud_exclusion_zone.to_response_dict(zone) for zone in intersecting_zones
         ],
-        total_intersecting=len(intersecting_zones),
-    )
+        "total_intersecting": len(intersecting_zones),
+    }
@@ -1,19 +1,31 @@
 """API endpoints for export and reporting functionality."""
 
-from typing import Annotated, Optional
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Annotated, Any, Callable, Optional, TypeVar
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response, StreamingResponse
+from sqlalchemy import func, literal, select, union_all
 from sqlalchemy.orm import Session
 
 from app.api.dependencies import get_current_active_user
+from app.core.cache import LRUCache
 from app.crud.asset_placement import asset_placement as placement_crud
 from app.crud.exclusion_zone import exclusion_zone as zone_crud
 from app.crud.project import project as project_crud
 from app.crud.road_network import road_network as road_crud
 from app.crud.terrain_analysis import terrain_analysis as terrain_crud
 from app.db.base import get_db
+from app.models.asset_placement import AssetPlacement
+from app.models.exclusion_zone import ExclusionZone
+from app.models.project import Project
+from app.models.road_network import RoadNetwork
+from app.models.terrain_analysis import TerrainAnalysis
 from app.models.user import User
 from app.schemas.export import (
     AvailableFormatsResponse,
@@ -27,12 +39,36 @@ from app.services.export_service import ExportService
 router = APIRouter()
 export_service = ExportService()
 
+# Users tend to export the same project in several formats in a row. The
+# gathered data is cached under a version of the project's rows (see
+# _project_data_version), so any change, from any worker, gives a new key.
+EXPORT_DATA_TTL = 300
+_export_data_cache = LRUCache(max_size=64, default_ttl=EXPORT_DATA_TTL)
+
+# PDF, KMZ, Shapefile and DXF generation is CPU-bound and can take seconds.
+# It runs on its own pool, one export per core, so a burst of exports waits
+# here instead of holding the threadpool that serves the sync endpoints.
+_export_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix="export"
+)
+
+T = TypeVar("T")
+
+# Characters replaced when a project name is used in export file names
+_FILE_NAME_TABLE = str.maketrans({" ": "_", "/": "_", "\\": "_"})
+
+
+async def run_in_export_pool(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a file generation call on the export pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_export_executor, partial(func, *args, **kwargs))
+
 
 def verify_project_access(
     db: Session,
     project_id: UUID,
     user: User,
-):
+) -> Project:
     """Verify user has access to the project and return project data."""
     project = project_crud.get(db, project_id=project_id)
     if not project:
@@ -48,23 +84,75 @@ def verify_project_access(
     return project
 
 
-def get_project_data(db: Session, project_id: UUID):
-    """Gather all project data for export."""
-    project = project_crud.get(db, project_id=project_id)
+def _project_data_version(db: Session, project_id: UUID) -> tuple:
+    """Row count and timestamp sum of each table exported with a project.
+
+    Inserts and deletes change the count; updates change the sum because
+    every update sets updated_at to the updating transaction's start time.
+    """
+    parts = []
+    for model in (TerrainAnalysis, AssetPlacement, RoadNetwork, ExclusionZone):
+        changed_at = func.coalesce(model.updated_at, model.created_at)
+        parts.append(
+            select(
+                literal(model.__tablename__),
+                func.count(),
+                func.sum(func.extract("epoch", changed_at)),
+            ).where(model.project_id == project_id)
+        )
+    return tuple(tuple(row) for row in db.execute(union_all(*parts)))
+
+
+def get_project_data(db: Session, project: Project) -> dict[str, Any]:
+    """Gather all project data for export.
+
+    Takes the project already loaded by verify_project_access. Results are
+    cached while the project's rows are unchanged; callers may replace
+    top-level keys but must not modify the nested data.
+    """
+    key = f"{project.id}:{project.updated_at}:{_project_data_version(db, project.id)}"
+    cached = _export_data_cache.get(key)
+    if cached is not None:
+        return dict(cached)
+
+    data = _load_project_data(db, project)
+    _export_data_cache.set(key, data)
+    return dict(data)
+
+
+def _get_export_data(
+    db: Session, project_id: UUID, current_user: User
+) -> dict[str, Any]:
+    """Check access and gather the project data for an export."""
+    project = verify_project_access(db, project_id, current_user)
+    return get_project_data(db, project)
+
 
-    # Get terrain analysis
-    terrain_analyses = terrain_crud.get_by_project(db, project_id=project_id)
+def _file_name(name: str) -> str:
+    """Lowercase a project name and make it safe to use in a file name."""
+    return name.translate(_FILE_NAME_TABLE).lower()
+
+
+def _load_project_data(db: Session, project: Project) -> dict[str, Any]:
+    """Read and serialize the project's terrain, placements, roads and zones."""
+    project_id = project.id
+
+    # Get the latest terrain analysis
+    terrain_analyses = terrain_crud.get_by_project(db, project_id=project_id, limit=1)
     terrain_data = None
     if terrain_analyses:
         terrain = terrain_analyses[0]  # Use the first/latest
         terrain_data = terrain_crud.to_response_dict(terrain)
 
     # Get asset placements
-    placements = placement_crud.get_by_project(db, project_id=project_id)
+    # Exports only read the details JSON, so the geometries are not loaded
+    placements = placement_crud.get_by_project(
+        db, project_id=project_id, include_geometry=False
+    )
     placements_data = [placement_crud.to_response_dict(p) for p in placements]
 
     # Get road networks
-    roads = road_crud.get_by_project(db, project_id=project_id)
+    roads = road_crud.get_by_project(db, project_id=project_id, include_geometry=False)
     roads_data = [road_crud.to_response_dict(r) for r in roads]
 
     # Get exclusion zones
@@ -72,7 +160,8 @@ def get_project_data(db: Session, project_id: UUID):
     zones_data = [zone_crud.to_response_dict(z) for z in zones]
 
     return {
-        "project": project_crud.to_response_dict(project) if project else {},
+        "project": project_crud.to_response_dict(project),
+        "project_name": _file_name(project.name or "project"),
         "terrain": terrain_data,
         "placements": placements_data,
         "roads": roads_data,
@@ -148,7 +237,7 @@ def get_available_formats(
     "/projects/{project_id}/exports/pdf",
     response_class=Response,
 )
-def export_pdf_report(
+async def export_pdf_report(
     project_id: UUID,
     db: Annotated[Session, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_active_user)],
@@ -164,8 +253,7 @@ def export_pdf_report(
     - Road network summary
     - Exclusion zone listing
     """
-    verify_project_access(db, project_id, current_user)
-    data = get_project_data(db, project_id)
+    data = await run_in_threadpool(_get_export_data, db, project_id, current_user)
 
     # Apply filters based on request
     if request:
@@ -178,7 +266,8 @@ def export_pdf_report(
         if not request.include_zones:
             data["zones"] = None
 
-    result = export_service.export_pdf_report(
+    result = await run_in_export_pool(
+        export_service.export_pdf_report,
         project=data["project"],
         terrain_analysis=data["terrain"],
         asset_placements=data["placements"],
@@ -192,8 +281,8 @@ def export_pdf_report(
             detail=result.error_message or "PDF generation failed",
         )
 
-    return Response(
-        content=result.file_content,
+    return StreamingResponse(
+        result.iter_content(),
         media_type=result.content_type,
         headers={"Content-Disposition": f'attachment; filename="{result.filename}"'},
     )
@@ -214,9 +303,9 @@ def export_geojson(
 
     Supports exporting individual layers (assets, roads, zones) or all layers combined.
     """
-    verify_project_access(db, project_id, current_user)
-    data = get_project_data(db, project_id)
-    project_name = data["project"].get("name", "project").replace(" ", "_").lower()
+    project = verify_project_access(db, project_id, current_user)
+    data = get_project_data(db, project)
+    project_name = data["project_name"]
 
     if layer == ExportLayer.ALL:
         result = export_service.export_geojson_combined(
@@ -256,7 +345,7 @@ def export_geojson(
     "/projects/{project_id}/exports/kmz",
     response_class=Response,
 )
-def export_kmz(
+async def export_kmz(
     project_id: UUID,
     db: Annotated[Session, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_active_user)],
@@ -271,15 +360,15 @@ def export_kmz(
     - Exclusion zones as polygons with transparency
     - 3D elevation data when available
     """
-    verify_project_access(db, project_id, current_user)
-    data = get_project_data(db, project_id)
-    project_name = data["project"].get("name", "project").replace(" ", "_").lower()
+    data = await run_in_threadpool(_get_export_data, db, project_id, current_user)
+    project_name = data["project_name"]
 
     placements = data["placements"] if (not request or request.include_assets) else None
     roads = data["roads"] if (not request or request.include_roads) else None
     zones = data["zones"] if (not request or request.include_zones) else None
 
-    result = export_service.export_kmz(
+    result = await run_in_export_pool(
+        export_service.export_kmz,
         project_name=project_name,
         placements=placements,
         road_networks=roads,
@@ -292,8 +381,8 @@ def export_kmz(
             detail=result.error_message or "KMZ export failed",
         )
 
-    return Response(
-        content=result.file_content,
+    return StreamingResponse(
+        result.iter_content(),
         media_type=result.content_type,
         headers={"Content-Disposition": f'attachment; filename="{result.filename}"'},
     )
@@ -303,7 +392,7 @@ def export_kmz(
     "/projects/{project_id}/exports/shapefile",
     response_class=Response,
 )
-def export_shapefile(
+async def export_shapefile(
     project_id: UUID,
     db: Annotated[Session, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_active_user)],
@@ -320,9 +409,8 @@ def export_shapefile(
     Note: Shapefiles export one geometry type at a time, so you must specify
     which layer to export (assets=points, roads=lines, zones=polygons).
     """
-    verify_project_access(db, project_id, current_user)
-    data = get_project_data(db, project_id)
-    project_name = data["project"].get("name", "project").replace(" ", "_").lower()
+    data = await run_in_threadpool(_get_export_data, db, project_id, current_user)
+    project_name = data["project_name"]
 
     if layer == ExportLayer.ALL:
         raise HTTPException(
@@ -330,13 +418,17 @@ def export_shapefile(
             detail="Shapefile export requires a specific layer",
         )
     elif layer == ExportLayer.ASSETS:
-        result = export_service.export_shapefile(
-            "assets", data["placements"], project_name
+        result = await run_in_export_pool(
+            export_service.export_shapefile, "assets", data["placements"], project_name
         )
     elif layer == ExportLayer.ROADS:
-        result = export_service.export_shapefile("roads", data["roads"], project_name)
+        result = await run_in_export_pool(
+            export_service.export_shapefile, "roads", data["roads"], project_name
+        )
     elif layer == ExportLayer.ZONES:
-        result = export_service.export_shapefile("zones", data["zones"], project_name)
+        result = await run_in_export_pool(
+            export_service.export_shapefile, "zones", data["zones"], project_name
+        )
     else:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -349,8 +441,8 @@ def export_shapefile(
             detail=result.error_message or "Shapefile export failed",
         )
 
-    return Response(
-        content=result.file_content,
+    return StreamingResponse(
+        result.iter_content(),
         media_type=result.content_type,
         headers={"Content-Disposition": f'attachment; filename="{result.filename}"'},
     )
@@ -376,9 +468,9 @@ def export_csv(
     - roads: Road segment details with lengths and grades
     - summary: Project overview with terrain, placement, and road statistics
     """
-    verify_project_access(db, project_id, current_user)
-    data = get_project_data(db, project_id)
-    project_name = data["project"].get("name", "project").replace(" ", "_").lower()
+    project = verify_project_access(db, project_id, current_user)
+    data = get_project_data(db, project)
+    project_name = data["project_name"]
 
     if data_type == "assets":
         result = export_service.export_csv("assets", data["placements"], project_name)
@@ -417,7 +509,7 @@ def export_csv(
     "/projects/{project_id}/exports/dxf",
     response_class=Response,
 )
-def export_dxf(
+async def export_dxf(
     project_id: UUID,
     db: Annotated[Session, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_active_user)],
@@ -434,15 +526,15 @@ def export_dxf(
 
     Coordinates are scaled from WGS84 degrees to meters (approximate).
     """
-    verify_project_access(db, project_id, current_user)
-    data = get_project_data(db, project_id)
-    project_name = data["project"].get("name", "project").replace(" ", "_").lower()
+    data = await run_in_threadpool(_get_export_data, db, project_id, current_user)
+    project_name = data["project_name"]
 
     placements = data["placements"] if (not request or request.include_assets) else None
     roads = data["roads"] if (not request or request.include_roads) else None
     zones = data["zones"] if (not request or request.include_zones) else None
 
-    result = export_service.export_dxf(
+    result = await run_in_export_pool(
+        export_service.export_dxf,
         project_name=project_name,
         placements=placements,
         road_networks=roads,
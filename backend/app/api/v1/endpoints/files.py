@@ -1,16 +1,18 @@
+import hashlib
 import os
-from pathlib import Path
-from typing import Annotated, Optional
-from uuid import UUID
+import re
+from typing import Annotated, BinaryIO, Optional
+from uuid import UUID, uuid4
 
 from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
 from sqlalchemy.orm import Session
 
 from app.api.dependencies import get_current_active_user
 from app.core.config import settings
+from app.core.storage import PendingFile, resolve_storage_path
 from app.crud.uploaded_file import uploaded_file as file_crud
 from app.db.base import get_db
-from app.models.uploaded_file import FileStatus
+from app.models.uploaded_file import FileStatus, UploadedFile
 from app.models.user import User
 from app.schemas.file import (
     FileAssignRequest,
@@ -24,8 +26,10 @@ from app.services.file_validation import validate_file
 router = APIRouter()
 
 # Ensure upload directory exists
-UPLOAD_DIR = Path(settings.UPLOAD_DIR)
-UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
+
+# Uploads are copied to disk in chunks of this size
+UPLOAD_CHUNK_SIZE = 1024 * 1024
 
 # Allowed file extensions
 ALLOWED_EXTENSIONS = {".kmz", ".kml"}
@@ -36,6 +40,9 @@ ALLOWED_MIME_TYPES = {
     "text/xml",
 }
 
+# Anything but letters, digits and "._-" (\w is str.isalnum() plus "_")
+_UNSAFE_FILENAME_RE = re.compile(r"[^\w.-]+")
+
 
 def validate_file_type(file: UploadFile) -> str:
     """Validate uploaded file type and return extension."""
@@ -44,7 +51,7 @@ def validate_file_type(file: UploadFile) -> str:
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Filename is required",
         )
-    file_ext = Path(file.filename).suffix.lower()
+    file_ext = os.path.splitext(file.filename)[1].lower()
     if file_ext not in ALLOWED_EXTENSIONS:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -55,27 +62,79 @@ def validate_file_type(file: UploadFile) -> str:
 
 def generate_safe_filename(original_filename: str) -> str:
     """Generate a safe filename from the original."""
-    return "".join(c for c in original_filename if c.isalnum() or c in "._-")
+    return _UNSAFE_FILENAME_RE.sub("", original_filename)
+
+
+def get_unique_filename(original_filename: str, file_type: str) -> str:
+    """Generate a unique stored filename that keeps the original's name."""
+    stem = os.path.splitext(os.path.basename(original_filename))[0]
+    safe_stem = generate_safe_filename(stem) or "upload"
+    return f"{safe_stem}-{uuid4().hex}.{file_type}"
 
 
-def get_unique_filepath(base_path: Path) -> Path:
-    """Generate a unique filepath, handling duplicates."""
-    if not base_path.exists():
-        return base_path
+def _save_upload(file: UploadFile, out: BinaryIO) -> tuple[int, bytes]:
+    """Copy an upload to out in chunks and return its size and SHA-256.
+
+    Uploads over MAX_UPLOAD_SIZE are rejected as soon as they pass it, so
+    the rest of an oversized file is never read or written.
+    """
+    file_size = 0
+    digest = hashlib.sha256()
+    while chunk := file.file.read(UPLOAD_CHUNK_SIZE):
+        file_size += len(chunk)
+        if file_size > settings.MAX_UPLOAD_SIZE:
+            max_mb = settings.MAX_UPLOAD_SIZE / (1024 * 1024)
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"File too large. Maximum size: {max_mb:.0f}MB",
+            )
+        digest.update(chunk)
+        out.write(chunk)
+    return file_size, digest.digest()
 
-    counter = 1
-    original_stem = base_path.stem
-    while True:
-        new_path = base_path.parent / f"{original_stem}_{counter}{base_path.suffix}"
-        if not new_path.exists():
-            return new_path
-        counter += 1
+
+def get_user_file(
+    db: Session, file_id: UUID, user: User, action: str = "access"
+) -> UploadedFile:
+    """Get an uploaded file, checking that it belongs to the user."""
+    file_obj = file_crud.get(db, file_id=file_id)
+
+    if not file_obj:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="File not found",
+        )
+
+    if file_obj.user_id != user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Not authorized to {action} this file",
+        )
+
+    return file_obj
+
+
+def _upload_response(db_file: UploadedFile) -> FileUploadResponse:
+    """Build the upload response for a stored and validated file."""
+    return FileUploadResponse(
+        id=db_file.id,
+        filename=db_file.stored_filename,
+        original_filename=db_file.original_filename,
+        file_type=db_file.file_type.value,
+        file_size=db_file.file_size,
+        status=db_file.status.value,
+        message=(
+            "File uploaded and validated successfully"
+            if db_file.status == FileStatus.VALID
+            else f"Validation failed: {db_file.validation_message}"
+        ),
+    )
 
 
 @router.post(
     "/upload", response_model=FileUploadResponse, status_code=status.HTTP_201_CREATED
 )
-async def upload_file(
+def upload_file(
     file: UploadFile = File(...),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
@@ -92,63 +151,62 @@ async def upload_file(
         # Validate file type
         file_type = validate_file_type(file)
 
-        # Read file content
-        contents = await file.read()
-        file_size = len(contents)
-
-        # Check file size
-        if file_size > settings.MAX_UPLOAD_SIZE:
-            max_mb = settings.MAX_UPLOAD_SIZE / (1024 * 1024)
-            raise HTTPException(
-                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                detail=f"File too large. Maximum size: {max_mb:.0f}MB",
+        # Uploads are stored flat, so the stored name is also the storage key
+        stored_filename = get_unique_filename(file.filename or "unnamed", file_type)
+        file_path = resolve_storage_path(stored_filename)
+
+        # Stream the upload to an unnamed file, hashing as it arrives. It
+        # only appears at file_path once complete and on disk, so neither a
+        # rejected upload nor a crash part way leaves a file behind.
+        with PendingFile() as pending:
+            file_size, content_hash = _save_upload(file, pending.file)
+
+            if file_size == 0:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="File is empty",
+                )
+
+            # An identical file the user already uploaded to the same project
+            # is returned as is: same bytes, same stored file and validation
+            existing = file_crud.get_by_hash(
+                db, current_user.id, content_hash, project_id=project_id
             )
-
-        if file_size == 0:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="File is empty",
-            )
-
-        # Generate safe filename and path
-        safe_filename = generate_safe_filename(file.filename or "unnamed")
-        file_path = get_unique_filepath(UPLOAD_DIR / safe_filename)
-
-        # Save file to disk
-        with open(file_path, "wb") as f:
-            f.write(contents)
+            if existing is not None:
+                return _upload_response(existing)
+            pending.publish(file_path)
 
         # Create database record
-        db_file = file_crud.create(
-            db=db,
-            user_id=current_user.id,
-            original_filename=file.filename or "unnamed",
-            stored_filename=file_path.name,
-            file_path=str(file_path.relative_to(UPLOAD_DIR)),
-            file_size=file_size,
-            file_type=file_type,
-            project_id=project_id,
-        )
+        try:
+            db_file = file_crud.create(
+                db=db,
+                user_id=current_user.id,
+                original_filename=file.filename or "unnamed",
+                stored_filename=stored_filename,
+                file_path=stored_filename,
+                file_size=file_size,
+                file_type=file_type,
+                project_id=project_id,
+            )
+        except Exception:
+            os.remove(file_path)
+            raise
+
+        # Validation depends only on the bytes, so reuse the results of any
+        # file with the same content instead of parsing it again
+        validated = file_crud.get_validated_by_hash(db, content_hash, file_type)
+        if validated is not None:
+            return _upload_response(
+                file_crud.copy_validation_result(db, db_file, validated)
+            )
 
         # Validate file geometry
-        validation_result = validate_file(file_path, contents)
+        validation_result = validate_file(file_path, content_hash)
 
         # Update database with validation results
         db_file = file_crud.update_validation_result(db, db_file, validation_result)
 
-        return FileUploadResponse(
-            id=db_file.id,
-            filename=db_file.stored_filename,
-            original_filename=db_file.original_filename,
-            file_type=db_file.file_type.value,
-            file_size=db_file.file_size,
-            status=db_file.status.value,
-            message=(
-                "File uploaded and validated successfully"
-                if db_file.status == FileStatus.VALID
-                else f"Validation failed: {db_file.validation_message}"
-            ),
-        )
+        return _upload_response(db_file)
 
     except HTTPException:
         raise
@@ -172,18 +230,13 @@ def list_files(
     """
     skip = (page - 1) * page_size
 
-    if project_id:
-        files = file_crud.get_by_project(
-            db, project_id=project_id, skip=skip, limit=page_size
-        )
-        # Verify user owns the project's files
-        files = [f for f in files if f.user_id == current_user.id]
-        total = len(files)
-    else:
-        files = file_crud.get_by_user(
-            db, user_id=current_user.id, skip=skip, limit=page_size
-        )
-        total = file_crud.get_count_by_user(db, user_id=current_user.id)
+    files, total = file_crud.list_page(
+        db,
+        user_id=current_user.id,
+        project_id=project_id,
+        skip=skip,
+        limit=page_size,
+    )
 
     return {
         "files": [file_crud.to_response_dict(f) for f in files],
@@ -202,19 +255,7 @@ def get_file(
     """
     Get details of a specific uploaded file.
     """
-    file_obj = file_crud.get(db, file_id=file_id)
-
-    if not file_obj:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="File not found",
-        )
-
-    if file_obj.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to access this file",
-        )
+    file_obj = get_user_file(db, file_id, current_user)
 
     return file_crud.to_response_dict(file_obj)
 
@@ -228,19 +269,7 @@ def get_file_validation(
     """
     Get validation details for an uploaded file.
     """
-    file_obj = file_crud.get(db, file_id=file_id)
-
-    if not file_obj:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="File not found",
-        )
-
-    if file_obj.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to access this file",
-        )
+    file_obj = get_user_file(db, file_id, current_user)
 
     return FileValidationResponse(
         id=file_obj.id,
@@ -256,7 +285,7 @@ def get_file_validation(
 
 
 @router.post("/{file_id}/revalidate", response_model=FileValidationResponse)
-async def revalidate_file(
+def revalidate_file(
     file_id: UUID,
     db: Annotated[Session, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_active_user)],
@@ -264,33 +293,17 @@ async def revalidate_file(
     """
     Re-validate an uploaded file.
     """
-    file_obj = file_crud.get(db, file_id=file_id)
-
-    if not file_obj:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="File not found",
-        )
-
-    if file_obj.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to access this file",
-        )
+    file_obj = get_user_file(db, file_id, current_user)
 
-    # Read file from disk
-    file_path = UPLOAD_DIR / file_obj.file_path
-    if not file_path.exists():
+    file_path = resolve_storage_path(file_obj.file_path)
+    if not os.path.exists(file_path):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="File no longer exists on disk",
         )
 
-    with open(file_path, "rb") as f:
-        contents = f.read()
-
     # Re-validate
-    validation_result = validate_file(file_path, contents)
+    validation_result = validate_file(file_path)
     file_obj = file_crud.update_validation_result(db, file_obj, validation_result)
 
     return FileValidationResponse(
@@ -316,31 +329,17 @@ def assign_file_to_project(
     """
     Assign an uploaded file to a project.
     """
-    file_obj = file_crud.get(db, file_id=file_id)
-
-    if not file_obj:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="File not found",
-        )
-
-    if file_obj.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to modify this file",
-        )
-
-    # Verify project exists and belongs to user
-    from app.crud.project import project as project_crud
-
-    project = project_crud.get(db, project_id=request.project_id)
-    if not project or project.user_id != current_user.id:
+    # Ownership of both the file and the project is checked by the UPDATE
+    file_obj = file_crud.assign_owned(db, file_id, request.project_id, current_user.id)
+    if file_obj is None:
+        # Report which check failed; a file that is the user's means the
+        # project is missing or someone else's
+        get_user_file(db, file_id, current_user, "modify")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found",
         )
 
-    file_obj = file_crud.assign_to_project(db, file_obj, request.project_id)
     return file_crud.to_response_dict(file_obj)
 
 
@@ -353,23 +352,11 @@ def delete_file(
     """
     Delete an uploaded file.
     """
-    file_obj = file_crud.get(db, file_id=file_id)
-
-    if not file_obj:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="File not found",
-        )
-
-    if file_obj.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to delete this file",
-        )
+    file_obj = get_user_file(db, file_id, current_user, "delete")
 
     # Delete file from disk
-    file_path = UPLOAD_DIR / file_obj.file_path
-    if file_path.exists():
+    file_path = resolve_storage_path(file_obj.file_path)
+    if os.path.exists(file_path):
         try:
             os.remove(file_path)
         except Exception:
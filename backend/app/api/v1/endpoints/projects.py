@@ -5,6 +5,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
 from app.api.dependencies import get_current_active_user
+from app.core.pagination import page_total
 from app.crud.project import project as project_crud
 from app.db.base import get_db
 from app.models.user import User
@@ -45,7 +46,12 @@ def list_projects(
     projects = project_crud.get_by_user(
         db, user_id=current_user.id, skip=skip, limit=page_size
     )
-    total = project_crud.get_count_by_user(db, user_id=current_user.id)
+    total = page_total(
+        skip,
+        page_size,
+        len(projects),
+        lambda: project_crud.get_count_by_user(db, user_id=current_user.id),
+    )
 
     return {
         "projects": [project_crud.to_response_dict(p) for p in projects],
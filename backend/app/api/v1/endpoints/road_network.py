@@ -8,12 +8,15 @@ from geoalchemy2.shape import to_shape
 from sqlalchemy.orm import Session
 
 from app.api.dependencies import get_current_active_user
+from app.core.pagination import page_total
+from app.core.storage import resolve_storage_path
 from app.crud.asset_placement import asset_placement as placement_crud
 from app.crud.exclusion_zone import exclusion_zone as zone_crud
 from app.crud.project import project as project_crud
 from app.crud.road_network import road_network as network_crud
 from app.crud.terrain_analysis import terrain_analysis as terrain_crud
 from app.db.base import get_db
+from app.models.project import Project
 from app.models.road_network import RoadNetworkStatus
 from app.models.user import User
 from app.schemas.road_network import (
@@ -32,8 +35,8 @@ def verify_project_access(
     db: Session,
     project_id: UUID,
     user: User,
-) -> None:
-    """Verify user has access to the project."""
+) -> Project:
+    """Verify user has access to the project and return it."""
     project = project_crud.get(db, project_id=project_id)
     if not project:
         raise HTTPException(
@@ -45,6 +48,7 @@ def verify_project_access(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to access this project",
         )
+    return project
 
 
 @router.post(
@@ -75,7 +79,7 @@ def create_road_network(
 
     Processing may take up to 60 seconds for complex sites.
     """
-    verify_project_access(db, project_id, current_user)
+    project = verify_project_access(db, project_id, current_user)
 
     # Validate terrain analysis if provided
     dem_path = None
@@ -93,7 +97,7 @@ def create_road_network(
             )
         # Use the DEM source path if available
         # Use slope raster for elevation sampling
-        dem_path = terrain.slope_raster_path
+        dem_path = resolve_storage_path(terrain.slope_raster_path)
 
     # Validate asset placement if provided
     asset_positions = []
@@ -122,6 +126,9 @@ def create_road_network(
             detail="No asset positions. Ensure asset placement completed.",
         )
 
+    # Read before the commit in create() expires the project
+    project_entry_point = project.entry_point_geom
+
     # Create road network record
     network = network_crud.create(
         db,
@@ -144,20 +151,14 @@ def create_road_network(
             entry_point = (coords[0], coords[1])
     else:
         # Try to get from project
-        project = project_crud.get(db, project_id=project_id)
-        if project and project.entry_point_geom:
-            entry_shape = to_shape(project.entry_point_geom)
+        if project_entry_point is not None:
+            entry_shape = to_shape(project_entry_point)
             entry_point = (entry_shape.x, entry_shape.y)
 
     # Get exclusion zones for the project
-    exclusion_zones_db = zone_crud.get_by_project(db, project_id, active_only=True)
-    exclusion_zones = []
-    for zone in exclusion_zones_db:
-        zone_dict = zone_crud.to_response_dict(zone)
-        # Use buffered geometry if available, otherwise use regular geometry
-        geom = zone_dict.get("buffered_geometry") or zone_dict.get("geometry")
-        if geom:
-            exclusion_zones.append(geom)
+    exclusion_zones = zone_crud.get_geometries_by_project(
+        db, project_id, active_only=True
+    )
 
     # Progress callback
     def progress_callback(percent: int, step: str):
@@ -232,7 +233,12 @@ def list_road_networks(
     networks = network_crud.get_by_project(
         db, project_id=project_id, skip=skip, limit=page_size
     )
-    total = network_crud.get_count_by_project(db, project_id=project_id)
+    total = page_total(
+        skip,
+        page_size,
+        len(networks),
+        lambda: network_crud.get_count_by_project(db, project_id=project_id),
+    )
 
     return {
         "road_networks": [network_crud.to_response_dict(n) for n in networks],
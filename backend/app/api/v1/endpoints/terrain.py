@@ -10,6 +10,8 @@ from sqlalchemy.orm import Session
 
 from app.api.dependencies import get_current_active_user
 from app.core.config import settings
+from app.core.pagination import page_total
+from app.core.storage import resolve_storage_path
 from app.crud.project import project as project_crud
 from app.crud.terrain_analysis import terrain_analysis as terrain_crud
 from app.crud.uploaded_file import uploaded_file as file_crud
@@ -44,13 +46,13 @@ def verify_project_access(
     user: User,
 ) -> None:
     """Verify user has access to the project."""
-    project = project_crud.get(db, project_id=project_id)
-    if not project:
+    owner_id = project_crud.get_owner_id(db, project_id=project_id)
+    if owner_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found",
         )
-    if project.user_id != user.id:
+    if owner_id != user.id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to access this project",
@@ -105,7 +107,7 @@ def request_terrain_analysis(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Not authorized to access this file",
             )
-        dem_path = uploaded_file.file_path
+        dem_path = resolve_storage_path(uploaded_file.file_path)
     elif analysis_in.dem_url:
         # TODO: Download DEM from URL
         raise HTTPException(
@@ -119,7 +121,7 @@ def request_terrain_analysis(
         if analysis_in.bounds
         else None
     )
-    input_hash = calculate_input_hash(dem_path, bounds_tuple) if dem_path else ""
+    input_hash = calculate_input_hash(dem_path, bounds_tuple) if dem_path else b""
     cached = terrain_crud.get_by_input_hash(db, project_id, input_hash)
 
     if cached:
@@ -181,7 +183,12 @@ def list_terrain_analyses(
     analyses = terrain_crud.get_by_project(
         db, project_id=project_id, skip=skip, limit=page_size
     )
-    total = terrain_crud.get_count_by_project(db, project_id=project_id)
+    total = page_total(
+        skip,
+        page_size,
+        len(analyses),
+        lambda: terrain_crud.get_count_by_project(db, project_id=project_id),
+    )
 
     return {
         "analyses": [terrain_crud.to_response_dict(a) for a in analyses],
@@ -247,11 +254,12 @@ def delete_terrain_analysis(
         )
 
     # Delete associated raster files
-    for path in [
+    for key in [
         analysis.slope_raster_path,
         analysis.aspect_raster_path,
         analysis.hillshade_raster_path,
     ]:
+        path = resolve_storage_path(key)
         if path and os.path.exists(path):
             try:
                 os.remove(path)
@@ -305,7 +313,7 @@ def download_terrain_raster(
             detail=f"Invalid raster type. Must be one of: {valid_types}",
         )
 
-    raster_path = raster_paths[raster_type]
+    raster_path = resolve_storage_path(raster_paths[raster_type])
     if not raster_path or not os.path.exists(raster_path):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -359,7 +367,7 @@ def get_terrain_profile_endpoint(
     start_pt: tuple[float, float] = (request.start_point[0], request.start_point[1])
     end_pt: tuple[float, float] = (request.end_point[0], request.end_point[1])
     profile = get_terrain_profile(
-        dem_path=uploaded_file.file_path,
+        dem_path=resolve_storage_path(uploaded_file.file_path),
         start_point=start_pt,
         end_point=end_pt,
         num_samples=request.num_samples,
@@ -406,6 +414,8 @@ def get_elevations_at_points(
         )
 
     points = [(p[0], p[1]) for p in request.points]
-    elevations = get_elevation_at_points(uploaded_file.file_path, points)
+    elevations = get_elevation_at_points(
+        resolve_storage_path(uploaded_file.file_path), points
+    )
 
     return {"elevations": elevations}
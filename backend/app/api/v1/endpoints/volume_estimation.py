@@ -8,6 +8,8 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
 from app.api.dependencies import get_current_active_user
+from app.core.pagination import page_total
+from app.core.storage import resolve_storage_path
 from app.crud.asset_placement import asset_placement as placement_crud
 from app.crud.project import project as project_crud
 from app.crud.road_network import road_network as road_crud
@@ -36,13 +38,13 @@ def verify_project_access(
     user: User,
 ) -> None:
     """Verify user has access to the project."""
-    project = project_crud.get(db, project_id=project_id)
-    if not project:
+    owner_id = project_crud.get_owner_id(db, project_id=project_id)
+    if owner_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found",
         )
-    if project.user_id != user.id:
+    if owner_id != user.id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to access this project",
@@ -56,13 +58,13 @@ def calculate_input_hash(
     grid_resolution: float,
     foundation_type: str,
     road_width: float,
-) -> str:
+) -> bytes:
     """Calculate hash of input parameters for caching."""
     hash_input = (
         f"{terrain_id}:{placement_id}:{road_id}:"
         f"{grid_resolution:.2f}:{foundation_type}:{road_width:.2f}"
     )
-    return hashlib.sha256(hash_input.encode()).hexdigest()
+    return hashlib.sha256(hash_input.encode()).digest()
 
 
 @router.post(
@@ -132,7 +134,7 @@ def request_volume_estimation(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="DEM file not found",
         )
-    dem_path = uploaded_file.file_path
+    dem_path = resolve_storage_path(uploaded_file.file_path)
 
     # Get asset positions if provided
     asset_positions = []
@@ -262,7 +264,12 @@ def list_volume_estimations(
     estimations = volume_crud.get_by_project(
         db, project_id=project_id, skip=skip, limit=page_size
     )
-    total = volume_crud.get_count_by_project(db, project_id=project_id)
+    total = page_total(
+        skip,
+        page_size,
+        len(estimations),
+        lambda: volume_crud.get_count_by_project(db, project_id=project_id),
+    )
 
     return {
         "estimations": [volume_crud.to_response_dict(e) for e in estimations],
@@ -4,6 +4,7 @@ For production, consider Redis or similar distributed cache.
 """
 
 import hashlib
+import threading
 import time
 from collections import OrderedDict
 from functools import wraps
@@ -11,12 +12,14 @@ from typing import Any, Callable, Optional
 
 
 class LRUCache:
-    """Simple LRU cache with TTL support."""
+    """Simple LRU cache with TTL support, safe to share between threads."""
 
     def __init__(self, max_size: int = 1000, default_ttl: int = 300):
         self.max_size = max_size
         self.default_ttl = default_ttl
         self._cache: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+        # Sync endpoints and dependencies run in FastAPI's threadpool
+        self._lock = threading.Lock()
 
     def _make_key(self, *args: Any, **kwargs: Any) -> str:
         """Generate a cache key from arguments."""
@@ -25,45 +28,50 @@ class LRUCache:
 
     def get(self, key: str) -> Optional[Any]:
         """Get a value from cache if not expired."""
-        if key not in self._cache:
-            return None
+        with self._lock:
+            if key not in self._cache:
+                return None
 
-        value, expiry = self._cache[key]
-        if time.time() > expiry:
-            del self._cache[key]
-            return None
+            value, expiry = self._cache[key]
+            if time.time() > expiry:
+                del self._cache[key]
+                return None
 
-        # Move to end (most recently used)
-        self._cache.move_to_end(key)
-        return value
+            # Move to end (most recently used)
+            self._cache.move_to_end(key)
+            return value
 
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         """Set a value in cache with TTL."""
         ttl = ttl or self.default_ttl
         expiry = time.time() + ttl
 
-        if key in self._cache:
-            self._cache.move_to_end(key)
-        self._cache[key] = (value, expiry)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+            self._cache[key] = (value, expiry)
 
-        # Evict oldest items if over capacity
-        while len(self._cache) > self.max_size:
-            self._cache.popitem(last=False)
+            # Evict oldest items if over capacity
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
 
     def delete(self, key: str) -> None:
         """Delete a key from cache."""
-        self._cache.pop(key, None)
+        with self._lock:
+            self._cache.pop(key, None)
 
     def clear(self) -> None:
         """Clear all cache entries."""
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
 
     def invalidate_pattern(self, pattern: str) -> int:
         """Invalidate all keys matching a pattern (simple prefix match)."""
-        keys_to_delete = [k for k in self._cache.keys() if k.startswith(pattern)]
-        for key in keys_to_delete:
-            del self._cache[key]
-        return len(keys_to_delete)
+        with self._lock:
+            keys_to_delete = [k for k in self._cache.keys() if k.startswith(pattern)]
+            for key in keys_to_delete:
+                del self._cache[key]
+            return len(keys_to_delete)
 
 
 # Global cache instance
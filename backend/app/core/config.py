@@ -40,6 +40,7 @@ class Settings(BaseSettings):
     # Google OAuth (optional)
     GOOGLE_CLIENT_ID: str = ""
     GOOGLE_CLIENT_SECRET: str = ""
+    GOOGLE_REDIRECT_URI: str = "http://localhost:3000/auth/google/callback"
 
     # File uploads
     MAX_UPLOAD_SIZE: int = 50 * 1024 * 1024  # 50MB
@@ -0,0 +1,46 @@
+"""
+Conditional GET support.
+
+Responses carry a strong ETag and ``Cache-Control: private, no-cache``: the
+browser keeps its copy but revalidates on every use, and the endpoint
+answers 304 Not Modified without serializing the body when nothing changed.
+"""
+
+import hashlib
+from typing import Any
+
+from fastapi import Request, Response, status
+
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts: Any) -> str:
+    """Build a quoted strong ETag from the values that determine a response."""
+    raw = ":".join(str(part) for part in parts).encode()
+    return '"' + hashlib.blake2b(raw, digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match already names this ETag."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison
+    candidates = (tag.strip().removeprefix("W/") for tag in header.split(","))
+    return etag in candidates
+
+
+def not_modified(etag: str) -> Response:
+    """A 304 response carrying the validator and caching policy."""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL},
+    )
+
+
+def set_cache_headers(response: Response, etag: str) -> None:
+    """Attach the validator and caching policy to a full response."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
@@ -0,0 +1,40 @@
+"""
+Pagination helpers.
+
+A keyset cursor is the ``(created_at, id)`` of the last row on the previous
+page, encoded as an opaque URL-safe string. The next page is read with
+``WHERE (created_at, id) < (:created_at, :id)`` so its cost does not grow
+with page depth the way OFFSET does.
+"""
+
+import base64
+from datetime import datetime
+from typing import Callable
+from uuid import UUID
+
+
+def encode_cursor(created_at: datetime, row_id: UUID) -> str:
+    """Encode the sort key of the last returned row."""
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decode a cursor from encode_cursor; raises ValueError if malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = base64.urlsafe_b64decode(padded).decode().split("|")
+        return datetime.fromisoformat(created_at), UUID(row_id)
+    except (UnicodeDecodeError, ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def page_total(skip: int, limit: int, page_len: int, count: Callable[[], int]) -> int:
+    """Return the total row count for an OFFSET/LIMIT page.
+
+    A short page is the last one, so the total is skip + page_len and
+    ``count`` is only called for full pages and pages past the end.
+    """
+    if page_len < limit and (page_len > 0 or skip == 0):
+        return skip + page_len
+    return count()
@@ -1,13 +1,38 @@
+import asyncio
+import hashlib
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
-from typing import Optional
+from functools import partial
+from typing import Any, Callable, Optional, TypeVar
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
+from app.core.cache import LRUCache
 from app.core.config import settings
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt is CPU bound and releases the GIL, so one thread per core is enough.
+# A separate pool keeps login bursts from using up the threadpool that runs
+# every sync endpoint.
+_password_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix="password"
+)
+
+T = TypeVar("T")
+
+# Verified token payloads, each kept until the token itself expires. Keyed
+# by a digest so the cache holds neither full tokens nor usable bearer
+# credentials.
+_token_cache = LRUCache(max_size=10_000)
+
+
+def _token_key(token: str) -> str:
+    return hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
@@ -19,6 +44,14 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+async def run_in_password_pool(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a call that hashes or verifies passwords on the password pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _password_executor, partial(func, *args, **kwargs)
+    )
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token."""
     to_encode = data.copy()
@@ -37,11 +70,27 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
 
 
 def decode_access_token(token: str) -> Optional[dict]:
-    """Decode and verify a JWT access token."""
+    """Decode and verify a JWT access token.
+
+    A client sends the same token on every request, so successful decodes
+    are cached for the token's remaining lifetime; a cached payload is
+    therefore never served past its exp claim.
+    """
+    key = _token_key(token)
+    payload = _token_cache.get(key)
+    if payload is not None:
+        return payload
+
     try:
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
         )
-        return payload
     except JWTError:
         return None
+
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        remaining = int(exp - time.time())
+        if remaining > 0:
+            _token_cache.set(key, payload, ttl=remaining)
+    return payload
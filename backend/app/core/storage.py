@@ -0,0 +1,133 @@
+"""
+Storage keys for files kept under UPLOAD_DIR.
+
+File paths are stored in the database relative to settings.UPLOAD_DIR, so
+rows carry only the short per-file part and the shared base path lives in
+configuration. Resolve a key before opening the file.
+"""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from types import TracebackType
+from typing import BinaryIO, Optional, overload
+
+from app.core.config import settings
+
+
+def storage_key(path: Optional[str | Path]) -> Optional[str]:
+    """Return ``path`` relative to UPLOAD_DIR for storing in the database."""
+    if not path:
+        return None
+    root = os.path.abspath(settings.UPLOAD_DIR)
+    absolute = os.path.abspath(path)
+    if os.path.commonpath([root, absolute]) != root:
+        return str(path)
+    return os.path.relpath(absolute, root)
+
+
+@overload
+def resolve_storage_path(key: str) -> str: ...
+
+
+@overload
+def resolve_storage_path(key: None) -> None: ...
+
+
+@overload
+def resolve_storage_path(key: Optional[str]) -> Optional[str]: ...
+
+
+def resolve_storage_path(key: Optional[str]) -> Optional[str]:
+    """Return the filesystem path for a stored key (absolute keys pass through)."""
+    if not key:
+        return None
+    return os.path.join(settings.UPLOAD_DIR, key)
+
+
+class PendingFile:
+    """A file written in a directory that only gets its name once complete.
+
+    On Linux it is opened with O_TMPFILE, so it has no directory entry until
+    publish() links it in (or copies it, where linking through /proc is not
+    allowed), and the kernel drops it on close if it never was. Elsewhere a
+    hidden temporary file is linked into place instead, and removed on close
+    if it was not published.
+    """
+
+    def __init__(self, directory: Optional[str] = None) -> None:
+        directory = directory or settings.UPLOAD_DIR
+        self._directory = directory
+        self._temp_path: Optional[str] = None
+        try:
+            fd = os.open(directory, os.O_TMPFILE | os.O_RDWR, 0o644)
+        except (AttributeError, OSError):
+            # No O_TMPFILE on this platform or filesystem
+            fd, self._temp_path = tempfile.mkstemp(dir=directory, prefix=".pending-")
+            os.fchmod(fd, 0o644)
+        self.file: BinaryIO = os.fdopen(fd, "w+b")
+
+    def publish(self, path: str) -> None:
+        """Flush the contents to disk, then give the file its name at path.
+
+        path must be in the directory the file was created in. Raises
+        FileExistsError if it is taken.
+        """
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        if self._temp_path is None:
+            try:
+                os.link(f"/proc/self/fd/{self.file.fileno()}", path)
+            except FileExistsError:
+                raise
+            except OSError:
+                # /proc is not mounted, or the kernel will not link through it
+                self._copy_to(path)
+        else:
+            os.link(self._temp_path, path)
+            os.remove(self._temp_path)
+            self._temp_path = None
+
+        # The new name is a directory entry; sync the directory so it
+        # survives a crash along with the contents
+        dir_fd = os.open(self._directory, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+    def _copy_to(self, path: str) -> None:
+        """Copy the contents to a new file and link it in at path once synced."""
+        fd, copy_path = tempfile.mkstemp(dir=self._directory, prefix=".pending-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                os.fchmod(f.fileno(), 0o644)
+                self.file.seek(0)
+                shutil.copyfileobj(self.file, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.link(copy_path, path)
+        finally:
+            os.remove(copy_path)
+
+    def close(self) -> None:
+        """Close the file, discarding it unless it was published."""
+        self.file.close()
+        if self._temp_path is not None:
+            try:
+                os.remove(self._temp_path)
+            except FileNotFoundError:
+                pass
+            self._temp_path = None
+
+    def __enter__(self) -> "PendingFile":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
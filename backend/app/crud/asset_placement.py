@@ -1,15 +1,38 @@
 """CRUD operations for asset placement."""
 
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import Any, Optional
 from uuid import UUID
 
 from geoalchemy2.shape import from_shape, to_shape
 from shapely.geometry import MultiPoint, mapping, shape
-from sqlalchemy.orm import Session
+from sqlalchemy import inspect, literal, tuple_
+from sqlalchemy.orm import Session, defer
 
+from app.core.cache import LRUCache
 from app.models.asset_placement import AssetPlacement, PlacementStatus
-from app.schemas.asset_placement import AssetPlacementCreate, PlacementStatistics
+from app.schemas.asset_placement import (
+    AssetPlacementCreate,
+    AssetPlacementUpdate,
+    PlacementStatistics,
+)
+
+# The list endpoint counts a project's placements on every page; keep recent
+# counts briefly. Create and delete drop the entry in this process, other
+# workers catch up within the TTL.
+PLACEMENT_COUNT_TTL = 30
+_count_cache = LRUCache(max_size=10_000, default_ttl=PLACEMENT_COUNT_TTL)
+
+
+# placement_details holds every placed asset; list pages leave it unloaded.
+# raiseload turns an accidental access into an error instead of a query.
+_DEFER_DETAILS = defer(AssetPlacement.placement_details, raiseload=True)
+
+# Exports read placements from placement_details, not from the geometries.
+_DEFER_GEOMETRY = (
+    defer(AssetPlacement.placement_area, raiseload=True),
+    defer(AssetPlacement.placed_assets, raiseload=True),
+)
 
 
 class CRUDAssetPlacement:
@@ -19,30 +42,88 @@ class CRUDAssetPlacement:
             db.query(AssetPlacement).filter(AssetPlacement.id == placement_id).first()
         )
 
+    def get_for_project(
+        self, db: Session, project_id: UUID, placement_id: UUID
+    ) -> Optional[AssetPlacement]:
+        """Get an asset placement by ID if it belongs to the project."""
+        return (
+            db.query(AssetPlacement)
+            .filter(
+                AssetPlacement.id == placement_id,
+                AssetPlacement.project_id == project_id,
+            )
+            .first()
+        )
+
     def get_by_project(
         self,
         db: Session,
         project_id: UUID,
         skip: int = 0,
         limit: int = 100,
+        include_details: bool = True,
+        include_geometry: bool = True,
     ) -> list[AssetPlacement]:
-        """Get all asset placements for a project."""
+        """Get all asset placements for a project.
+
+        With include_details=False the per-asset placement_details JSONB is
+        not loaded; with include_geometry=False neither are placement_area
+        and placed_assets.
+        """
+        query = db.query(AssetPlacement)
+        if not include_details:
+            query = query.options(_DEFER_DETAILS)
+        if not include_geometry:
+            query = query.options(*_DEFER_GEOMETRY)
         return (
-            db.query(AssetPlacement)
-            .filter(AssetPlacement.project_id == project_id)
-            .order_by(AssetPlacement.created_at.desc())
+            query.filter(AssetPlacement.project_id == project_id)
+            .order_by(AssetPlacement.created_at.desc(), AssetPlacement.id.desc())
             .offset(skip)
             .limit(limit)
             .all()
         )
 
-    def get_count_by_project(self, db: Session, project_id: UUID) -> int:
-        """Get count of placements for a project."""
+    def get_by_project_after(
+        self,
+        db: Session,
+        project_id: UUID,
+        after_created_at: datetime,
+        after_id: UUID,
+        limit: int = 100,
+        include_details: bool = True,
+    ) -> list[AssetPlacement]:
+        """Get the placements that follow (after_created_at, after_id) in list order."""
+        query = db.query(AssetPlacement)
+        if not include_details:
+            query = query.options(_DEFER_DETAILS)
         return (
+            query.filter(
+                AssetPlacement.project_id == project_id,
+                tuple_(AssetPlacement.created_at, AssetPlacement.id)
+                < tuple_(literal(after_created_at), literal(after_id)),
+            )
+            .order_by(AssetPlacement.created_at.desc(), AssetPlacement.id.desc())
+            .limit(limit)
+            .all()
+        )
+
+    def get_count_by_project(self, db: Session, project_id: UUID) -> int:
+        """Get count of placements for a project (cached for a few seconds)."""
+        key = str(project_id)
+        cached = _count_cache.get(key)
+        if cached is not None:
+            return cached
+
+        count = (
             db.query(AssetPlacement)
             .filter(AssetPlacement.project_id == project_id)
             .count()
         )
+        # Zero is not cached: the list endpoint skips its query on zero, so a
+        # stale zero from another worker would hide new placements
+        if count:
+            _count_cache.set(key, count)
+        return count
 
     def create(
         self,
@@ -78,6 +159,7 @@ class CRUDAssetPlacement:
         )
         db.add(db_obj)
         db.commit()
+        _count_cache.delete(str(project_id))
         db.refresh(db_obj)
         return db_obj
 
@@ -97,9 +179,9 @@ class CRUDAssetPlacement:
         db_obj.error_message = error_message
 
         if status == PlacementStatus.PROCESSING and db_obj.started_at is None:
-            db_obj.started_at = datetime.utcnow()
+            db_obj.started_at = datetime.now(UTC)
         elif status in (PlacementStatus.COMPLETED, PlacementStatus.FAILED):
-            db_obj.completed_at = datetime.utcnow()
+            db_obj.completed_at = datetime.now(UTC)
 
         db.add(db_obj)
         db.commit()
@@ -117,7 +199,7 @@ class CRUDAssetPlacement:
             db_obj.status = PlacementStatus.COMPLETED
             db_obj.progress_percent = 100
             db_obj.current_step = "completed"
-            db_obj.completed_at = datetime.utcnow()
+            db_obj.completed_at = datetime.now(UTC)
 
             # Store placed assets as MultiPoint geometry
             if result.get("placed_positions"):
@@ -149,7 +231,7 @@ class CRUDAssetPlacement:
         else:
             db_obj.status = PlacementStatus.FAILED
             db_obj.error_message = result.get("error_message", "Unknown error")
-            db_obj.completed_at = datetime.utcnow()
+            db_obj.completed_at = datetime.now(UTC)
             db_obj.processing_time_seconds = result.get("processing_time", 0.0)
 
         db.add(db_obj)
@@ -157,13 +239,10 @@ class CRUDAssetPlacement:
         db.refresh(db_obj)
         return db_obj
 
-    def update_placement_details(
-        self,
-        db: Session,
-        db_obj: AssetPlacement,
-        placement_details: dict[str, Any],
-    ) -> AssetPlacement:
-        """Update placement details (for manual adjustments)."""
+    def _set_placement_details(
+        self, db_obj: AssetPlacement, placement_details: dict[str, Any]
+    ) -> None:
+        """Set placement details and the MultiPoint derived from them."""
         db_obj.placement_details = placement_details
 
         # Update the MultiPoint geometry from the adjusted positions
@@ -174,6 +253,34 @@ class CRUDAssetPlacement:
                 db_obj.placed_assets = from_shape(multipoint, srid=4326)
                 db_obj.assets_placed = len(positions)
 
+    def update(
+        self,
+        db: Session,
+        db_obj: AssetPlacement,
+        update_in: AssetPlacementUpdate,
+    ) -> AssetPlacement:
+        """Update name, description and/or placement details in one commit."""
+        if update_in.name is not None:
+            db_obj.name = update_in.name
+        if update_in.description is not None:
+            db_obj.description = update_in.description
+        if update_in.placement_details is not None:
+            self._set_placement_details(db_obj, update_in.placement_details)
+
+        db.add(db_obj)
+        db.commit()
+        db.refresh(db_obj)
+        return db_obj
+
+    def update_placement_details(
+        self,
+        db: Session,
+        db_obj: AssetPlacement,
+        placement_details: dict[str, Any],
+    ) -> AssetPlacement:
+        """Update placement details (for manual adjustments)."""
+        self._set_placement_details(db_obj, placement_details)
+
         db.add(db_obj)
         db.commit()
         db.refresh(db_obj)
@@ -183,8 +290,10 @@ class CRUDAssetPlacement:
         """Delete an asset placement."""
         placement = self.get(db, placement_id)
         if placement:
+            project_id = placement.project_id
             db.delete(placement)
             db.commit()
+            _count_cache.delete(str(project_id))
             return True
         return False
 
@@ -211,7 +320,7 @@ class CRUDAssetPlacement:
             "advanced_settings": placement.advanced_settings,
             "placement_area": None,
             "placed_assets": None,
-            "placement_details": placement.placement_details,
+            "placement_details": None,
             "statistics": None,
             "processing_time_seconds": placement.processing_time_seconds,
             "memory_peak_mb": placement.memory_peak_mb,
@@ -222,8 +331,13 @@ class CRUDAssetPlacement:
             "completed_at": placement.completed_at,
         }
 
+        # Left unloaded by list and export queries
+        unloaded = inspect(placement).unloaded
+        if "placement_details" not in unloaded:
+            result["placement_details"] = placement.placement_details
+
         # Convert placement area to GeoJSON
-        if placement.placement_area is not None:
+        if "placement_area" not in unloaded and placement.placement_area is not None:
             try:
                 shape_obj = to_shape(placement.placement_area)
                 result["placement_area"] = mapping(shape_obj)
@@ -231,7 +345,7 @@ class CRUDAssetPlacement:
                 pass
 
         # Convert placed assets to GeoJSON
-        if placement.placed_assets is not None:
+        if "placed_assets" not in unloaded and placement.placed_assets is not None:
             try:
                 shape_obj = to_shape(placement.placed_assets)
                 result["placed_assets"] = mapping(shape_obj)
@@ -1,14 +1,24 @@
+import json
+from collections.abc import Iterator
 from typing import Any, Optional
 from uuid import UUID
 
-from geoalchemy2.functions import ST_Area, ST_Buffer, ST_Intersects, ST_Transform
+from geoalchemy2.functions import ST_Intersects
 from geoalchemy2.shape import from_shape, to_shape
 from shapely.geometry import mapping, shape
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from shapely.geometry.base import BaseGeometry
+from sqlalchemy import func, select
+from sqlalchemy.orm import Query, Session, defer
 
 from app.models.exclusion_zone import ExclusionZone, ZoneSource, ZoneType
 
+# Summaries report the geometry type and bounding box computed by PostGIS.
+# raiseload turns an accidental access into an error instead of a query.
+_DEFER_GEOMETRY = (
+    defer(ExclusionZone.geometry, raiseload=True),
+    defer(ExclusionZone.buffered_geometry, raiseload=True),
+)
+
 
 class CRUDExclusionZone:
     def get(self, db: Session, zone_id: UUID) -> Optional[ExclusionZone]:
@@ -33,6 +43,81 @@ class CRUDExclusionZone:
 
         return query.order_by(ExclusionZone.created_at.desc()).all()
 
+    def get_summaries_by_project(
+        self,
+        db: Session,
+        project_id: UUID,
+        active_only: bool = True,
+        zone_type: Optional[str] = None,
+    ) -> list[dict[str, Any]]:
+        """Get a project's zones as summary dicts, without their geometries.
+
+        PostGIS reports each zone's geometry type and bounding box, so the
+        geometries themselves are neither sent nor parsed.
+        """
+        effective = func.coalesce(
+            ExclusionZone.buffered_geometry, ExclusionZone.geometry
+        )
+        query = db.query(
+            ExclusionZone,
+            func.ST_GeometryType(ExclusionZone.geometry),
+            func.ST_XMin(effective),
+            func.ST_YMin(effective),
+            func.ST_XMax(effective),
+            func.ST_YMax(effective),
+        ).options(*_DEFER_GEOMETRY)
+        query = query.filter(ExclusionZone.project_id == project_id)
+
+        if active_only:
+            query = query.filter(ExclusionZone.is_active.is_(True))
+
+        if zone_type:
+            query = query.filter(ExclusionZone.zone_type == ZoneType(zone_type))
+
+        summaries = []
+        for zone, st_type, *bbox in query.order_by(ExclusionZone.created_at.desc()):
+            summary = self._to_base_dict(zone)
+            summary["geometry_type"] = st_type.removeprefix("ST_")
+            summary["bbox"] = bbox
+            summaries.append(summary)
+        return summaries
+
+    def get_geometries_by_project(
+        self,
+        db: Session,
+        project_id: UUID,
+        active_only: bool = True,
+    ) -> list[dict[str, Any]]:
+        """Get the effective (buffered if present) zone geometries as GeoJSON.
+
+        PostGIS renders the GeoJSON, so no rows or Shapely objects are built.
+        """
+        return list(self.iter_geometries_by_project(db, project_id, active_only))
+
+    def iter_geometries_by_project(
+        self,
+        db: Session,
+        project_id: UUID,
+        active_only: bool = True,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield the zone geometries of get_geometries_by_project one at a time.
+
+        Rows are fetched in batches as the iterator is consumed. Do not commit
+        on the session until it is exhausted.
+        """
+        query = db.query(
+            func.ST_AsGeoJSON(
+                func.coalesce(ExclusionZone.buffered_geometry, ExclusionZone.geometry)
+            )
+        ).filter(ExclusionZone.project_id == project_id)
+
+        if active_only:
+            query = query.filter(ExclusionZone.is_active.is_(True))
+
+        rows = query.order_by(ExclusionZone.created_at.desc()).yield_per(100)
+        for (geojson,) in rows:
+            yield json.loads(geojson)
+
     def get_by_user(
         self, db: Session, user_id: UUID, skip: int = 0, limit: int = 100
     ) -> list[ExclusionZone]:
@@ -46,6 +131,22 @@ class CRUDExclusionZone:
             .all()
         )
 
+    def get_version_by_project(
+        self, db: Session, project_id: UUID
+    ) -> tuple[int, Optional[float]]:
+        """Row count and summed change timestamps of a project's zones.
+
+        Inserts and deletes change the count; every update sets updated_at,
+        which changes the sum.
+        """
+        changed_at = func.coalesce(ExclusionZone.updated_at, ExclusionZone.created_at)
+        count, total = (
+            db.query(func.count(), func.sum(func.extract("epoch", changed_at)))
+            .filter(ExclusionZone.project_id == project_id)
+            .one()
+        )
+        return count, total
+
     def get_count_by_project(self, db: Session, project_id: UUID) -> int:
         """Get total count of zones for a project."""
         return (
@@ -71,12 +172,8 @@ class CRUDExclusionZone:
         fill_opacity: Optional[float] = None,
     ) -> ExclusionZone:
         """Create a new exclusion zone."""
-        # Convert GeoJSON to Shapely geometry
+        # Convert GeoJSON to Shapely geometry; area_sqm is generated by PostGIS
         shapely_geom = shape(geometry)
-        geometry_type = geometry["type"]
-
-        # Calculate area in square meters (transform to UTM for accuracy)
-        # Area will be calculated after insert using PostGIS
 
         db_obj = ExclusionZone(
             project_id=project_id,
@@ -86,7 +183,6 @@ class CRUDExclusionZone:
             zone_type=ZoneType(zone_type),
             source=ZoneSource(source),
             geometry=from_shape(shapely_geom, srid=4326),
-            geometry_type=geometry_type,
             buffer_distance=buffer_distance,
             source_file_id=source_file_id,
             fill_color=fill_color,
@@ -97,23 +193,50 @@ class CRUDExclusionZone:
         db.add(db_obj)
         db.commit()
         db.refresh(db_obj)
+        return db_obj
 
-        # Calculate area using PostGIS (in square meters via UTM projection)
-        if shapely_geom.geom_type in ["Polygon", "MultiPolygon"]:
-            area_result = (
-                db.query(
-                    ST_Area(ST_Transform(ExclusionZone.geometry, 32618))  # UTM zone 18N
-                )
-                .filter(ExclusionZone.id == db_obj.id)
-                .scalar()
+    def create_many(
+        self,
+        db: Session,
+        project_id: UUID,
+        user_id: UUID,
+        zone_type: str,
+        geometries: list[tuple[str, BaseGeometry]],
+        source: str = "drawn",
+        description: Optional[str] = None,
+        buffer_distance: Optional[float] = None,
+        source_file_id: Optional[UUID] = None,
+    ) -> list[ExclusionZone]:
+        """Create one zone per (name, Shapely geometry) pair in one transaction.
+
+        The flush sends the rows as a single multi-row INSERT, and the
+        committed zones are reloaded with one SELECT rather than one refresh
+        each.
+        """
+        db_objs = [
+            ExclusionZone(
+                project_id=project_id,
+                user_id=user_id,
+                name=name,
+                description=description,
+                zone_type=ZoneType(zone_type),
+                source=ZoneSource(source),
+                geometry=from_shape(geometry, srid=4326),
+                buffer_distance=buffer_distance,
+                source_file_id=source_file_id,
             )
-            if area_result:
-                db_obj.area_sqm = float(area_result)
-                db.add(db_obj)
-                db.commit()
-                db.refresh(db_obj)
+            for name, geometry in geometries
+        ]
+        if not db_objs:
+            return []
+
+        db.add_all(db_objs)
+        db.flush()
+        ids = [db_obj.id for db_obj in db_objs]
+        db.commit()
 
-        return db_obj
+        db.scalars(select(ExclusionZone).where(ExclusionZone.id.in_(ids))).all()
+        return db_objs
 
     def update(
         self,
@@ -154,55 +277,23 @@ class CRUDExclusionZone:
     def apply_buffer(
         self, db: Session, db_obj: ExclusionZone, buffer_distance: float
     ) -> ExclusionZone:
-        """Apply buffer to zone geometry."""
-        # Use PostGIS ST_Buffer with geography for accurate meter-based buffer
-        buffered = (
-            db.query(
-                ST_Buffer(
-                    ST_Transform(ExclusionZone.geometry, 32618),  # Transform to UTM
-                    buffer_distance,
-                )
-            )
-            .filter(ExclusionZone.id == db_obj.id)
-            .scalar()
-        )
-
-        if buffered:
-            # Transform back to WGS84 and store
-            buffered_wgs84 = db.query(
-                ST_Transform(func.ST_SetSRID(buffered, 32618), 4326)
-            ).scalar()
+        """Apply buffer to zone geometry.
 
-            db_obj.buffered_geometry = buffered_wgs84
-            db_obj.buffer_distance = buffer_distance
-            db_obj.buffer_applied = True
-
-            # Recalculate area with buffer
-            area_result = db.query(ST_Area(buffered)).scalar()
-            if area_result:
-                db_obj.area_sqm = float(area_result)
-
-            db.add(db_obj)
-            db.commit()
-            db.refresh(db_obj)
+        buffered_geometry and area_sqm are generated columns, so PostGIS
+        recomputes them as part of this UPDATE.
+        """
+        db_obj.buffer_distance = buffer_distance
+        db_obj.buffer_applied = True
 
+        db.add(db_obj)
+        db.commit()
+        db.refresh(db_obj)
         return db_obj
 
     def remove_buffer(self, db: Session, db_obj: ExclusionZone) -> ExclusionZone:
         """Remove buffer from zone."""
-        db_obj.buffered_geometry = None
         db_obj.buffer_applied = False
 
-        # Recalculate area without buffer
-        if db_obj.geometry:
-            area_result = (
-                db.query(ST_Area(ST_Transform(ExclusionZone.geometry, 32618)))
-                .filter(ExclusionZone.id == db_obj.id)
-                .scalar()
-            )
-            if area_result:
-                db_obj.area_sqm = float(area_result)
-
         db.add(db_obj)
         db.commit()
         db.refresh(db_obj)
@@ -216,6 +307,29 @@ class CRUDExclusionZone:
         active_only: bool = True,
     ) -> list[ExclusionZone]:
         """Find zones that intersect with a given geometry."""
+        return self._intersecting_query(db, project_id, geometry, active_only).all()
+
+    def any_intersecting(
+        self,
+        db: Session,
+        project_id: UUID,
+        geometry: dict[str, Any],
+        active_only: bool = True,
+    ) -> bool:
+        """Check whether any zone intersects a given geometry.
+
+        EXISTS stops at the first match and no rows are loaded.
+        """
+        query = self._intersecting_query(db, project_id, geometry, active_only)
+        return bool(db.query(query.exists()).scalar())
+
+    def _intersecting_query(
+        self,
+        db: Session,
+        project_id: UUID,
+        geometry: dict[str, Any],
+        active_only: bool,
+    ) -> Query[ExclusionZone]:
         shapely_geom = shape(geometry)
         geom_wkb = from_shape(shapely_geom, srid=4326)
 
@@ -230,7 +344,7 @@ class CRUDExclusionZone:
         if active_only:
             query = query.filter(ExclusionZone.is_active.is_(True))
 
-        return query.all()
+        return query
 
     def delete(self, db: Session, zone_id: UUID) -> bool:
         """Delete an exclusion zone."""
@@ -243,27 +357,10 @@ class CRUDExclusionZone:
 
     def to_response_dict(self, zone: ExclusionZone) -> dict[str, Any]:
         """Convert exclusion zone to response dictionary with GeoJSON."""
-        result = {
-            "id": zone.id,
-            "project_id": zone.project_id,
-            "user_id": zone.user_id,
-            "name": zone.name,
-            "description": zone.description,
-            "zone_type": zone.zone_type.value,
-            "source": zone.source.value,
-            "geometry_type": zone.geometry_type,
-            "buffer_distance": zone.buffer_distance,
-            "buffer_applied": zone.buffer_applied,
-            "fill_color": zone.fill_color,
-            "stroke_color": zone.stroke_color,
-            "fill_opacity": zone.fill_opacity,
-            "area_sqm": zone.area_sqm,
-            "is_active": zone.is_active,
-            "created_at": zone.created_at,
-            "updated_at": zone.updated_at,
-            "geometry": None,
-            "buffered_geometry": None,
-        }
+        result = self._to_base_dict(zone)
+        result["geometry_type"] = zone.geometry_type
+        result["geometry"] = None
+        result["buffered_geometry"] = None
 
         # Convert geometry to GeoJSON
         if zone.geometry is not None:
@@ -283,6 +380,27 @@ class CRUDExclusionZone:
 
         return result
 
+    def _to_base_dict(self, zone: ExclusionZone) -> dict[str, Any]:
+        """The response fields that do not need the zone's geometries."""
+        return {
+            "id": zone.id,
+            "project_id": zone.project_id,
+            "user_id": zone.user_id,
+            "name": zone.name,
+            "description": zone.description,
+            "zone_type": zone.zone_type.value,
+            "source": zone.source.value,
+            "buffer_distance": zone.buffer_distance,
+            "buffer_applied": zone.buffer_applied,
+            "fill_color": zone.fill_color,
+            "stroke_color": zone.stroke_color,
+            "fill_opacity": zone.fill_opacity,
+            "area_sqm": zone.area_sqm,
+            "is_active": zone.is_active,
+            "created_at": zone.created_at,
+            "updated_at": zone.updated_at,
+        }
+
 
 # Create singleton instance
 exclusion_zone = CRUDExclusionZone()
@@ -1,7 +1,9 @@
+import json
 from typing import Any, Optional
 from uuid import UUID
 
 from geoalchemy2.shape import to_shape
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from app.models.project import Project, ProjectStatus
@@ -13,6 +15,23 @@ class CRUDProject:
         """Get a project by ID."""
         return db.query(Project).filter(Project.id == project_id).first()
 
+    def get_owner_id(self, db: Session, project_id: UUID) -> Optional[UUID]:
+        """Get the owning user's ID without loading the project row."""
+        return db.execute(
+            select(Project.user_id).where(Project.id == project_id)
+        ).scalar()
+
+    def get_boundary_geojson(
+        self, db: Session, project_id: UUID
+    ) -> Optional[dict[str, Any]]:
+        """Get a project's boundary geometry as GeoJSON, rendered by PostGIS."""
+        geojson = db.execute(
+            select(func.ST_AsGeoJSON(Project.boundary_geom)).where(
+                Project.id == project_id
+            )
+        ).scalar()
+        return json.loads(geojson) if geojson else None
+
     def get_by_user(
         self, db: Session, user_id: UUID, skip: int = 0, limit: int = 100
     ) -> list[Project]:
@@ -1,16 +1,25 @@
 """CRUD operations for road network generation."""
 
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import Any, Optional
 from uuid import UUID
 
 from geoalchemy2.shape import from_shape, to_shape
 from shapely.geometry import LineString, MultiLineString, MultiPolygon, mapping, shape
-from sqlalchemy.orm import Session
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session, defer
 
 from app.models.road_network import RoadNetwork, RoadNetworkStatus
 from app.schemas.road_network import RoadNetworkCreate, RoadNetworkStatistics
 
+# Exports read road segments from road_details, not from the geometries.
+# raiseload turns an accidental access into an error instead of a query.
+_DEFER_GEOMETRY = (
+    defer(RoadNetwork.entry_point, raiseload=True),
+    defer(RoadNetwork.road_centerlines, raiseload=True),
+    defer(RoadNetwork.road_polygons, raiseload=True),
+)
+
 
 class CRUDRoadNetwork:
     def get(self, db: Session, network_id: UUID) -> Optional[RoadNetwork]:
@@ -23,11 +32,18 @@ class CRUDRoadNetwork:
         project_id: UUID,
         skip: int = 0,
         limit: int = 100,
+        include_geometry: bool = True,
     ) -> list[RoadNetwork]:
-        """Get all road networks for a project."""
+        """Get all road networks for a project.
+
+        With include_geometry=False the entry point, centerlines and polygons
+        are not loaded.
+        """
+        query = db.query(RoadNetwork)
+        if not include_geometry:
+            query = query.options(*_DEFER_GEOMETRY)
         return (
-            db.query(RoadNetwork)
-            .filter(RoadNetwork.project_id == project_id)
+            query.filter(RoadNetwork.project_id == project_id)
             .order_by(RoadNetwork.created_at.desc())
             .offset(skip)
             .limit(limit)
@@ -92,9 +108,9 @@ class CRUDRoadNetwork:
         db_obj.error_message = error_message
 
         if status == RoadNetworkStatus.PROCESSING and db_obj.started_at is None:
-            db_obj.started_at = datetime.utcnow()
+            db_obj.started_at = datetime.now(UTC)
         elif status in (RoadNetworkStatus.COMPLETED, RoadNetworkStatus.FAILED):
-            db_obj.completed_at = datetime.utcnow()
+            db_obj.completed_at = datetime.now(UTC)
 
         db.add(db_obj)
         db.commit()
@@ -112,7 +128,7 @@ class CRUDRoadNetwork:
             db_obj.status = RoadNetworkStatus.COMPLETED
             db_obj.progress_percent = 100
             db_obj.current_step = "completed"
-            db_obj.completed_at = datetime.utcnow()
+            db_obj.completed_at = datetime.now(UTC)
 
             # Store road centerlines as MultiLineString geometry
             if result.get("road_centerlines"):
@@ -167,7 +183,7 @@ class CRUDRoadNetwork:
         else:
             db_obj.status = RoadNetworkStatus.FAILED
             db_obj.error_message = result.get("error_message", "Unknown error")
-            db_obj.completed_at = datetime.utcnow()
+            db_obj.completed_at = datetime.now(UTC)
             db_obj.processing_time_seconds = result.get("processing_time", 0.0)
 
         db.add(db_obj)
@@ -249,8 +265,11 @@ class CRUDRoadNetwork:
             "completed_at": network.completed_at,
         }
 
+        # Left unloaded by export queries
+        unloaded = inspect(network).unloaded
+
         # Convert entry point to GeoJSON
-        if network.entry_point is not None:
+        if "entry_point" not in unloaded and network.entry_point is not None:
             try:
                 shape_obj = to_shape(network.entry_point)
                 result["entry_point"] = mapping(shape_obj)
@@ -258,7 +277,7 @@ class CRUDRoadNetwork:
                 pass
 
         # Convert road centerlines to GeoJSON
-        if network.road_centerlines is not None:
+        if "road_centerlines" not in unloaded and network.road_centerlines is not None:
             try:
                 shape_obj = to_shape(network.road_centerlines)
                 result["road_centerlines"] = mapping(shape_obj)
@@ -266,7 +285,7 @@ class CRUDRoadNetwork:
                 pass
 
         # Convert road polygons to GeoJSON
-        if network.road_polygons is not None:
+        if "road_polygons" not in unloaded and network.road_polygons is not None:
             try:
                 shape_obj = to_shape(network.road_polygons)
                 result["road_polygons"] = mapping(shape_obj)
@@ -1,12 +1,13 @@
 """CRUD operations for terrain analysis."""
 
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 from typing import Any, Optional
 from uuid import UUID
 
 from geoalchemy2.shape import from_shape, to_shape
 from sqlalchemy.orm import Session
 
+from app.core.storage import storage_key
 from app.models.terrain_analysis import AnalysisStatus, TerrainAnalysis
 from app.schemas.terrain import (
     AspectStatsResponse,
@@ -14,7 +15,13 @@ from app.schemas.terrain import (
     SlopeStatsResponse,
     TerrainAnalysisCreate,
 )
-from app.services.terrain_analysis import TerrainAnalysisResult
+from app.services.terrain_analysis import (
+    ASPECT_DIRECTIONS,
+    SLOPE_CLASSES,
+    TerrainAnalysisResult,
+    pack_bins,
+    unpack_bins,
+)
 
 # Default cache duration
 CACHE_DURATION = timedelta(days=7)
@@ -56,7 +63,7 @@ class CRUDTerrainAnalysis:
         self,
         db: Session,
         project_id: UUID,
-        input_hash: str,
+        input_hash: bytes,
     ) -> Optional[TerrainAnalysis]:
         """Get cached analysis by input hash."""
         return (
@@ -65,7 +72,7 @@ class CRUDTerrainAnalysis:
                 TerrainAnalysis.project_id == project_id,
                 TerrainAnalysis.input_hash == input_hash,
                 TerrainAnalysis.status == AnalysisStatus.COMPLETED,
-                TerrainAnalysis.cache_valid_until > datetime.utcnow(),
+                TerrainAnalysis.cache_valid_until > datetime.now(UTC),
             )
             .first()
         )
@@ -103,9 +110,9 @@ class CRUDTerrainAnalysis:
         db_obj.error_message = error_message
 
         if status == AnalysisStatus.PROCESSING and db_obj.started_at is None:
-            db_obj.started_at = datetime.utcnow()
+            db_obj.started_at = datetime.now(UTC)
         elif status in (AnalysisStatus.COMPLETED, AnalysisStatus.FAILED):
-            db_obj.completed_at = datetime.utcnow()
+            db_obj.completed_at = datetime.now(UTC)
 
         db.add(db_obj)
         db.commit()
@@ -123,7 +130,7 @@ class CRUDTerrainAnalysis:
             db_obj.status = AnalysisStatus.COMPLETED
             db_obj.progress_percent = 100
             db_obj.current_step = "completed"
-            db_obj.completed_at = datetime.utcnow()
+            db_obj.completed_at = datetime.now(UTC)
 
             # DEM info
             db_obj.dem_source = result.dem_source
@@ -150,30 +157,34 @@ class CRUDTerrainAnalysis:
                 db_obj.slope_max = result.slope_stats.max_value
                 db_obj.slope_mean = result.slope_stats.mean_value
                 db_obj.slope_std = result.slope_stats.std_value
-                db_obj.slope_classification = result.slope_stats.classification
-                db_obj.slope_raster_path = result.slope_stats.raster_path
+                db_obj.slope_classification = pack_bins(
+                    result.slope_stats.classification, SLOPE_CLASSES
+                )
+                db_obj.slope_raster_path = storage_key(result.slope_stats.raster_path)
                 db_obj.slope_raster_size = result.slope_stats.raster_size
 
             # Aspect stats
             if result.aspect_stats:
-                db_obj.aspect_distribution = result.aspect_stats.distribution
-                db_obj.aspect_raster_path = result.aspect_stats.raster_path
+                db_obj.aspect_distribution = pack_bins(
+                    result.aspect_stats.distribution, ASPECT_DIRECTIONS
+                )
+                db_obj.aspect_raster_path = storage_key(result.aspect_stats.raster_path)
                 db_obj.aspect_raster_size = result.aspect_stats.raster_size
 
             # Hillshade
-            db_obj.hillshade_raster_path = result.hillshade_path
+            db_obj.hillshade_raster_path = storage_key(result.hillshade_path)
             db_obj.hillshade_raster_size = result.hillshade_size
 
             # Processing metadata
             db_obj.processing_time_seconds = result.processing_time
             db_obj.memory_peak_mb = result.memory_peak_mb
-            db_obj.input_hash = result.input_hash
-            db_obj.cache_valid_until = datetime.utcnow() + CACHE_DURATION
+            db_obj.input_hash = result.input_hash or None
+            db_obj.cache_valid_until = datetime.now(UTC) + CACHE_DURATION
 
         else:
             db_obj.status = AnalysisStatus.FAILED
             db_obj.error_message = result.error_message
-            db_obj.completed_at = datetime.utcnow()
+            db_obj.completed_at = datetime.now(UTC)
             db_obj.processing_time_seconds = result.processing_time
 
         db.add(db_obj)
@@ -244,13 +255,17 @@ class CRUDTerrainAnalysis:
                 max_value=analysis.slope_max or 0.0,
                 mean_value=analysis.slope_mean or 0.0,
                 std_value=analysis.slope_std or 0.0,
-                classification=analysis.slope_classification or {},
+                classification=unpack_bins(
+                    analysis.slope_classification, SLOPE_CLASSES
+                ),
             ).model_dump()
 
         # Add aspect stats
         if analysis.aspect_distribution:
             result["aspect_stats"] = AspectStatsResponse(  # type: ignore[assignment]
-                distribution=analysis.aspect_distribution
+                distribution=unpack_bins(
+                    analysis.aspect_distribution, ASPECT_DIRECTIONS
+                )
             ).model_dump()
 
         return result
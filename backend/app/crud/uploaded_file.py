@@ -1,10 +1,12 @@
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import Any, Optional
 from uuid import UUID
 
 from geoalchemy2.shape import from_shape, to_shape
+from sqlalchemy import delete, func, select, update
 from sqlalchemy.orm import Session
 
+from app.models.project import Project
 from app.models.uploaded_file import FileStatus, FileType, UploadedFile
 from app.services.file_validation import ValidationResult
 
@@ -40,19 +42,69 @@ class CRUDUploadedFile:
             .all()
         )
 
+    def list_page(
+        self,
+        db: Session,
+        user_id: UUID,
+        project_id: Optional[UUID] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> tuple[list[UploadedFile], int]:
+        """Get a page of a user's files, optionally in one project, and the total.
+
+        The total comes from count(*) OVER () on the page query itself. A page
+        past the end has no rows to carry it, so only then is it counted apart.
+        """
+        query = db.query(UploadedFile, func.count().over()).filter(
+            UploadedFile.user_id == user_id
+        )
+        if project_id is not None:
+            query = query.filter(UploadedFile.project_id == project_id)
+
+        rows = (
+            query.order_by(UploadedFile.created_at.desc())
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+        if rows:
+            return [file for file, _ in rows], rows[0][1]
+        if skip == 0:
+            return [], 0
+        return [], query.with_entities(func.count()).order_by(None).scalar() or 0
+
     def get_count_by_user(self, db: Session, user_id: UUID) -> int:
         """Get total count of files for a user."""
         return db.query(UploadedFile).filter(UploadedFile.user_id == user_id).count()
 
     def get_by_hash(
-        self, db: Session, user_id: UUID, content_hash: str
+        self,
+        db: Session,
+        user_id: UUID,
+        content_hash: bytes,
+        project_id: Optional[UUID] = None,
     ) -> Optional[UploadedFile]:
-        """Get a file by content hash for duplicate detection."""
+        """Get a user's file with this content in a project (or unassigned)."""
         return (
             db.query(UploadedFile)
             .filter(
+                UploadedFile.content_hash == content_hash,
                 UploadedFile.user_id == user_id,
+                UploadedFile.project_id == project_id,
+            )
+            .first()
+        )
+
+    def get_validated_by_hash(
+        self, db: Session, content_hash: bytes, file_type: str
+    ) -> Optional[UploadedFile]:
+        """Get any already validated file of this type with this content."""
+        return (
+            db.query(UploadedFile)
+            .filter(
                 UploadedFile.content_hash == content_hash,
+                UploadedFile.file_type == FileType(file_type.lower()),
+                UploadedFile.status.in_([FileStatus.VALID, FileStatus.INVALID]),
             )
             .first()
         )
@@ -93,7 +145,6 @@ class CRUDUploadedFile:
         if validation.is_valid and validation.geometry_result:
             db_obj.status = FileStatus.VALID
             db_obj.validation_message = None
-            db_obj.geometry_type = validation.geometry_result.geometry_type
             db_obj.feature_count = validation.geometry_result.feature_count
             db_obj.extracted_name = validation.geometry_result.name
             db_obj.extracted_description = validation.geometry_result.description
@@ -112,6 +163,23 @@ class CRUDUploadedFile:
         db.refresh(db_obj)
         return db_obj
 
+    def copy_validation_result(
+        self, db: Session, db_obj: UploadedFile, source: UploadedFile
+    ) -> UploadedFile:
+        """Update file with the validation results of a file with the same bytes."""
+        db_obj.content_hash = source.content_hash
+        db_obj.status = source.status
+        db_obj.validation_message = source.validation_message
+        db_obj.feature_count = source.feature_count
+        db_obj.extracted_name = source.extracted_name
+        db_obj.extracted_description = source.extracted_description
+        db_obj.boundary_geom = source.boundary_geom
+
+        db.add(db_obj)
+        db.commit()
+        db.refresh(db_obj)
+        return db_obj
+
     def update_status(
         self,
         db: Session,
@@ -124,7 +192,7 @@ class CRUDUploadedFile:
         if message:
             db_obj.validation_message = message
         if status == FileStatus.PROCESSED:
-            db_obj.processed_at = datetime.utcnow()
+            db_obj.processed_at = datetime.now(UTC)
 
         db.add(db_obj)
         db.commit()
@@ -141,14 +209,42 @@ class CRUDUploadedFile:
         db.refresh(db_obj)
         return db_obj
 
+    def assign_owned(
+        self, db: Session, file_id: UUID, project_id: UUID, user_id: UUID
+    ) -> Optional[UploadedFile]:
+        """Assign a user's file to one of their projects in one UPDATE.
+
+        Returns None, changing nothing, unless both the file and the project
+        belong to the user.
+        """
+        project_owned = (
+            select(Project.id)
+            .where(Project.id == project_id, Project.user_id == user_id)
+            .exists()
+        )
+        db_obj = db.scalars(
+            update(UploadedFile)
+            .where(
+                UploadedFile.id == file_id,
+                UploadedFile.user_id == user_id,
+                project_owned,
+            )
+            .values(project_id=project_id)
+            .returning(UploadedFile),
+            execution_options={"synchronize_session": False},
+        ).one_or_none()
+        if db_obj is None:
+            return None
+
+        db.commit()
+        db.refresh(db_obj)
+        return db_obj
+
     def delete(self, db: Session, file_id: UUID) -> bool:
-        """Delete an uploaded file record."""
-        file_obj = self.get(db, file_id)
-        if file_obj:
-            db.delete(file_obj)
-            db.commit()
-            return True
-        return False
+        """Delete an uploaded file record with a single DELETE statement."""
+        result = db.execute(delete(UploadedFile).where(UploadedFile.id == file_id))
+        db.commit()
+        return bool(result.rowcount)
 
     def to_response_dict(self, file_obj: UploadedFile) -> dict[str, Any]:
         """Convert uploaded file to response dictionary with GeoJSON."""
@@ -1,18 +1,51 @@
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy.orm import Session
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
 
+from app.core.cache import LRUCache
 from app.core.security import get_password_hash, verify_password
 from app.models.user import User
 from app.schemas.auth import UserCreate, UserUpdate
 
+# Every authenticated request resolves its user; recent lookups are kept as
+# detached copies so most requests skip the SELECT
+USER_CACHE_TTL = 30
+_user_cache = LRUCache(max_size=10_000, default_ttl=USER_CACHE_TTL)
+
+
+def _detached_copy(user: User) -> User:
+    """Copy the loaded columns into a User not bound to any session."""
+    copy = User(
+        **{attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs}
+    )
+    make_transient_to_detached(copy)
+    return copy
+
 
 class CRUDUser:
     def get(self, db: Session, user_id: UUID) -> Optional[User]:
         """Get a user by ID."""
         return db.query(User).filter(User.id == user_id).first()
 
+    def get_cached(self, db: Session, user_id: UUID) -> Optional[User]:
+        """Get a user by ID, reusing a copy loaded in the last few seconds."""
+        key = str(user_id)
+        cached = _user_cache.get(key)
+        if cached is not None:
+            # load=False attaches the copy to this session without a query
+            return db.merge(cached, load=False)
+
+        user = self.get(db, user_id=user_id)
+        if user is not None:
+            _user_cache.set(key, _detached_copy(user))
+        return user
+
+    def invalidate_cached(self, user_id: UUID) -> None:
+        """Drop a user's cached copy after changing the row."""
+        _user_cache.delete(str(user_id))
+
     def get_by_email(self, db: Session, email: str) -> Optional[User]:
         """Get a user by email."""
         return db.query(User).filter(User.email == email).first()
@@ -74,6 +107,7 @@ class CRUDUser:
         db.add(db_obj)
         db.commit()
         db.refresh(db_obj)
+        self.invalidate_cached(db_obj.id)
         return db_obj
 
     def authenticate(self, db: Session, email: str, password: str) -> Optional[User]:
@@ -1,6 +1,6 @@
 """CRUD operations for cut/fill volume estimation."""
 
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 from typing import Any, Optional
 from uuid import UUID
 
@@ -66,16 +66,21 @@ class CRUDVolumeEstimation:
         self,
         db: Session,
         project_id: UUID,
-        input_hash: str,
+        input_hash: bytes,
     ) -> Optional[VolumeEstimation]:
-        """Get cached estimation by input hash."""
+        """Get cached estimation by input hash.
+
+        Served hits are re-marked CACHED, so both statuses count as results.
+        """
         return (
             db.query(VolumeEstimation)
             .filter(
                 VolumeEstimation.project_id == project_id,
                 VolumeEstimation.input_hash == input_hash,
-                VolumeEstimation.status == VolumeEstimationStatus.COMPLETED,
-                VolumeEstimation.cache_valid_until > datetime.utcnow(),
+                VolumeEstimation.status.in_(
+                    (VolumeEstimationStatus.COMPLETED, VolumeEstimationStatus.CACHED)
+                ),
+                VolumeEstimation.cache_valid_until > datetime.now(UTC),
             )
             .first()
         )
@@ -128,12 +133,12 @@ class CRUDVolumeEstimation:
         db_obj.error_message = error_message
 
         if status == VolumeEstimationStatus.PROCESSING and db_obj.started_at is None:
-            db_obj.started_at = datetime.utcnow()
+            db_obj.started_at = datetime.now(UTC)
         elif status in (
             VolumeEstimationStatus.COMPLETED,
             VolumeEstimationStatus.FAILED,
         ):
-            db_obj.completed_at = datetime.utcnow()
+            db_obj.completed_at = datetime.now(UTC)
 
         db.add(db_obj)
         db.commit()
@@ -145,14 +150,14 @@ class CRUDVolumeEstimation:
         db: Session,
         db_obj: VolumeEstimation,
         result: VolumeEstimationResult,
-        input_hash: Optional[str] = None,
+        input_hash: Optional[bytes] = None,
     ) -> VolumeEstimation:
         """Update estimation with computed results."""
         if result.success:
             db_obj.status = VolumeEstimationStatus.COMPLETED
             db_obj.progress_percent = 100
             db_obj.current_step = "completed"
-            db_obj.completed_at = datetime.utcnow()
+            db_obj.completed_at = datetime.now(UTC)
 
             # Asset totals
             db_obj.total_asset_cut_volume_m3 = result.total_asset_cut_volume_m3
@@ -230,12 +235,12 @@ class CRUDVolumeEstimation:
             # Caching
             if input_hash:
                 db_obj.input_hash = input_hash
-                db_obj.cache_valid_until = datetime.utcnow() + CACHE_DURATION
+                db_obj.cache_valid_until = datetime.now(UTC) + CACHE_DURATION
 
         else:
             db_obj.status = VolumeEstimationStatus.FAILED
             db_obj.error_message = result.error_message
-            db_obj.completed_at = datetime.utcnow()
+            db_obj.completed_at = datetime.now(UTC)
             db_obj.processing_time_seconds = result.processing_time
 
         db.add(db_obj)
@@ -1,4 +1,6 @@
-from sqlalchemy import create_engine
+from datetime import datetime
+
+from sqlalchemy import DateTime, create_engine
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
 from app.core.config import settings
@@ -16,7 +18,8 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 class Base(DeclarativeBase):
     """SQLAlchemy 2.0 declarative base class."""
 
-    pass
+    # Every timestamp column is TIMESTAMPTZ
+    type_annotation_map = {datetime: DateTime(timezone=True)}
 
 
 def get_db():
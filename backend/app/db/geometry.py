@@ -0,0 +1,41 @@
+"""
+Geometry type lookup from the WKB header.
+
+The geometry type is the first field of every WKB/EWKB value, so it can be
+read from five bytes instead of storing it in a separate column or parsing
+the whole geometry with shapely.
+"""
+
+import struct
+from typing import Any, Optional
+
+from geoalchemy2.elements import WKBElement
+from geoalchemy2.shape import to_shape
+
+# OGC WKB type codes, named as in GeoJSON and shapely's geom_type
+WKB_GEOMETRY_TYPES = {
+    1: "Point",
+    2: "LineString",
+    3: "Polygon",
+    4: "MultiPoint",
+    5: "MultiLineString",
+    6: "MultiPolygon",
+    7: "GeometryCollection",
+}
+
+# EWKB stores Z/M/SRID as high flag bits; ISO WKB adds 1000/2000/3000
+_EWKB_FLAGS = 0xE0000000
+
+
+def geometry_type_name(element: Optional[Any]) -> Optional[str]:
+    """Return the geometry type name (Polygon, MultiPolygon, ...) of a value."""
+    if element is None:
+        return None
+    if not isinstance(element, WKBElement):
+        return str(to_shape(element).geom_type)
+
+    data = element.data
+    header = bytes.fromhex(data[:10]) if isinstance(data, str) else bytes(data[:5])
+    byte_order = "<I" if header[0] else ">I"
+    (type_code,) = struct.unpack(byte_order, header[1:5])
+    return WKB_GEOMETRY_TYPES.get((type_code & ~_EWKB_FLAGS) % 1000)
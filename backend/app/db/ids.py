@@ -0,0 +1,30 @@
+"""
+Time-ordered primary key generation.
+
+UUIDv7 (RFC 9562) puts a millisecond Unix timestamp in the high bits, so
+new keys land at the right edge of the primary key B-tree instead of at a
+random leaf. That keeps inserts append-only: fewer page splits, less WAL
+and a hotter buffer cache than random UUIDv4 keys.
+"""
+
+import os
+import time
+import uuid
+
+_VERSION = 0x7
+_VARIANT = 0b10
+
+
+def uuid7() -> uuid.UUID:
+    """Generate a UUIDv7: 48-bit ms timestamp, version, variant, 74 random bits."""
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    rand_a = (rand >> 62) & 0xFFF
+    rand_b = rand & ((1 << 62) - 1)
+
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= _VERSION << 76
+    value |= rand_a << 64
+    value |= _VARIANT << 62
+    value |= rand_b
+    return uuid.UUID(int=value)
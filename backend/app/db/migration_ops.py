@@ -0,0 +1,76 @@
+"""
+Lock-friendly DDL helpers for alembic migrations.
+
+A plain CREATE INDEX on a populated table blocks writes for the whole
+build. With ``online=True`` (the default) these helpers use CREATE/DROP
+INDEX CONCURRENTLY instead, which cannot run inside a transaction, so each
+statement gets its own autocommit block.
+
+Pass ``online=False`` for tables created in the same migration, where there
+is nothing to block and the DDL should stay in the migration transaction.
+
+Online statements cannot be combined into one multi-statement execute or a
+pipeline: PostgreSQL runs those as a single implicit transaction, which
+CONCURRENTLY refuses. The per-statement round trip is negligible next to
+the index build itself.
+
+Seed rows belong in a single ``op.bulk_insert(table, rows)`` call rather than
+a loop of INSERT statements; SQLAlchemy sends it as batched multi-row INSERTs.
+
+Usage:
+    create_index(
+        "ix_projects_user_created", "projects", "(user_id, created_at DESC)"
+    )
+"""
+
+from collections.abc import Mapping
+from typing import Optional
+
+from alembic import op
+
+
+def _execute(
+    sql: str, online: bool, settings: Optional[Mapping[str, str]] = None
+) -> None:
+    settings = settings or {}
+    if online:
+        # SET LOCAL would not reach a statement in its own autocommit block,
+        # so set the parameters for the session around it and reset them.
+        with op.get_context().autocommit_block():
+            for param, value in settings.items():
+                op.execute(f"SET {param} = '{value}'")
+            try:
+                op.execute(sql)
+            finally:
+                for param in settings:
+                    op.execute(f"RESET {param}")
+    else:
+        for param, value in settings.items():
+            op.execute(f"SET LOCAL {param} = '{value}'")
+        op.execute(sql)
+
+
+def create_index(
+    name: str,
+    table: str,
+    definition: str,
+    online: bool = True,
+    settings: Optional[Mapping[str, str]] = None,
+) -> None:
+    """Create an index; ``definition`` is everything after ``ON <table>``.
+
+    ``settings`` are server parameters (e.g. maintenance_work_mem) applied
+    only while the index is built.
+    """
+    concurrently = "CONCURRENTLY " if online else ""
+    _execute(
+        f"CREATE INDEX {concurrently}IF NOT EXISTS {name} ON {table} {definition}",
+        online,
+        settings,
+    )
+
+
+def drop_index(name: str, online: bool = True) -> None:
+    """Drop an index if it exists."""
+    concurrently = "CONCURRENTLY " if online else ""
+    _execute(f"DROP INDEX {concurrently}IF EXISTS {name}", online)
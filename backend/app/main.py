@@ -1,6 +1,7 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy import text
 
 from app.api.v1.api import api_router
 from app.core.config import settings
@@ -16,6 +17,7 @@ from app.core.middleware import (
     RequestLoggingMiddleware,
     setup_logging,
 )
+from app.db.base import engine
 
 # Setup logging
 setup_logging()
@@ -69,10 +71,6 @@ async def health_check():
 @fastapi_app.get("/health/db")
 async def database_health_check():
     """Check database connectivity."""
-    from sqlalchemy import text
-
-    from app.db.base import engine
-
     try:
         with engine.connect() as conn:
             result = conn.execute(text("SELECT 1"))
@@ -13,6 +13,7 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
 from app.db.base import Base
+from app.db.ids import uuid7
 
 if TYPE_CHECKING:
     from app.models.project import Project
@@ -46,7 +47,7 @@ class AssetPlacement(Base):
     __tablename__ = "asset_placements"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     project_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE")
@@ -93,7 +94,7 @@ class AssetPlacement(Base):
 
     # Area constraints (placement bounds)
     placement_area: Mapped[Optional[Any]] = mapped_column(
-        Geometry("POLYGON", srid=4326), nullable=True
+        Geometry("POLYGON", srid=4326, spatial_index=False), nullable=True
     )
 
     # Optimization settings
@@ -108,7 +109,7 @@ class AssetPlacement(Base):
     # Results
     # Placed assets stored as MultiPoint geometry
     placed_assets: Mapped[Optional[Any]] = mapped_column(
-        Geometry("MULTIPOINT", srid=4326), nullable=True
+        Geometry("MULTIPOINT", srid=4326, spatial_index=False), nullable=True
     )
 
     # Detailed placement data (each asset with its properties)
@@ -4,6 +4,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Any, Optional
 
 from geoalchemy2 import Geometry
+from sqlalchemy import Computed
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy import Float, ForeignKey, String, Text
 from sqlalchemy.dialects.postgresql import UUID
@@ -11,11 +12,25 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
 from app.db.base import Base
+from app.db.geometry import geometry_type_name
+from app.db.ids import uuid7
 
 if TYPE_CHECKING:
     from app.models.project import Project
     from app.models.user import User
 
+# The geography cast buffers in meters on the spheroid; see migration 022
+_APPLIED_BUFFER = "buffer_applied AND buffer_distance IS NOT NULL"
+BUFFERED_GEOMETRY_SQL = (
+    f"CASE WHEN {_APPLIED_BUFFER} "
+    "THEN ST_Buffer(geometry::geography, buffer_distance)::geometry END"
+)
+AREA_SQM_SQL = (
+    f"NULLIF(ST_Area(CASE WHEN {_APPLIED_BUFFER} "
+    "THEN ST_Buffer(geometry::geography, buffer_distance) "
+    "ELSE geometry::geography END), 0)"
+)
+
 
 class ZoneType(str, enum.Enum):
     WETLAND = "wetland"
@@ -34,7 +49,7 @@ class ExclusionZone(Base):
     __tablename__ = "exclusion_zones"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     project_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE")
@@ -49,13 +64,11 @@ class ExclusionZone(Base):
     zone_type: Mapped[ZoneType] = mapped_column(SQLEnum(ZoneType))
     source: Mapped[ZoneSource] = mapped_column(SQLEnum(ZoneSource))
 
-    # Geometry - stored as PostGIS geometry
+    # Geometry - stored as PostGIS geometry. Active zones are SP-GiST indexed on
+    # COALESCE(buffered_geometry, geometry), see migration 021
     geometry: Mapped[Any] = mapped_column(
-        Geometry("GEOMETRY", srid=4326), nullable=False
+        Geometry("GEOMETRY", srid=4326, spatial_index=False), nullable=False
     )
-    geometry_type: Mapped[str] = mapped_column(
-        String(50)
-    )  # Polygon, MultiPolygon, etc.
 
     # Buffer configuration
     buffer_distance: Mapped[Optional[float]] = mapped_column(
@@ -63,7 +76,9 @@ class ExclusionZone(Base):
     )  # Distance in meters
     buffer_applied: Mapped[bool] = mapped_column(default=False)
     buffered_geometry: Mapped[Optional[Any]] = mapped_column(
-        Geometry("GEOMETRY", srid=4326), nullable=True
+        Geometry("GEOMETRY", srid=4326, spatial_index=False),
+        Computed(BUFFERED_GEOMETRY_SQL, persisted=True),
+        nullable=True,
     )
 
     # Source file reference (if imported)
@@ -78,8 +93,10 @@ class ExclusionZone(Base):
     stroke_color: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
     fill_opacity: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
 
-    # Area calculation (in square meters)
-    area_sqm: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    # Area in square meters, including the applied buffer
+    area_sqm: Mapped[Optional[float]] = mapped_column(
+        Float, Computed(AREA_SQM_SQL, persisted=True), nullable=True
+    )
 
     # Status
     is_active: Mapped[bool] = mapped_column(default=True)
@@ -92,3 +109,8 @@ class ExclusionZone(Base):
     # Relationships
     project: Mapped["Project"] = relationship(back_populates="exclusion_zones")
     user: Mapped["User"] = relationship(back_populates="exclusion_zones")
+
+    @property
+    def geometry_type(self) -> Optional[str]:
+        """Polygon, MultiPolygon, etc., read from the stored geometry."""
+        return geometry_type_name(self.geometry)
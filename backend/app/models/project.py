@@ -11,6 +11,7 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
 from app.db.base import Base
+from app.db.ids import uuid7
 
 if TYPE_CHECKING:
     from app.models.asset_placement import AssetPlacement
@@ -32,7 +33,7 @@ class Project(Base):
     __tablename__ = "projects"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id")
@@ -45,11 +46,12 @@ class Project(Base):
     )
 
     # Spatial data - using Any for GeoAlchemy2 types as they lack proper type stubs
+    # SP-GiST index on boundary_geom is created by migration 009
     boundary_geom: Mapped[Optional[Any]] = mapped_column(
-        Geometry("POLYGON", srid=4326), nullable=True
+        Geometry("POLYGON", srid=4326, spatial_index=False), nullable=True
     )
     entry_point_geom: Mapped[Optional[Any]] = mapped_column(
-        Geometry("POINT", srid=4326), nullable=True
+        Geometry("POINT", srid=4326, spatial_index=False), nullable=True
     )
 
     created_at: Mapped[datetime] = mapped_column(server_default=func.now())
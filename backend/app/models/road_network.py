@@ -6,6 +6,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Any, Optional
 
 from geoalchemy2 import Geometry
+from sqlalchemy import Computed
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy import Float, ForeignKey, Integer, String, Text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
@@ -13,6 +14,7 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
 from app.db.base import Base
+from app.db.ids import uuid7
 
 if TYPE_CHECKING:
     from app.models.asset_placement import AssetPlacement
@@ -20,6 +22,10 @@ if TYPE_CHECKING:
     from app.models.terrain_analysis import TerrainAnalysis
     from app.models.user import User
 
+BBOX_SQL = (
+    "ST_Envelope(ST_Collect(ARRAY[entry_point, road_centerlines, road_polygons]))"
+)
+
 
 class RoadNetworkStatus(str, enum.Enum):
     """Status of road network generation operation."""
@@ -45,7 +51,7 @@ class RoadNetwork(Base):
     __tablename__ = "road_networks"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     project_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE")
@@ -105,21 +111,31 @@ class RoadNetwork(Base):
 
     # Entry point (site access point)
     entry_point: Mapped[Optional[Any]] = mapped_column(
-        Geometry("POINT", srid=4326), nullable=True
+        Geometry("POINT", srid=4326, spatial_index=False), nullable=True
     )
 
-    # Advanced settings stored as JSON (prefer_contours, allow_cut_through, etc.)
+    # Advanced settings stored as JSON (prefer_contours, allow_cut_through, etc.).
+    # GIN (jsonb_path_ops) indexed, see migration 026: filter with
+    # advanced_settings.contains({...}) (@>), not ->> equality
     advanced_settings: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
 
     # Results
     # Road centerlines stored as MultiLineString geometry
     road_centerlines: Mapped[Optional[Any]] = mapped_column(
-        Geometry("MULTILINESTRING", srid=4326), nullable=True
+        Geometry("MULTILINESTRING", srid=4326, spatial_index=False), nullable=True
     )
 
     # Road polygons (with width applied) for visualization
     road_polygons: Mapped[Optional[Any]] = mapped_column(
-        Geometry("MULTIPOLYGON", srid=4326), nullable=True
+        Geometry("MULTIPOLYGON", srid=4326, spatial_index=False), nullable=True
+    )
+
+    # Envelope of entry point, centerlines and polygons; GiST indexed as the
+    # whole-network bbox, see migration 029
+    bbox: Mapped[Optional[Any]] = mapped_column(
+        Geometry("GEOMETRY", srid=4326, spatial_index=False),
+        Computed(BBOX_SQL, persisted=True),
+        nullable=True,
     )
 
     # Detailed road segment data
@@ -6,12 +6,13 @@ from typing import TYPE_CHECKING, Any, Optional
 from geoalchemy2 import Geometry
 from sqlalchemy import BigInteger
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import Float, ForeignKey, Integer, String, Text
-from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy import Float, ForeignKey, Integer, LargeBinary, String, Text
+from sqlalchemy.dialects.postgresql import ARRAY, REAL, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
 from app.db.base import Base
+from app.db.ids import uuid7
 
 if TYPE_CHECKING:
     from app.models.project import Project
@@ -32,7 +33,7 @@ class TerrainAnalysis(Base):
     __tablename__ = "terrain_analyses"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     project_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE")
@@ -64,7 +65,7 @@ class TerrainAnalysis(Base):
 
     # Analysis bounds - the area analyzed
     analysis_bounds: Mapped[Optional[Any]] = mapped_column(
-        Geometry("POLYGON", srid=4326), nullable=True
+        Geometry("POLYGON", srid=4326, spatial_index=False), nullable=True
     )
 
     # Elevation statistics
@@ -80,22 +81,22 @@ class TerrainAnalysis(Base):
     slope_std: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
 
     # Slope classification breakdown (percentage of area in each class)
-    # Stored as JSON: {"flat": 10.5, "gentle": 25.3, ...}
-    slope_classification: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
-
-    # Aspect statistics (in degrees, 0-360)
-    aspect_distribution: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
-    # e.g., {"N": 12.5, "NE": 15.0, "E": 10.0, ...}
-
-    # Paths to generated raster files (stored on disk)
-    slope_raster_path: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
-    aspect_raster_path: Mapped[Optional[str]] = mapped_column(
-        String(500), nullable=True
+    # Stored in SLOPE_CLASSES order: [flat, gentle, moderate, steep, very_steep]
+    slope_classification: Mapped[Optional[list[float]]] = mapped_column(
+        ARRAY(REAL), nullable=True
     )
-    hillshade_raster_path: Mapped[Optional[str]] = mapped_column(
-        String(500), nullable=True
+
+    # Aspect statistics (percentage of area facing each direction)
+    # Stored in ASPECT_DIRECTIONS order: [N, NE, E, SE, S, SW, W, NW]
+    aspect_distribution: Mapped[Optional[list[float]]] = mapped_column(
+        ARRAY(REAL), nullable=True
     )
 
+    # Generated raster files, relative to UPLOAD_DIR (see app.core.storage)
+    slope_raster_path: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    aspect_raster_path: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    hillshade_raster_path: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
     # File sizes for storage management
     slope_raster_size: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
     aspect_raster_size: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
@@ -104,9 +105,9 @@ class TerrainAnalysis(Base):
     )
 
     # Caching support
-    input_hash: Mapped[Optional[str]] = mapped_column(
-        String(64), nullable=True
-    )  # SHA-256 of input params
+    input_hash: Mapped[Optional[bytes]] = mapped_column(
+        LargeBinary(32), nullable=True
+    )  # SHA-256 digest of input params
     cache_valid_until: Mapped[Optional[datetime]] = mapped_column(nullable=True)
 
     # Processing metadata
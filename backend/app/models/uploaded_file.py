@@ -6,12 +6,14 @@ from typing import TYPE_CHECKING, Any, Optional
 from geoalchemy2 import Geometry
 from sqlalchemy import BigInteger
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import ForeignKey, String, Text
+from sqlalchemy import ForeignKey, LargeBinary, String, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
 from app.db.base import Base
+from app.db.geometry import geometry_type_name
+from app.db.ids import uuid7
 
 if TYPE_CHECKING:
     from app.models.project import Project
@@ -37,7 +39,7 @@ class UploadedFile(Base):
     __tablename__ = "uploaded_files"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id")
@@ -49,12 +51,12 @@ class UploadedFile(Base):
     # File metadata
     original_filename: Mapped[str] = mapped_column(String(255))
     stored_filename: Mapped[str] = mapped_column(String(255))
-    file_path: Mapped[str] = mapped_column(String(500))
+    file_path: Mapped[str] = mapped_column(Text)  # Relative to UPLOAD_DIR
     file_type: Mapped[FileType] = mapped_column(SQLEnum(FileType))
     file_size: Mapped[int] = mapped_column(BigInteger)  # Size in bytes
-    content_hash: Mapped[Optional[str]] = mapped_column(
-        String(64), nullable=True
-    )  # SHA-256 hash
+    content_hash: Mapped[Optional[bytes]] = mapped_column(
+        LargeBinary(32), nullable=True
+    )  # SHA-256 digest
 
     # Processing status
     status: Mapped[FileStatus] = mapped_column(
@@ -64,11 +66,8 @@ class UploadedFile(Base):
 
     # Extracted geometry - using Any for GeoAlchemy2 types
     boundary_geom: Mapped[Optional[Any]] = mapped_column(
-        Geometry("GEOMETRY", srid=4326), nullable=True
+        Geometry("GEOMETRY", srid=4326, spatial_index=False), nullable=True
     )
-    geometry_type: Mapped[Optional[str]] = mapped_column(
-        String(50), nullable=True
-    )  # Point, LineString, Polygon, etc.
     feature_count: Mapped[Optional[int]] = mapped_column(nullable=True)
 
     # Extracted metadata from file
@@ -84,3 +83,8 @@ class UploadedFile(Base):
     # Relationships
     user: Mapped["User"] = relationship(back_populates="uploaded_files")
     project: Mapped[Optional["Project"]] = relationship(back_populates="uploaded_files")
+
+    @property
+    def geometry_type(self) -> Optional[str]:
+        """Point, LineString, Polygon, etc., read from the extracted geometry."""
+        return geometry_type_name(self.boundary_geom)
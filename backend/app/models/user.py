@@ -8,6 +8,7 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
 from app.db.base import Base
+from app.db.ids import uuid7
 
 if TYPE_CHECKING:
     from app.models.asset_placement import AssetPlacement
@@ -21,7 +22,7 @@ class User(Base):
     __tablename__ = "users"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     email: Mapped[str] = mapped_column(String, unique=True, index=True)
     hashed_password: Mapped[Optional[str]] = mapped_column(
@@ -7,12 +7,13 @@ from typing import TYPE_CHECKING, Any, Optional
 
 from geoalchemy2 import Geometry
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import Float, ForeignKey, Integer, String, Text
+from sqlalchemy import Float, ForeignKey, Integer, LargeBinary, String, Text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
 from app.db.base import Base
+from app.db.ids import uuid7
 
 if TYPE_CHECKING:
     from app.models.asset_placement import AssetPlacement
@@ -42,7 +43,7 @@ class VolumeEstimation(Base):
     __tablename__ = "volume_estimations"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     project_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE")
@@ -127,7 +128,7 @@ class VolumeEstimation(Base):
 
     # Analysis bounds
     analysis_bounds: Mapped[Optional[Any]] = mapped_column(
-        Geometry("POLYGON", srid=4326), nullable=True
+        Geometry("POLYGON", srid=4326, spatial_index=False), nullable=True
     )
 
     # DEM information
@@ -141,7 +142,9 @@ class VolumeEstimation(Base):
     memory_peak_mb: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
 
     # Caching support
-    input_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    input_hash: Mapped[Optional[bytes]] = mapped_column(
+        LargeBinary(32), nullable=True
+    )  # SHA-256 digest of input params, hash indexed
     cache_valid_until: Mapped[Optional[datetime]] = mapped_column(nullable=True)
 
     # Timestamps
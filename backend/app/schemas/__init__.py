@@ -12,7 +12,6 @@ from app.schemas.auth import (
     GoogleOAuthRequest,
     GoogleUserInfo,
     Token,
-    TokenPayload,
     UserCreate,
     UserLogin,
     UserResponse,
@@ -87,7 +86,6 @@ from app.schemas.terrain import (
 __all__ = [
     # Auth schemas
     "Token",
-    "TokenPayload",
     "UserCreate",
     "UserLogin",
     "UserResponse",
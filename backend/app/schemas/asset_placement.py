@@ -159,6 +159,7 @@ class AssetPlacementListResponse(BaseModel):
 
     placements: list[AssetPlacementResponse]
     total: int
+    next_cursor: Optional[str] = None
 
 
 class AssetAdjustment(BaseModel):
@@ -10,11 +10,6 @@ class Token(BaseModel):
     token_type: str = "bearer"
 
 
-class TokenPayload(BaseModel):
-    sub: Optional[str] = None  # user_id
-    exp: Optional[int] = None
-
-
 # User schemas
 class UserBase(BaseModel):
     email: EmailStr
@@ -98,6 +98,40 @@ class ExclusionZoneListResponse(BaseModel):
     total: int
 
 
+class ExclusionZoneSummary(BaseModel):
+    """Exclusion zone without its geometries, for list views."""
+
+    id: UUID
+    project_id: UUID
+    user_id: UUID
+    name: str
+    description: Optional[str] = None
+    zone_type: str
+    source: str
+    geometry_type: str
+    bbox: list[float] = Field(
+        ...,
+        description="[min_x, min_y, max_x, max_y] of the buffered geometry if "
+        "present, otherwise of the geometry",
+    )
+    buffer_distance: Optional[float] = None
+    buffer_applied: bool
+    fill_color: Optional[str] = None
+    stroke_color: Optional[str] = None
+    fill_opacity: Optional[float] = None
+    area_sqm: Optional[float] = None
+    is_active: bool
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+
+class ExclusionZoneSummaryListResponse(BaseModel):
+    """Response for list of exclusion zone summaries."""
+
+    zones: list[ExclusionZoneSummary]
+    total: int
+
+
 class ExclusionZoneImportRequest(BaseModel):
     """Request to import zones from an uploaded file."""
 
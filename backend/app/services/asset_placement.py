@@ -8,12 +8,12 @@ on terrain slope, exclusion zones, and configurable optimization criteria.
 import logging
 import time
 import traceback
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from typing import Any, Callable, Optional
 
 import numpy as np
 import rasterio
-from scipy.spatial import distance_matrix  # type: ignore[import-untyped]
 from shapely.geometry import Point, Polygon, shape
 
 logger = logging.getLogger("sitelayout.asset_placement")
@@ -150,7 +150,7 @@ def load_terrain_data(
 def apply_constraints(
     cells: list[GridCell],
     max_slope: float,
-    exclusion_zones: list[dict[str, Any]],
+    exclusion_zones: Iterable[dict[str, Any]],
     placement_area: Optional[Polygon] = None,
 ) -> None:
     """
@@ -159,7 +159,7 @@ def apply_constraints(
     Args:
         cells: List of grid cells
         max_slope: Maximum allowed slope in degrees
-        exclusion_zones: List of exclusion zone geometries (GeoJSON)
+        exclusion_zones: Exclusion zone geometries (GeoJSON), consumed once
         placement_area: Optional polygon defining placement area
     """
     # Convert exclusion zones to Shapely geometries
@@ -347,6 +347,8 @@ def select_clustered_locations(
     Returns:
         Selected cells
     """
+    from scipy.spatial import distance_matrix  # type: ignore[import-untyped]
+
     # First, select top candidates based on quality scores
     num_candidates = min(num_assets * 3, len(cells))
     candidate_indices = np.argsort(scores)[:num_candidates]
@@ -408,6 +410,8 @@ def calculate_placement_metrics(
     Returns:
         Dictionary of metrics
     """
+    from scipy.spatial import distance_matrix  # type: ignore[import-untyped]
+
     if not selected_cells:
         return {
             "avg_slope": None,
@@ -449,7 +453,7 @@ def place_assets(
     max_slope: float,
     optimization_criteria: str,
     slope_raster_path: Optional[str] = None,
-    exclusion_zones: Optional[list[dict[str, Any]]] = None,
+    exclusion_zones: Optional[Iterable[dict[str, Any]]] = None,
     advanced_settings: Optional[dict[str, Any]] = None,
     progress_callback: Optional[Callable[[int, str], None]] = None,
 ) -> PlacementResult:
@@ -464,7 +468,8 @@ def place_assets(
         max_slope: Maximum allowed slope in degrees
         optimization_criteria: Type of optimization
         slope_raster_path: Optional path to slope raster
-        exclusion_zones: Optional list of exclusion zone geometries
+        exclusion_zones: Optional exclusion zone geometries; may be an iterator,
+            which is read only while constraints are applied
         advanced_settings: Optional advanced configuration
         progress_callback: Optional callback for progress updates
 
@@ -10,6 +10,7 @@ Supports:
 - DXF exports for CAD software (ezdxf)
 """
 
+import csv
 import io
 import json
 import logging
@@ -18,10 +19,10 @@ import zipfile
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import IO, Any, Iterator, Optional
 
-import ezdxf  # type: ignore[import-untyped]
-import geopandas as gpd
+# geopandas and ezdxf are imported by the exporters that use them: together
+# they take about a second to import, which every API process paid at startup
 import simplekml  # type: ignore[import-untyped]
 from reportlab.lib import colors  # type: ignore[import-untyped]
 from reportlab.lib.pagesizes import LETTER  # type: ignore[import-untyped]
@@ -41,10 +42,32 @@ from shapely.geometry import LineString, Point, shape
 
 logger = logging.getLogger("sitelayout.export")
 
+# PDF, KMZ and Shapefile exports are written to a spooled file that stays in
+# memory up to this size and moves to disk beyond it, then sent in chunks.
+EXPORT_SPOOL_SIZE = 8 * 1024 * 1024
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+
+def _spooled_file() -> IO[bytes]:
+    return tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_SIZE)
+
+
+def _dump_geojson(geojson: dict[str, Any]) -> bytes:
+    """Encode GeoJSON compactly.
+
+    json.dumps only uses its C encoder without indent; pretty-printing a large
+    FeatureCollection was several times slower and doubled the file size.
+    """
+    return json.dumps(geojson, separators=(",", ":")).encode("utf-8")
+
 
 @dataclass
 class ExportResult:
-    """Result of an export operation."""
+    """Result of an export operation.
+
+    Small text exports carry their bytes in file_content; binary exports
+    carry a spooled file instead, read through iter_content().
+    """
 
     success: bool
     file_content: Optional[bytes] = None
@@ -52,6 +75,21 @@ class ExportResult:
     content_type: str = ""
     error_message: Optional[str] = None
     metadata: dict[str, Any] = field(default_factory=dict)
+    file: Optional[IO[bytes]] = None
+
+    def iter_content(self, chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[bytes]:
+        """Yield the exported bytes, closing the spooled file when done."""
+        if self.file is None:
+            if self.file_content:
+                yield self.file_content
+            return
+
+        try:
+            self.file.seek(0)
+            while chunk := self.file.read(chunk_size):
+                yield chunk
+        finally:
+            self.file.close()
 
 
 class PDFReportGenerator:
@@ -101,7 +139,7 @@ class PDFReportGenerator:
     ) -> ExportResult:
         """Generate a comprehensive project report PDF."""
         try:
-            buffer = io.BytesIO()
+            buffer = _spooled_file()
             doc = SimpleDocTemplate(
                 buffer,
                 pagesize=LETTER,
@@ -336,7 +374,7 @@ class PDFReportGenerator:
 
             return ExportResult(
                 success=True,
-                file_content=buffer.getvalue(),
+                file=buffer,
                 filename=f"{project.get('name', 'project')}_report.pdf",
                 content_type="application/pdf",
                 metadata={"pages": 1, "generated_at": datetime.now().isoformat()},
@@ -429,7 +467,7 @@ class GeoJSONExporter:
                 "features": features,
             }
 
-            content = json.dumps(geojson, indent=2).encode("utf-8")
+            content = _dump_geojson(geojson)
 
             return ExportResult(
                 success=True,
@@ -487,7 +525,7 @@ class GeoJSONExporter:
                 "features": features,
             }
 
-            content = json.dumps(geojson, indent=2).encode("utf-8")
+            content = _dump_geojson(geojson)
 
             return ExportResult(
                 success=True,
@@ -536,7 +574,7 @@ class GeoJSONExporter:
                 "features": features,
             }
 
-            content = json.dumps(geojson, indent=2).encode("utf-8")
+            content = _dump_geojson(geojson)
 
             return ExportResult(
                 success=True,
@@ -643,7 +681,7 @@ class GeoJSONExporter:
                 "features": features,
             }
 
-            content = json.dumps(geojson, indent=2).encode("utf-8")
+            content = _dump_geojson(geojson)
 
             return ExportResult(
                 success=True,
@@ -780,12 +818,12 @@ class KMZExporter:
                                 pol.style = zone_style
 
             # Save to KMZ (compressed KML)
-            buffer = io.BytesIO()
+            buffer = _spooled_file()
             kml.savekmz(buffer)
 
             return ExportResult(
                 success=True,
-                file_content=buffer.getvalue(),
+                file=buffer,
                 filename=f"{project_name}.kmz",
                 content_type="application/vnd.google-earth.kmz",
                 metadata={"format": "KMZ", "generated_at": datetime.now().isoformat()},
@@ -805,6 +843,8 @@ class ShapefileExporter:
         project_name: str = "project",
     ) -> ExportResult:
         """Export asset placements to Shapefile."""
+        import geopandas as gpd
+
         try:
             # Build feature data
             records = []
@@ -838,7 +878,7 @@ class ShapefileExporter:
                 gdf.to_file(shp_path, driver="ESRI Shapefile")
 
                 # Create zip with all shapefile components
-                buffer = io.BytesIO()
+                buffer = _spooled_file()
                 with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
                     for ext in [".shp", ".shx", ".dbf", ".prj", ".cpg"]:
                         file_path = shp_path.with_suffix(ext)
@@ -847,7 +887,7 @@ class ShapefileExporter:
 
             return ExportResult(
                 success=True,
-                file_content=buffer.getvalue(),
+                file=buffer,
                 filename=f"{project_name}_assets.zip",
                 content_type="application/zip",
                 metadata={"feature_count": len(records), "format": "Shapefile"},
@@ -863,6 +903,8 @@ class ShapefileExporter:
         project_name: str = "project",
     ) -> ExportResult:
         """Export road networks to Shapefile."""
+        import geopandas as gpd
+
         try:
             records = []
             for network in networks:
@@ -891,7 +933,7 @@ class ShapefileExporter:
                 shp_path = Path(tmpdir) / f"{project_name}_roads.shp"
                 gdf.to_file(shp_path, driver="ESRI Shapefile")
 
-                buffer = io.BytesIO()
+                buffer = _spooled_file()
                 with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
                     for ext in [".shp", ".shx", ".dbf", ".prj", ".cpg"]:
                         file_path = shp_path.with_suffix(ext)
@@ -900,7 +942,7 @@ class ShapefileExporter:
 
             return ExportResult(
                 success=True,
-                file_content=buffer.getvalue(),
+                file=buffer,
                 filename=f"{project_name}_roads.zip",
                 content_type="application/zip",
                 metadata={"feature_count": len(records), "format": "Shapefile"},
@@ -916,6 +958,8 @@ class ShapefileExporter:
         project_name: str = "project",
     ) -> ExportResult:
         """Export exclusion zones to Shapefile."""
+        import geopandas as gpd
+
         try:
             records = []
             for zone in zones:
@@ -942,7 +986,7 @@ class ShapefileExporter:
                 shp_path = Path(tmpdir) / f"{project_name}_zones.shp"
                 gdf.to_file(shp_path, driver="ESRI Shapefile")
 
-                buffer = io.BytesIO()
+                buffer = _spooled_file()
                 with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
                     for ext in [".shp", ".shx", ".dbf", ".prj", ".cpg"]:
                         file_path = shp_path.with_suffix(ext)
@@ -951,7 +995,7 @@ class ShapefileExporter:
 
             return ExportResult(
                 success=True,
-                file_content=buffer.getvalue(),
+                file=buffer,
                 filename=f"{project_name}_zones.zip",
                 content_type="application/zip",
                 metadata={"feature_count": len(records), "format": "Shapefile"},
@@ -972,8 +1016,6 @@ class CSVExporter:
     ) -> ExportResult:
         """Export asset placement list to CSV."""
         try:
-            import csv
-
             buffer = io.StringIO()
             writer = csv.writer(buffer)
 
@@ -1032,8 +1074,6 @@ class CSVExporter:
     ) -> ExportResult:
         """Export road segment data to CSV."""
         try:
-            import csv
-
             buffer = io.StringIO()
             writer = csv.writer(buffer)
 
@@ -1094,8 +1134,6 @@ class CSVExporter:
     ) -> ExportResult:
         """Export project summary to CSV."""
         try:
-            import csv
-
             buffer = io.StringIO()
             writer = csv.writer(buffer)
 
@@ -1209,6 +1247,8 @@ class DXFExporter:
         exclusion_zones: Optional[list[dict[str, Any]]] = None,
     ) -> ExportResult:
         """Export project data to DXF format."""
+        import ezdxf  # type: ignore[import-untyped]
+
         try:
             doc = ezdxf.new("R2018")
             msp = doc.modelspace()
@@ -4,13 +4,12 @@ Parses geographic files and validates geometry using Shapely.
 """
 
 import hashlib
-import io
 import logging
+import os
 import xml.etree.ElementTree as ET
 import zipfile
 from dataclasses import dataclass
-from pathlib import Path
-from typing import Any, Optional
+from typing import IO, Any, Optional
 
 from shapely.geometry import (
     GeometryCollection,
@@ -56,12 +55,13 @@ class ValidationResult:
     file_type: str  # "kml" or "kmz"
     geometry_result: Optional[GeometryResult] = None
     error_message: Optional[str] = None
-    content_hash: Optional[str] = None
+    content_hash: Optional[bytes] = None
 
 
-def calculate_file_hash(file_content: bytes) -> str:
-    """Calculate SHA-256 hash of file content."""
-    return hashlib.sha256(file_content).hexdigest()
+def calculate_file_hash(file_path: str) -> bytes:
+    """Calculate SHA-256 hash of a file, reading it in chunks."""
+    with open(file_path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").digest()
 
 
 def parse_kml_coordinates(coord_text: str) -> list[tuple[float, float, float]]:
@@ -90,77 +90,135 @@ def parse_kml_coordinates(coord_text: str) -> list[tuple[float, float, float]]:
     return coords
 
 
-def extract_geometry_from_kml_element(element: ET.Element) -> list[Any]:
-    """Extract Shapely geometries from a KML element."""
-    geometries = []
+def _kml_tag(name: str) -> str:
+    return f"{{{KML_NS['kml']}}}{name}"
+
+
+KML_POINT = _kml_tag("Point")
+KML_LINESTRING = _kml_tag("LineString")
+KML_POLYGON = _kml_tag("Polygon")
+KML_PLACEMARK = _kml_tag("Placemark")
+KML_DOCUMENT = _kml_tag("Document")
+KML_NAME = _kml_tag("name")
+KML_DESCRIPTION = _kml_tag("description")
 
-    # Find Point elements
-    for point in element.findall(".//kml:Point/kml:coordinates", KML_NS):
-        coords = parse_kml_coordinates(point.text or "")
+
+def points_from_kml_element(point: ET.Element) -> list[Point]:
+    """Build Points from a KML Point element (only the first coordinate counts)."""
+    geometries = []
+    for coordinates in point.findall("kml:coordinates", KML_NS):
+        coords = parse_kml_coordinates(coordinates.text or "")
         if coords:
-            # Point only uses first coordinate
             lon, lat, _ = coords[0]
             geometries.append(Point(lon, lat))
+    return geometries
 
-    # Find LineString elements
-    for linestring in element.findall(".//kml:LineString/kml:coordinates", KML_NS):
-        coords = parse_kml_coordinates(linestring.text or "")
+
+def linestrings_from_kml_element(linestring: ET.Element) -> list[LineString]:
+    """Build LineStrings from a KML LineString element."""
+    geometries = []
+    for coordinates in linestring.findall("kml:coordinates", KML_NS):
+        coords = parse_kml_coordinates(coordinates.text or "")
         if len(coords) >= 2:
             geometries.append(LineString([(c[0], c[1]) for c in coords]))
+    return geometries
 
-    # Find Polygon elements
-    for polygon in element.findall(".//kml:Polygon", KML_NS):
-        outer_coords = []
-        inner_rings = []
-
-        # Outer boundary
-        outer_boundary = polygon.find(
-            ".//kml:outerBoundaryIs/kml:LinearRing/kml:coordinates", KML_NS
-        )
-        if outer_boundary is not None:
-            coords = parse_kml_coordinates(outer_boundary.text or "")
-            if len(coords) >= 4:
-                outer_coords = [(c[0], c[1]) for c in coords]
-
-        # Inner boundaries (holes)
-        for inner in polygon.findall(
-            ".//kml:innerBoundaryIs/kml:LinearRing/kml:coordinates", KML_NS
-        ):
-            coords = parse_kml_coordinates(inner.text or "")
-            if len(coords) >= 4:
-                inner_rings.append([(c[0], c[1]) for c in coords])
-
-        if outer_coords:
-            if inner_rings:
-                geometries.append(Polygon(outer_coords, inner_rings))
-            else:
-                geometries.append(Polygon(outer_coords))
 
-    return geometries
+def polygon_from_kml_element(polygon: ET.Element) -> Optional[Polygon]:
+    """Build a Polygon, with its holes, from a KML Polygon element."""
+    outer_coords = []
+    inner_rings = []
 
+    # Outer boundary
+    outer_boundary = polygon.find(
+        ".//kml:outerBoundaryIs/kml:LinearRing/kml:coordinates", KML_NS
+    )
+    if outer_boundary is not None:
+        coords = parse_kml_coordinates(outer_boundary.text or "")
+        if len(coords) >= 4:
+            outer_coords = [(c[0], c[1]) for c in coords]
+
+    # Inner boundaries (holes)
+    for inner in polygon.findall(
+        ".//kml:innerBoundaryIs/kml:LinearRing/kml:coordinates", KML_NS
+    ):
+        coords = parse_kml_coordinates(inner.text or "")
+        if len(coords) >= 4:
+            inner_rings.append([(c[0], c[1]) for c in coords])
+
+    if not outer_coords:
+        return None
+    if inner_rings:
+        return Polygon(outer_coords, inner_rings)
+    return Polygon(outer_coords)
 
-def extract_metadata_from_kml(root: ET.Element) -> tuple[Optional[str], Optional[str]]:
-    """Extract name and description from KML root element."""
-    name = None
-    description = None
 
-    # Try to find Document name first
-    doc_name = root.find(".//kml:Document/kml:name", KML_NS)
-    if doc_name is not None and doc_name.text:
-        name = doc_name.text.strip()
+@dataclass
+class KMLContent:
+    """Geometries and metadata read from a KML document."""
 
-    # Fall back to first Placemark name
-    if not name:
-        pm_name = root.find(".//kml:Placemark/kml:name", KML_NS)
-        if pm_name is not None and pm_name.text:
-            name = pm_name.text.strip()
+    geometries: list[Any]
+    name: Optional[str] = None
+    description: Optional[str] = None
 
-    # Get description
-    doc_desc = root.find(".//kml:Document/kml:description", KML_NS)
-    if doc_desc is not None and doc_desc.text:
-        description = doc_desc.text.strip()
 
-    return name, description
+def read_kml(source: str | IO[bytes]) -> KMLContent:
+    """
+    Stream a KML document and collect its geometries and metadata.
+
+    Each Point, LineString and Polygon is converted once its closing tag is
+    read and then cleared, as are finished Placemarks, so memory stays
+    proportional to one feature rather than the whole document. Geometries
+    are returned points first, then lines, then polygons, each in document
+    order. The name is the first Document name, else the first Placemark
+    name; the description is the first Document description.
+    """
+    points: list[Any] = []
+    lines: list[Any] = []
+    polygons: list[Any] = []
+    # Text of the first matching element ("" if it is empty, None if absent)
+    doc_name: Optional[str] = None
+    placemark_name: Optional[str] = None
+    doc_description: Optional[str] = None
+
+    parents: list[str] = []
+    for event, elem in ET.iterparse(source, events=("start", "end")):
+        if event == "start":
+            parents.append(elem.tag)
+            continue
+
+        parents.pop()
+        tag = elem.tag
+        parent = parents[-1] if parents else None
+        if tag == KML_POINT:
+            points.extend(points_from_kml_element(elem))
+            elem.clear()
+        elif tag == KML_LINESTRING:
+            lines.extend(linestrings_from_kml_element(elem))
+            elem.clear()
+        elif tag == KML_POLYGON:
+            polygon = polygon_from_kml_element(elem)
+            if polygon is not None:
+                polygons.append(polygon)
+            elem.clear()
+        elif tag == KML_PLACEMARK:
+            elem.clear()
+        elif tag == KML_NAME:
+            if parent == KML_DOCUMENT and doc_name is None:
+                doc_name = elem.text or ""
+            elif parent == KML_PLACEMARK and placemark_name is None:
+                placemark_name = elem.text or ""
+        elif tag == KML_DESCRIPTION:
+            if parent == KML_DOCUMENT and doc_description is None:
+                doc_description = elem.text or ""
+
+    # Fall back to the first Placemark name
+    name = doc_name.strip() if doc_name else None
+    if not name and placemark_name:
+        name = placemark_name.strip()
+    description = doc_description.strip() if doc_description else None
+
+    return KMLContent(points + lines + polygons, name, description)
 
 
 def validate_and_fix_geometry(geometry: Any) -> tuple[Any, bool, Optional[str]]:
@@ -192,17 +250,12 @@ def validate_and_fix_geometry(geometry: Any) -> tuple[Any, bool, Optional[str]]:
     return geometry, True, None
 
 
-def parse_kml_content(kml_content: bytes) -> GeometryResult:
-    """Parse KML content and extract geometry."""
+def parse_kml(source: str | IO[bytes]) -> GeometryResult:
+    """Parse a KML file (path or binary file object) and extract geometry."""
     try:
-        # Parse XML
-        root = ET.fromstring(kml_content)
-
-        # Extract metadata
-        name, description = extract_metadata_from_kml(root)
-
-        # Extract all geometries
-        geometries = extract_geometry_from_kml_element(root)
+        kml = read_kml(source)
+        geometries = kml.geometries
+        name, description = kml.name, kml.description
 
         if not geometries:
             return GeometryResult(
@@ -270,24 +323,27 @@ def parse_kml_content(kml_content: bytes) -> GeometryResult:
         )
 
 
-def validate_file(file_path: Path, file_content: bytes) -> ValidationResult:
+def validate_file(
+    file_path: str, content_hash: Optional[bytes] = None
+) -> ValidationResult:
     """
-    Validate a KMZ or KML file.
+    Validate a KMZ or KML file, streaming it from disk.
 
     Args:
-        file_path: Path to the file (used to determine type)
-        file_content: Raw file content
+        file_path: Path to the file (its extension determines the type)
+        content_hash: SHA-256 digest of the file, if already computed
 
     Returns:
         ValidationResult with validation status and extracted geometry
     """
-    file_extension = file_path.suffix.lower()
-    content_hash = calculate_file_hash(file_content)
+    file_extension = os.path.splitext(file_path)[1].lower()
+    if content_hash is None:
+        content_hash = calculate_file_hash(file_path)
 
     if file_extension == ".kmz":
-        return validate_kmz(file_content, content_hash)
+        return validate_kmz(file_path, content_hash)
     elif file_extension == ".kml":
-        return validate_kml(file_content, content_hash)
+        return validate_kml(file_path, content_hash)
     else:
         return ValidationResult(
             is_valid=False,
@@ -297,9 +353,9 @@ def validate_file(file_path: Path, file_content: bytes) -> ValidationResult:
         )
 
 
-def validate_kml(kml_content: bytes, content_hash: str) -> ValidationResult:
+def validate_kml(file_path: str, content_hash: bytes) -> ValidationResult:
     """Validate a KML file."""
-    geometry_result = parse_kml_content(kml_content)
+    geometry_result = parse_kml(file_path)
 
     return ValidationResult(
         is_valid=geometry_result.is_valid,
@@ -310,11 +366,11 @@ def validate_kml(kml_content: bytes, content_hash: str) -> ValidationResult:
     )
 
 
-def validate_kmz(kmz_content: bytes, content_hash: str) -> ValidationResult:
+def validate_kmz(file_path: str, content_hash: bytes) -> ValidationResult:
     """Validate a KMZ file (zipped KML)."""
     try:
         # KMZ is a ZIP file containing a KML file
-        with zipfile.ZipFile(io.BytesIO(kmz_content), "r") as zf:
+        with zipfile.ZipFile(file_path, "r") as zf:
             # Find the main KML file (usually doc.kml or *.kml)
             kml_files = [f for f in zf.namelist() if f.lower().endswith(".kml")]
 
@@ -328,9 +384,8 @@ def validate_kmz(kmz_content: bytes, content_hash: str) -> ValidationResult:
 
             # Prefer doc.kml if present, otherwise use first KML file
             main_kml = "doc.kml" if "doc.kml" in kml_files else kml_files[0]
-            kml_content = zf.read(main_kml)
-
-            geometry_result = parse_kml_content(kml_content)
+            with zf.open(main_kml) as kml_file:
+                geometry_result = parse_kml(kml_file)
 
             return ValidationResult(
                 is_valid=geometry_result.is_valid,
@@ -9,7 +9,7 @@ import os
 import time
 from dataclasses import dataclass, field
 from datetime import timedelta
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Iterable, Optional, Sequence
 
 import numpy as np
 import rasterio
@@ -42,6 +42,22 @@ ASPECT_DIRECTIONS = {
 }
 
 
+def pack_bins(values: dict[str, float], keys: Iterable[str]) -> Optional[list[float]]:
+    """Pack per-class percentages into a fixed-order array for storage."""
+    if not values:
+        return None
+    return [values.get(key, 0.0) for key in keys]
+
+
+def unpack_bins(
+    values: Optional[Sequence[float]], keys: Iterable[str]
+) -> dict[str, float]:
+    """Inverse of pack_bins."""
+    if not values:
+        return {}
+    return dict(zip(keys, values))
+
+
 @dataclass
 class ProgressTracker:
     """Tracks progress of terrain analysis."""
@@ -113,7 +129,7 @@ class TerrainAnalysisResult:
     bounds_geojson: dict = field(default_factory=dict)
     processing_time: float = 0.0
     memory_peak_mb: float = 0.0
-    input_hash: str = ""
+    input_hash: bytes = b""
     error_message: Optional[str] = None
 
 
@@ -121,8 +137,8 @@ def calculate_input_hash(
     dem_path: str,
     bounds: Optional[tuple[float, float, float, float]] = None,
     resolution: Optional[float] = None,
-) -> str:
-    """Calculate hash of input parameters for caching."""
+) -> bytes:
+    """Calculate SHA-256 digest of input parameters for caching."""
     hash_input = f"{dem_path}"
     if bounds:
         hash_input += (
@@ -130,7 +146,7 @@ def calculate_input_hash(
         )
     if resolution:
         hash_input += f":{resolution:.2f}"
-    return hashlib.sha256(hash_input.encode()).hexdigest()
+    return hashlib.sha256(hash_input.encode()).digest()
 
 
 def load_dem(
@@ -1,4 +1,7 @@
 import os
+from datetime import timedelta
+from urllib.parse import quote
+from uuid import uuid4
 
 # Set environment variables before importing app
 os.environ["DATABASE_URL"] = "sqlite:///./test.db"
@@ -10,13 +13,17 @@ os.environ["GOOGLE_CLIENT_SECRET"] = ""
 
 import pytest  # noqa: E402
 from fastapi.testclient import TestClient  # noqa: E402
-from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy import create_engine, event  # noqa: E402
 from sqlalchemy.orm import sessionmaker  # noqa: E402
 
+from app.api.v1.endpoints.auth import _CachedCertsRequest  # noqa: E402
 from app.core.config import settings  # noqa: E402
+from app.core.security import create_access_token, decode_access_token  # noqa: E402
+from app.crud.user import user as user_crud  # noqa: E402
 from app.db.base import get_db  # noqa: E402
 from app.main import fastapi_app as app  # noqa: E402
 from app.models.user import User  # noqa: E402
+from app.schemas.auth import UserUpdate  # noqa: E402
 
 # Create test database
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
@@ -282,6 +289,21 @@ class TestGoogleOAuth:
         # Either success (200) or not configured (501)
         assert response.status_code in [200, 501]
 
+    def test_google_authorize_url_encoding(self, setup_database):
+        """The authorization URL carries the configured, encoded redirect URI."""
+        original_client_id = settings.GOOGLE_CLIENT_ID
+        settings.GOOGLE_CLIENT_ID = "client-id"
+        try:
+            response = client.get(f"{settings.API_V1_STR}/auth/google/authorize")
+        finally:
+            settings.GOOGLE_CLIENT_ID = original_client_id
+
+        assert response.status_code == 200
+        url = response.json()["authorization_url"]
+        assert "client_id=client-id" in url
+        assert "scope=openid%20email%20profile" in url
+        assert "redirect_uri=" + quote(settings.GOOGLE_REDIRECT_URI, safe="") in url
+
     def test_google_oauth_not_configured(self, setup_database):
         """Test Google OAuth when not configured."""
         # Save original values
@@ -303,6 +325,30 @@ class TestGoogleOAuth:
         # Restore original value
         settings.GOOGLE_CLIENT_ID = original_client_id
 
+    def test_google_certs_are_cached(self):
+        """Google's signing certs are fetched once per max-age."""
+
+        class FakeResponse:
+            status_code = 200
+            headers = {"cache-control": "public, max-age=19800"}
+            content = b'{"kid": "cert"}'
+
+        class FakeSession:
+            calls = 0
+
+            def request(self, method, url, **kwargs):
+                FakeSession.calls += 1
+                return FakeResponse()
+
+            def close(self):
+                pass
+
+        request = _CachedCertsRequest(session=FakeSession())
+        first = request("https://www.googleapis.com/oauth2/v1/certs")
+        second = request("https://www.googleapis.com/oauth2/v1/certs")
+        assert first.data == second.data == b'{"kid": "cert"}'
+        assert FakeSession.calls == 1
+
 
 class TestPasswordSecurity:
     """Test password hashing and verification."""
@@ -323,3 +369,91 @@ class TestPasswordSecurity:
         assert user.hashed_password != test_user_data["password"]
         assert user.hashed_password.startswith("$2b$")  # bcrypt hash
         db.close()
+
+
+class TestCurrentUserCache:
+    """Test the short-lived user cache behind get_current_user."""
+
+    def test_cached_user_skips_query(self, setup_database, test_user_data):
+        """A recently loaded user is attached to a new session without a query."""
+        client.post(
+            f"{settings.API_V1_STR}/auth/register",
+            json=test_user_data,
+        )
+        db = TestingSessionLocal()
+        user_id = user_crud.get_by_email(db, email=test_user_data["email"]).id
+        user_crud.get_cached(db, user_id=user_id)
+        db.close()
+
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        db = TestingSessionLocal()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            user = user_crud.get_cached(db, user_id=user_id)
+            assert user is not None
+            assert user in db
+            assert user.email == test_user_data["email"]
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+            db.close()
+        assert statements == []
+
+    def test_cached_user_flags_skip_query(self, setup_database, test_user_data):
+        """is_active/is_superuser checks on a cached user need no query."""
+        client.post(
+            f"{settings.API_V1_STR}/auth/register",
+            json=test_user_data,
+        )
+        db = TestingSessionLocal()
+        user_id = user_crud.get_by_email(db, email=test_user_data["email"]).id
+        user_crud.get_cached(db, user_id=user_id)
+        db.commit()  # expires everything loaded in this session
+        db.close()
+
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        db = TestingSessionLocal()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            user = user_crud.get_cached(db, user_id=user_id)
+            assert user_crud.is_active(user)
+            assert not user_crud.is_superuser(user)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+            db.close()
+        assert statements == []
+
+    def test_update_invalidates_cache(self, setup_database, test_user_data):
+        """Changing a user drops the cached copy."""
+        client.post(
+            f"{settings.API_V1_STR}/auth/register",
+            json=test_user_data,
+        )
+        db = TestingSessionLocal()
+        user = user_crud.get_by_email(db, email=test_user_data["email"])
+        user_crud.get_cached(db, user_id=user.id)
+        user_crud.update(db, db_obj=user, user_in=UserUpdate(full_name="Renamed"))
+        db.close()
+
+        db = TestingSessionLocal()
+        assert user_crud.get_cached(db, user_id=user.id).full_name == "Renamed"
+        db.close()
+
+    def test_decoded_token_is_cached(self):
+        """A verified token is decoded once and then served from the cache."""
+        token = create_access_token({"sub": str(uuid4())})
+        payload = decode_access_token(token)
+        assert payload is not None
+        assert decode_access_token(token) is payload
+
+    def test_expired_token_is_not_cached(self):
+        """Expired tokens are rejected rather than served from the cache."""
+        token = create_access_token({"sub": str(uuid4())}, timedelta(seconds=-1))
+        assert decode_access_token(token) is None
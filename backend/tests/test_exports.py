@@ -2,6 +2,7 @@
 
 import io
 import json
+import tempfile
 import zipfile
 
 from app.services.export_service import (
@@ -169,6 +170,16 @@ class TestExportResult:
         assert result.filename == "test.pdf"
         assert result.content_type == "application/pdf"
         assert result.error_message is None
+        assert list(result.iter_content()) == [b"test content"]
+
+    def test_streamed_result(self):
+        """Test spooled export results are read in chunks and closed."""
+        spooled = tempfile.SpooledTemporaryFile()
+        spooled.write(b"abcdefg")
+        result = ExportResult(success=True, file=spooled)
+
+        assert list(result.iter_content(chunk_size=3)) == [b"abc", b"def", b"g"]
+        assert spooled.closed
 
     def test_failure_result(self):
         """Test failed export result."""
@@ -190,8 +201,7 @@ class TestPDFReportGenerator:
         result = generator.generate_project_report(SAMPLE_PROJECT)
 
         assert result.success is True
-        assert result.file_content is not None
-        assert len(result.file_content) > 0
+        assert b"".join(result.iter_content()).startswith(b"%PDF")
         assert result.content_type == "application/pdf"
         assert result.filename.endswith(".pdf")
 
@@ -207,8 +217,7 @@ class TestPDFReportGenerator:
         )
 
         assert result.success is True
-        assert result.file_content is not None
-        assert len(result.file_content) > 1000  # PDF should have content
+        assert len(b"".join(result.iter_content())) > 1000  # PDF should have content
 
     def test_generate_report_without_data(self):
         """Test PDF report generation with minimal data."""
@@ -218,7 +227,7 @@ class TestPDFReportGenerator:
         )
 
         assert result.success is True
-        assert result.file_content is not None
+        assert result.file is not None
 
 
 class TestGeoJSONExporter:
@@ -318,7 +327,7 @@ class TestKMZExporter:
         assert result.success is True
         assert result.content_type == "application/vnd.google-earth.kmz"
         assert result.filename.endswith(".kmz")
-        assert len(result.file_content) > 0
+        assert len(b"".join(result.iter_content())) > 0
 
     def test_export_assets_only(self):
         """Test exporting only assets to KMZ."""
@@ -329,7 +338,7 @@ class TestKMZExporter:
         )
 
         assert result.success is True
-        assert len(result.file_content) > 0
+        assert len(b"".join(result.iter_content())) > 0
 
     def test_export_empty_project(self):
         """Test exporting empty project to KMZ."""
@@ -352,7 +361,7 @@ class TestShapefileExporter:
         assert result.filename.endswith(".zip")
 
         # Check zip contents
-        with zipfile.ZipFile(io.BytesIO(result.file_content)) as zf:
+        with zipfile.ZipFile(io.BytesIO(b"".join(result.iter_content()))) as zf:
             names = zf.namelist()
             # Should contain shapefile components
             assert any(n.endswith(".shp") for n in names)
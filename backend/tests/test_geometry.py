@@ -0,0 +1,40 @@
+"""Tests for reading geometry types from WKB headers."""
+
+from geoalchemy2.elements import WKBElement, WKTElement
+from geoalchemy2.shape import from_shape
+from shapely import wkb
+from shapely.geometry import MultiPolygon, Point, Polygon
+
+from app.db.geometry import geometry_type_name
+
+SQUARE = Polygon([(0, 0), (1, 0), (1, 1), (0, 1)])
+
+
+class TestGeometryTypeName:
+    """Tests for geometry_type_name."""
+
+    def test_none(self):
+        """Missing geometry has no type."""
+        assert geometry_type_name(None) is None
+
+    def test_from_shape(self):
+        """Plain WKB from from_shape is recognised."""
+        assert geometry_type_name(from_shape(SQUARE, srid=4326)) == "Polygon"
+        assert geometry_type_name(from_shape(Point(1, 2), srid=4326)) == "Point"
+
+    def test_ewkb_hex_with_srid(self):
+        """Hex EWKB with the SRID flag, as returned by PostGIS, is recognised."""
+        multi = MultiPolygon([SQUARE])
+        data = wkb.dumps(multi, hex=True, srid=4326)
+        element = WKBElement(data, srid=4326, extended=True)
+        assert geometry_type_name(element) == "MultiPolygon"
+
+    def test_big_endian_3d(self):
+        """Byte order and Z flag do not affect the type."""
+        data = wkb.dumps(Point(1, 2, 3), big_endian=True)
+        assert geometry_type_name(WKBElement(data, srid=4326)) == "Point"
+
+    def test_wkt_element(self):
+        """Non-WKB elements fall back to shapely."""
+        element = WKTElement("LINESTRING(0 0, 1 1)", srid=4326)
+        assert geometry_type_name(element) == "LineString"
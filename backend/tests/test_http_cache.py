@@ -0,0 +1,33 @@
+"""Tests for conditional GET helpers."""
+
+from starlette.requests import Request
+
+from app.core.http_cache import etag_matches, make_etag
+
+
+def _request(if_none_match=None):
+    headers = []
+    if if_none_match is not None:
+        headers.append((b"if-none-match", if_none_match.encode()))
+    return Request({"type": "http", "headers": headers})
+
+
+class TestETags:
+    """Tests for make_etag and etag_matches."""
+
+    def test_make_etag(self):
+        """ETags are quoted and change with their inputs."""
+        etag = make_etag("project", 3, 1.5)
+        assert etag.startswith('"') and etag.endswith('"')
+        assert etag == make_etag("project", 3, 1.5)
+        assert etag != make_etag("project", 4, 1.5)
+
+    def test_etag_matches(self):
+        """If-None-Match matches exact, weak, listed and wildcard tags."""
+        etag = make_etag("zones")
+        assert etag_matches(_request(etag), etag)
+        assert etag_matches(_request(f"W/{etag}"), etag)
+        assert etag_matches(_request(f'"other", {etag}'), etag)
+        assert etag_matches(_request("*"), etag)
+        assert not etag_matches(_request('"other"'), etag)
+        assert not etag_matches(_request(), etag)
@@ -0,0 +1,40 @@
+"""Tests for primary key generation."""
+
+import time
+import uuid
+
+from app.db.ids import uuid7
+
+
+class TestUUID7:
+    """Tests for time-ordered UUIDv7 generation."""
+
+    def test_version_and_variant(self):
+        """Test that generated UUIDs carry the v7 version and RFC variant."""
+        value = uuid7()
+
+        assert isinstance(value, uuid.UUID)
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+
+    def test_embeds_current_timestamp(self):
+        """Test that the high 48 bits hold the current Unix time in ms."""
+        before = time.time_ns() // 1_000_000
+        value = uuid7()
+        after = time.time_ns() // 1_000_000
+
+        assert before <= value.int >> 80 <= after
+
+    def test_time_ordered(self):
+        """Test that UUIDs from later milliseconds sort after earlier ones."""
+        first = uuid7()
+        time.sleep(0.002)
+        second = uuid7()
+
+        assert first < second
+
+    def test_unique(self):
+        """Test that UUIDs within the same millisecond remain unique."""
+        values = {uuid7() for _ in range(1000)}
+
+        assert len(values) == 1000
@@ -0,0 +1,44 @@
+"""Tests for keyset pagination cursors."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from app.core.pagination import decode_cursor, encode_cursor, page_total
+from app.db.ids import uuid7
+
+
+class TestCursors:
+    """Tests for encode_cursor and decode_cursor."""
+
+    def test_round_trip(self):
+        """A cursor decodes back to the row's sort key."""
+        created_at = datetime(2026, 10, 17, 12, 30, 5, 123456, tzinfo=timezone.utc)
+        row_id = uuid7()
+        assert decode_cursor(encode_cursor(created_at, row_id)) == (
+            created_at,
+            row_id,
+        )
+
+    @pytest.mark.parametrize("cursor", ["", "not a cursor", "bm90LWEtZGF0ZXxpZA"])
+    def test_invalid(self, cursor):
+        """Malformed cursors raise ValueError."""
+        with pytest.raises(ValueError):
+            decode_cursor(cursor)
+
+
+class TestPageTotal:
+    """Tests for page_total."""
+
+    def _count(self):
+        raise AssertionError("count should not be called")
+
+    @pytest.mark.parametrize("skip,page_len,total", [(0, 0, 0), (0, 7, 7), (40, 3, 43)])
+    def test_short_page(self, skip, page_len, total):
+        """A short page gives the total without counting."""
+        assert page_total(skip, 20, page_len, self._count) == total
+
+    @pytest.mark.parametrize("skip,page_len", [(0, 20), (40, 20), (40, 0)])
+    def test_counts(self, skip, page_len):
+        """Full pages and pages past the end fall back to count."""
+        assert page_total(skip, 20, page_len, lambda: 99) == 99
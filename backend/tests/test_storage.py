@@ -0,0 +1,97 @@
+"""Tests for UPLOAD_DIR-relative storage keys."""
+
+import errno
+import os
+import shutil
+
+import pytest
+
+from app.core.config import settings
+from app.core.storage import PendingFile, resolve_storage_path, storage_key
+
+
+class TestStorageKeys:
+    """Tests for storage_key and resolve_storage_path."""
+
+    def test_round_trip(self):
+        """Paths under UPLOAD_DIR are stored relative and resolve back."""
+        path = os.path.join(settings.UPLOAD_DIR, "terrain_analysis", "p", "a.tif")
+        key = storage_key(path)
+        assert key == os.path.join("terrain_analysis", "p", "a.tif")
+        assert os.path.abspath(resolve_storage_path(key)) == os.path.abspath(path)
+
+    def test_outside_upload_dir(self):
+        """Paths outside UPLOAD_DIR are kept as given and pass through."""
+        assert storage_key("/elsewhere/dem.tif") == "/elsewhere/dem.tif"
+        assert resolve_storage_path("/elsewhere/dem.tif") == "/elsewhere/dem.tif"
+
+    def test_empty(self):
+        """Missing paths stay missing."""
+        assert storage_key(None) is None
+        assert resolve_storage_path(None) is None
+
+
+def _refuse_proc_link(link):
+    """Wrap os.link so linking through /proc fails as in some sandboxes."""
+
+    def refuse(src, dst, *args, **kwargs):
+        if str(src).startswith("/proc/"):
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+        return link(src, dst, *args, **kwargs)
+
+    return refuse
+
+
+class TestPendingFile:
+    """Tests for PendingFile."""
+
+    def test_publish(self, tmp_path):
+        """A published file appears under its name with the written bytes."""
+        target = tmp_path / "site.kml"
+        with PendingFile(str(tmp_path)) as pending:
+            pending.file.write(b"<kml/>")
+            pending.publish(str(target))
+        assert target.read_bytes() == b"<kml/>"
+        assert os.listdir(tmp_path) == ["site.kml"]
+
+    def test_publish_existing(self, tmp_path):
+        """Publishing over an existing name fails and leaves it untouched."""
+        target = tmp_path / "site.kml"
+        target.write_bytes(b"old")
+        with PendingFile(str(tmp_path)) as pending:
+            pending.file.write(b"<kml/>")
+            with pytest.raises(FileExistsError):
+                pending.publish(str(target))
+        assert target.read_bytes() == b"old"
+        assert os.listdir(tmp_path) == ["site.kml"]
+
+    def test_publish_by_copy(self, tmp_path, monkeypatch):
+        """Where linking through /proc is refused, the contents are copied."""
+        monkeypatch.setattr(os, "link", _refuse_proc_link(os.link))
+        target = tmp_path / "site.kml"
+        with PendingFile(str(tmp_path)) as pending:
+            pending.file.write(b"<kml/>")
+            pending.publish(str(target))
+        assert target.read_bytes() == b"<kml/>"
+        assert os.listdir(tmp_path) == ["site.kml"]
+
+    def test_failed_copy(self, tmp_path, monkeypatch):
+        """A copy that fails part way leaves no file under the name."""
+
+        def disk_full(src, dst):
+            dst.write(b"<k")
+            raise OSError(errno.ENOSPC, "No space left on device")
+
+        monkeypatch.setattr(os, "link", _refuse_proc_link(os.link))
+        monkeypatch.setattr(shutil, "copyfileobj", disk_full)
+        with PendingFile(str(tmp_path)) as pending:
+            pending.file.write(b"<kml/>")
+            with pytest.raises(OSError):
+                pending.publish(str(tmp_path / "site.kml"))
+        assert os.listdir(tmp_path) == []
+
+    def test_discarded(self, tmp_path):
+        """A file that is never published leaves nothing behind."""
+        with PendingFile(str(tmp_path)) as pending:
+            pending.file.write(b"<kml/>")
+        assert os.listdir(tmp_path) == []
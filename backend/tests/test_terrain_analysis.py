@@ -11,6 +11,7 @@ from rasterio.crs import CRS
 from rasterio.transform import from_bounds
 
 from app.services.terrain_analysis import (
+    ASPECT_DIRECTIONS,
     SLOPE_CLASSES,
     AspectStats,
     ElevationStats,
@@ -21,6 +22,8 @@ from app.services.terrain_analysis import (
     calculate_input_hash,
     calculate_slope,
     get_terrain_profile,
+    pack_bins,
+    unpack_bins,
 )
 
 
@@ -45,10 +48,39 @@ class TestCalculateInputHash:
         hash2 = calculate_input_hash("/path/to/dem.tif", (0, 0, 2, 2))
         assert hash1 != hash2
 
-    def test_hash_is_64_chars(self):
-        """Hash should be 64 characters (SHA-256)."""
+    def test_hash_is_32_bytes(self):
+        """Hash should be a raw 32-byte SHA-256 digest."""
         hash_value = calculate_input_hash("/path/to/dem.tif")
-        assert len(hash_value) == 64
+        assert isinstance(hash_value, bytes)
+        assert len(hash_value) == 32
+
+
+class TestPackBins:
+    """Tests for fixed-order storage of classification percentages."""
+
+    def test_round_trip(self):
+        """Packing then unpacking should restore the dict."""
+        classification = {"flat": 10.5, "gentle": 25.3, "moderate": 30.0}
+        packed = pack_bins(classification, SLOPE_CLASSES)
+        assert packed == [10.5, 25.3, 30.0, 0.0, 0.0]
+        assert unpack_bins(packed, SLOPE_CLASSES) == {
+            "flat": 10.5,
+            "gentle": 25.3,
+            "moderate": 30.0,
+            "steep": 0.0,
+            "very_steep": 0.0,
+        }
+
+    def test_follows_key_order(self):
+        """Array positions should follow the constant's key order."""
+        distribution = {direction: float(i) for i, direction in enumerate("NESW")}
+        packed = pack_bins(distribution, ASPECT_DIRECTIONS)
+        assert packed == [0.0, 0.0, 1.0, 0.0, 2.0, 0.0, 3.0, 0.0]
+
+    def test_empty(self):
+        """No data should be stored as NULL and read back as an empty dict."""
+        assert pack_bins({}, SLOPE_CLASSES) is None
+        assert unpack_bins(None, SLOPE_CLASSES) == {}
 
 
 class TestCalculateElevationStats: